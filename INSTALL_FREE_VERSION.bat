@@ -51,6 +51,27 @@ if errorlevel 1 (
     echo [OK] Copied time_parser.py
 )
 
+copy /Y "intervals.py" "%DEST_DIR%\intervals.py" 2>nul
+if errorlevel 1 (
+    echo [!] Could not copy intervals.py (using built-in fallback)
+) else (
+    echo [OK] Copied intervals.py
+)
+
+copy /Y "job_log.py" "%DEST_DIR%\job_log.py" 2>nul
+if errorlevel 1 (
+    echo [!] Could not copy job_log.py (job log disabled)
+) else (
+    echo [OK] Copied job_log.py
+)
+
+copy /Y "cut_report.py" "%DEST_DIR%\cut_report.py" 2>nul
+if errorlevel 1 (
+    echo [!] Could not copy cut_report.py (using built-in fallback)
+) else (
+    echo [OK] Copied cut_report.py
+)
+
 echo.
 echo ======================================================================
 echo   INSTALLATION COMPLETE!
@@ -0,0 +1,253 @@
+"""
+Resolve API Instrumentation for Clip Assassin Resolve
+Times every call made through the Resolve scripting API
+
+wrap() returns a proxy around the Resolve object; every object the API hands
+back (projects, media pools, folders, clips, timelines...) is wrapped too, so
+all calls made through it are counted and timed per method name.
+
+PhaseTimer times the phases of a cutting job (parse, append, ...), so parser
+cost can be told apart from API cost.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+# Results of these types are returned as-is instead of being wrapped
+_PLAIN_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+class ApiStats:
+    """Call counts and latencies per API method"""
+
+    def __init__(self):
+        self.durations = {}  # method name -> list of seconds
+
+    def record(self, method, seconds):
+        """Record one call"""
+        durations = self.durations.get(method)
+        if durations is None:
+            self.durations[method] = [seconds]
+        else:
+            durations.append(seconds)
+
+    def reset(self):
+        """Forget all recorded calls"""
+        self.durations = {}
+
+    @property
+    def total_calls(self):
+        """Number of calls recorded"""
+        return sum(len(durations) for durations in self.durations.values())
+
+    def report(self):
+        """
+        Summarize recorded calls per method
+
+        Returns:
+            dict: method -> {"count", "total_ms", "p50_ms", "p95_ms", "max_ms"},
+                  slowest total first
+        """
+        report = {}
+        for method, durations in self.durations.items():
+            ordered = sorted(durations)
+            report[method] = {
+                "count": len(ordered),
+                "total_ms": round(sum(ordered) * 1000, 3),
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+                "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+
+        return dict(sorted(report.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def format_report(self, limit=10):
+        """
+        Format report() as a text table
+
+        Args:
+            limit: Show at most this many methods (slowest total first)
+
+        Returns:
+            str: Table with one line per method
+        """
+        report = self.report()
+        lines = [f"{'method':<24}{'calls':>7}{'total ms':>11}{'p50':>8}{'p95':>8}{'max':>8}"]
+        for method, stats in list(report.items())[:limit]:
+            lines.append(
+                f"{method:<24}{stats['count']:>7}{stats['total_ms']:>11.1f}"
+                f"{stats['p50_ms']:>8.2f}{stats['p95_ms']:>8.2f}{stats['max_ms']:>8.2f}"
+            )
+        if len(report) > limit:
+            lines.append(f"... {len(report) - limit} more methods")
+        return "\n".join(lines)
+
+    def dump(self, path):
+        """
+        Write report() as JSON
+
+        Args:
+            path: Output file
+        """
+        data = {"total_calls": self.total_calls, "methods": self.report()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+class ApiProxy:
+    """Wraps one Resolve API object and times every method call on it"""
+
+    __slots__ = ("_target", "_stats")
+
+    def __init__(self, target, stats):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_stats", stats)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        stats = self._stats
+
+        def timed_call(*args, **kwargs):
+            if args:
+                args = _unwrap(args)
+            start = time.perf_counter()
+            try:
+                return _wrap(attribute(*args, **kwargs), stats)
+            finally:
+                stats.record(name, time.perf_counter() - start)
+
+        return timed_call
+
+    def __eq__(self, other):
+        if isinstance(other, ApiProxy):
+            other = other._target
+        return self._target == other
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __bool__(self):
+        return bool(self._target)
+
+    def __repr__(self):
+        return f"ApiProxy({self._target!r})"
+
+
+class PhaseTimer:
+    """Wall time per named phase of a job, in the order phases first ran"""
+
+    def __init__(self):
+        self.phases = {}  # phase name -> seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block and add it to phase name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def total(self):
+        """Seconds spent in all phases"""
+        return sum(self.phases.values())
+
+    def format_table(self):
+        """
+        Format the phases as a text table
+
+        Returns:
+            str: One line per phase with milliseconds and share of the total
+        """
+        total = self.total or 1.0
+        lines = [f"{'phase':<20}{'ms':>10}{'share':>8}"]
+        for name, seconds in self.phases.items():
+            lines.append(f"{name:<20}{seconds * 1000:>10.1f}{seconds / total:>8.0%}")
+        lines.append(f"{'total':<20}{self.total * 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+def wrap(resolve, stats):
+    """
+    Instrument a Resolve object and everything obtained through it
+
+    Args:
+        resolve: Object returned by DaVinciResolveScript.scriptapp("Resolve")
+        stats: ApiStats receiving the timings
+
+    Returns:
+        ApiProxy
+    """
+    return _wrap(resolve, stats)
+
+
+def _wrap(value, stats):
+    """Wrap API objects in a result (lists and dict values included)"""
+    if isinstance(value, _PLAIN_TYPES + (ApiProxy,)):
+        return value
+    if isinstance(value, list):
+        return [_wrap(item, stats) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_wrap(item, stats) for item in value)
+    if isinstance(value, dict):
+        if all(isinstance(item, _PLAIN_TYPES) for item in value.values()):
+            return value
+        return {key: _wrap(item, stats) for key, item in value.items()}
+    return ApiProxy(value, stats)
+
+
+def _unwrap(value):
+    """Replace proxies in call arguments by the objects Resolve expects"""
+    if isinstance(value, ApiProxy):
+        return value._target
+    if isinstance(value, (list, tuple)):
+        items = [_unwrap(item) for item in value]
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _percentile(ordered, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(int(-(-percent * len(ordered) // 100)), 1)
+    return ordered[rank - 1]
+
+
+# Testing
+if __name__ == "__main__":
+    class _Clip:
+        def GetName(self):
+            time.sleep(0.001)
+            return "clip.mov"
+
+    class _Pool:
+        def GetClips(self):
+            return [_Clip(), _Clip()]
+
+        def Append(self, clips):
+            return all(isinstance(clip, _Clip) for clip in clips)
+
+    stats = ApiStats()
+    pool = wrap(_Pool(), stats)
+
+    print("Testing API instrumentation:")
+    print("-" * 50)
+    clips = pool.GetClips()
+    names = [clip.GetName() for clip in clips * 10]
+    print(f"Proxies unwrapped for the API: {pool.Append(clips)}")
+    print(f"Calls recorded: {stats.total_calls}")
+    print(stats.format_report())
+
+    timer = PhaseTimer()
+    with timer.phase("parse"):
+        sum(range(100000))
+    with timer.phase("append"):
+        pool.Append(clips)
+    print()
+    print(timer.format_table())
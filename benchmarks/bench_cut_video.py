@@ -0,0 +1,159 @@
+"""
+End-to-end benchmark for cut_video() against the in-memory fake Resolve
+Runs ResolveConnection.cut_video and the free version's cut_video for a
+growing number of segments and reports wall time and API calls
+
+The free version needs PySide6 or PySide2 to import; without them it is
+reported as skipped.
+
+Usage:
+    python benchmarks/bench_cut_video.py [--latency SECONDS] [--sizes 10,100,1000,10000]
+                                         [--max-append N] [--import-format edl|fcpxml]
+"""
+
+import argparse
+import builtins
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+import types
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+# Keep benchmark runs out of the real job log
+os.environ.setdefault("CLIP_ASSASSIN_JOB_LOG", "0")
+
+import fake_resolve
+from resolve_core import ResolveConnection
+
+CLIP_FPS = 29.97
+
+
+def generate_timecodes(count):
+    """count non-overlapping 2-second ranges, 1 second apart"""
+    lines = []
+    for i in range(count):
+        start = i * 3
+        end = start + 2
+        lines.append(f"{start // 3600}:{start // 60 % 60:02d}:{start % 60:02d}-"
+                     f"{end // 3600}:{end // 60 % 60:02d}:{end % 60:02d}")
+    return "\n".join(lines)
+
+
+def make_resolve(api, count):
+    """Fake Resolve with one clip long enough for count segments"""
+    frames = int((count * 3 + 60) * CLIP_FPS)
+    timeline_names = [f"Assassinated - Interview.mov ({i})" for i in range(2, 50)]
+    timeline_names.append("Assassinated - Interview.mov")
+    return fake_resolve.build_resolve(
+        api,
+        clips=[("Interview.mov", CLIP_FPS, frames)],
+        bins={f"Bin {i}": [(f"B{i:03d}.mov", CLIP_FPS, 1000)] for i in range(20)},
+        timeline_names=timeline_names,
+    )
+
+
+def run_core(api, count, timecodes, import_format=None):
+    """ResolveConnection.cut_video on a fresh connection"""
+    fake_resolve.install(make_resolve(api, count))
+    connection = ResolveConnection()
+    success, message = connection.connect()
+    if not success:
+        raise RuntimeError(message)
+
+    api.reset()
+    start = time.perf_counter()
+    success, message = connection.cut_video(timecodes, import_format=import_format)
+    return time.perf_counter() - start, success, message
+
+
+def load_free_version():
+    """Import clip_assassin_free with the fake 'app'; None if Qt is missing"""
+    builtins.app = fake_resolve.FakeFusion(fake_resolve.build_resolve())
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "clip_assassin_free", os.path.join(REPO_DIR, "clip_assassin_free.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        # The script prints its own "PySide not found" error before exiting
+        with contextlib.redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(module)
+        return module
+    except SystemExit:
+        return None
+    finally:
+        del builtins.app
+
+
+def run_free(module, api, count, timecodes):
+    """The free version's cut_video, without building its Qt dialog"""
+    resolve = make_resolve(api, count)
+    project = resolve.GetProjectManager().GetCurrentProject()
+
+    # cut_video only needs these attributes and helpers of the dialog
+    dialog = types.SimpleNamespace(
+        project=project,
+        media_pool=project.GetMediaPool(),
+        timeline_names=None,
+    )
+    for name in ("get_first_video_clip", "unique_timeline_name", "_cut_video"):
+        setattr(dialog, name, types.MethodType(getattr(module.ClipAssassinFree, name), dialog))
+
+    api.reset()
+    start = time.perf_counter()
+    success, message = module.ClipAssassinFree.cut_video(dialog, timecodes)
+    return time.perf_counter() - start, success, message
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds of simulated IPC latency per API call")
+    parser.add_argument("--sizes", default="10,100,1000,10000",
+                        help="comma-separated segment counts")
+    parser.add_argument("--max-append", type=int, default=0,
+                        help="make AppendToTimeline fail for more than N clips per call")
+    parser.add_argument("--import-format", choices=("edl", "fcpxml"),
+                        help="also time building the timeline with one ImportTimelineFromFile call")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    free_module = load_free_version()
+    implementations = [("resolve_core", run_core)]
+    if args.import_format:
+        implementations.append((f"core+{args.import_format}",
+                                lambda api, count, text: run_core(api, count, text, args.import_format)))
+    if free_module:
+        implementations.append(("free", lambda api, count, text: run_free(free_module, api, count, text)))
+    else:
+        print("[SKIP] free version: PySide6/PySide2 not installed")
+
+    failures = {}
+    if args.max_append:
+        failures["AppendToTimeline"] = lambda clips: len(clips) > args.max_append
+
+    print(f"Simulated latency: {args.latency * 1000:.2f} ms/call")
+    if args.max_append:
+        print(f"AppendToTimeline rejects more than {args.max_append} clips per call")
+    print()
+    print(f"{'version':<14}{'segments':>9}{'wall ms':>11}{'API calls':>11}"
+          f"{'Append':>8}{'Property':>10}  result")
+
+    for count in sizes:
+        timecodes = generate_timecodes(count)
+        for label, run in implementations:
+            api = fake_resolve.FakeAPI(latency=args.latency, failures=failures)
+            elapsed, success, message = run(api, count, timecodes)
+            result = "ok" if success else "FAILED: " + message.splitlines()[0]
+            print(f"{label:<14}{count:>9,}{elapsed * 1000:>11.1f}{api.total_calls:>11,}"
+                  f"{api.calls['AppendToTimeline']:>8,}{api.calls['GetClipProperty']:>10,}  {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+Throughput benchmark for time_parser.parse_time and parse_time_range
+Compares the single-pass scanner against the original split-based
+implementation and checks that both return the same results
+
+The original counted HH:MM:SS;FF drop-frame timecode like non-drop-frame;
+at 29.97/59.94 those inputs are instead checked against an independent
+label-by-label drop-frame count (check_drop_frame()).
+
+Usage:
+    python benchmarks/bench_time_parser.py [lines]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from time_parser import (
+    parse_time, parse_time_range, parse_time_frames, format_timecode,
+    format_timecode_array, timecode_frames_array, _drop_frame_terms, np
+)
+
+
+# The original parse_time() and parse_time_range(), copied unchanged apart
+# from their names, as the baseline
+
+def legacy_parse_time(time_string, framerate=30.0):
+    """
+    Parse a single time string like "1m57", "1:57", "0:02:25", "1h30m45", "00:01:30:15" or "00:01:30;15"
+
+    Supported formats:
+    - 1m57s or 1m57 (minutes and seconds with 'm')
+    - 1:57 (MM:SS)
+    - 0:02:25 (HH:MM:SS)
+    - 00:01:30:15 (HH:MM:SS:FF non-drop-frame timecode)
+    - 00:01:30;15 (HH:MM:SS;FF drop-frame timecode)
+    - 1h30m45s or 1h30m (hours, minutes, seconds with 'h', 'm', 's')
+    - 90 (just seconds as number)
+
+    Args:
+        time_string: Time string to parse
+        framerate: Frame rate for timecode conversion (default: 30.0)
+
+    Returns:
+        float: Time in seconds, or None if invalid
+    """
+    if not time_string:
+        return None
+
+    time_string = time_string.strip().lower()
+
+    hours = 0
+    minutes = 0
+    seconds = 0
+    frames = 0
+    is_drop_frame = False
+    is_timecode_format = False
+
+    # Check for drop-frame timecode (semicolon before frames)
+    if ';' in time_string:
+        is_drop_frame = True
+        is_timecode_format = True
+        # Split by semicolon to get frames
+        semi_parts = time_string.split(';')
+        if len(semi_parts) == 2:
+            try:
+                frames = int(semi_parts[1])
+                time_string = semi_parts[0]  # Continue parsing the time part
+            except ValueError:
+                return None
+
+    # Format: 1h30m45s or 1h30m or combinations with "h", "m", "s"
+    if 'h' in time_string:
+        h_parts = time_string.split('h')
+        try:
+            hours = int(h_parts[0])
+        except ValueError:
+            return None
+
+        if len(h_parts) > 1 and h_parts[1]:
+            rest = h_parts[1]
+            if 'm' in rest:
+                m_parts = rest.split('m')
+                try:
+                    minutes = int(m_parts[0])
+                except ValueError:
+                    return None
+                if len(m_parts) > 1 and m_parts[1]:
+                    try:
+                        seconds = int(m_parts[1].replace('s', ''))
+                    except ValueError:
+                        return None
+            else:
+                try:
+                    seconds = int(rest.replace('s', ''))
+                except ValueError:
+                    return None
+
+    # Format: 1m57s or 1m57
+    elif 'm' in time_string:
+        m_parts = time_string.split('m')
+        try:
+            minutes = int(m_parts[0])
+        except ValueError:
+            return None
+
+        if len(m_parts) > 1 and m_parts[1]:
+            try:
+                seconds = int(m_parts[1].replace('s', ''))
+            except ValueError:
+                return None
+
+    # Format: 0:02:25 or 1:57:30 or 1:57 or 00:01:30:15 (non-drop-frame with frames)
+    elif ':' in time_string:
+        colon_parts = time_string.split(':')
+
+        try:
+            if len(colon_parts) == 2:
+                # MM:SS
+                minutes = int(colon_parts[0])
+                seconds = int(colon_parts[1])
+            elif len(colon_parts) == 3:
+                # HH:MM:SS
+                hours = int(colon_parts[0])
+                minutes = int(colon_parts[1])
+                seconds = int(colon_parts[2])
+            elif len(colon_parts) == 4:
+                # HH:MM:SS:FF (non-drop-frame timecode)
+                is_timecode_format = True
+                hours = int(colon_parts[0])
+                minutes = int(colon_parts[1])
+                seconds = int(colon_parts[2])
+                frames = int(colon_parts[3])
+            elif len(colon_parts) == 1:
+                # Just a number
+                seconds = int(colon_parts[0])
+        except ValueError:
+            return None
+
+    # Just a number = seconds
+    else:
+        try:
+            seconds = int(time_string.replace('s', ''))
+        except ValueError:
+            return None
+
+    # Validate non-negative
+    if hours < 0 or minutes < 0 or seconds < 0 or frames < 0:
+        return None
+
+    # TIMECODE FORMAT (HH:MM:SS:FF or HH:MM:SS;FF): Convert everything to frames first, then to seconds
+    if is_timecode_format and framerate > 0:
+        # Determine timebase (the "nominal" framerate used in timecode)
+        # For 59.94fps → timebase is 60
+        # For 29.97fps → timebase is 30
+        # For 23.976fps → timebase is 24
+        timebase = round(framerate)
+
+        # Calculate total frame number using timebase
+        total_frames = (hours * 3600 * timebase) + \
+                      (minutes * 60 * timebase) + \
+                      (seconds * timebase) + \
+                      frames
+
+        # Convert frames to seconds using ACTUAL framerate
+        # This ensures frame-accurate timing even with drop-frame rates
+        return total_frames / framerate
+    else:
+        # Standard time format: simple seconds calculation
+        return hours * 3600 + minutes * 60 + seconds
+
+
+def legacy_parse_time_range(range_string, framerate=30.0):
+    """
+    Parse a time range string like "1m57-2m08" or "1:57-2:08"
+
+    Args:
+        range_string: String in format "start-end"
+        framerate: Frame rate for timecode conversion (default: 30.0)
+
+    Returns:
+        tuple: (start_seconds, end_seconds) or None if invalid
+    """
+    # Replace different dash types with standard hyphen
+    range_string = range_string.replace('\u2013', '-')  # en dash
+    range_string = range_string.replace('\u2014', '-')  # em dash
+
+    # Remove spaces
+    range_string = range_string.strip().replace(' ', '')
+
+    # Split by hyphen
+    parts = range_string.split('-')
+
+    if len(parts) < 2:
+        return None
+
+    # Parse start and end times
+    start = legacy_parse_time(parts[0], framerate)
+    end = legacy_parse_time(parts[-1], framerate)
+
+    if start is None or end is None:
+        return None
+
+    if end <= start:
+        return None
+
+    return (start, end)
+
+
+# Inputs outside the documented grammar that must still behave as before
+EDGE_CASES = [
+    "", " ", "s", "h", "m", ":", ";", ";5", "5;", "1;2;3", "1:2:3:4;5",
+    "1:2:3:4:5", "1m3s0", "5ss", "s5", " 1 m 30 ", "1h2h3", "1m2m3",
+    "1H30M", "1M57S", "-5", "+5", "1_000", "1m-3", "1:-3", "1h:30",
+    "1:57s", "1hs", "h5", "1:2;3", "90;15", "1h;3", "1m30;15",
+    "00:01:30;15", "00:01:30:15", "1h30m45s", "\t1:57\n", "１２",
+    "1ſ", "1.5", "1e3", "0x10", "1:2:3:4:5;6", "1;", "1m;", "abc",
+    "-0", "+1:30", "1 :30", "4s5", "1m4s5", "100h", "1h100m", "5400s",
+    "100:00:00;05", "1:2:3:4;-5", "1:2:3:4;x", "00:00:60;00", "123:4;5",
+]
+
+RANGE_EDGE_CASES = [
+    "1m57-2m08", "1m57 - 2m08", "1m57\u20132m08", "1m57 \u2014 2m08", "1 m 57-2m08",
+    "1-2-3", "-5-10", "5-", "-", "10-5", "5-5", "1m57\t-\t2m08", "\t1:00-2:00\n",
+    "00:01:30;15-00:02:00;20", "1m30-00:02:00:00", "1m57--2m08", "1m57-2m08-",
+]
+
+
+def generate_corpus(count, seed=1):
+    """Build a realistic mix of time strings like the ones upstream tools emit"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        h, m, s, f = rng.randrange(10), rng.randrange(60), rng.randrange(60), rng.randrange(60)
+        kind = rng.randrange(7)
+        if kind == 0:
+            corpus.append(f"{m}m{s:02d}")
+        elif kind == 1:
+            corpus.append(f"{m}:{s:02d}")
+        elif kind == 2:
+            corpus.append(f"{h}:{m:02d}:{s:02d}")
+        elif kind == 3:
+            corpus.append(f"{h:02d}:{m:02d}:{s:02d}:{f:02d}")
+        elif kind == 4:
+            corpus.append(f"{h:02d}:{m:02d}:{s:02d};{f:02d}")
+        elif kind == 5:
+            corpus.append(f"{h}h{m}m{s}s")
+        else:
+            corpus.append(str(h * 3600 + m * 60 + s))
+    return corpus
+
+
+def generate_ranges(corpus):
+    """Pair consecutive time strings into "start-end" lines"""
+    return [f"{a}-{b}" for a, b in zip(corpus[::2], corpus[1::2])]
+
+
+def check_equivalence(corpus, framerates=(0, 23.976, 24, 25, 29.97, 30, 59.94, 60)):
+    """Return a list of inputs where the two implementations disagree"""
+    cases = [
+        (parse_time, legacy_parse_time, list(corpus) + EDGE_CASES),
+        (parse_time_range, legacy_parse_time_range, generate_ranges(corpus) + RANGE_EDGE_CASES),
+    ]
+    mismatches = []
+    for fps in framerates:
+        drop_frame_rate = fps > 0 and _drop_frame_terms(fps) is not None
+        for new_func, old_func, inputs in cases:
+            for text in inputs:
+                if drop_frame_rate and ';' in text:
+                    continue  # Drop-frame: see check_drop_frame()
+                new = new_func(text, fps)
+                old = old_func(text, fps)
+                if new != old or repr(new) != repr(old):
+                    mismatches.append((text, fps, old, new))
+    return mismatches
+
+
+def reference_drop_frame_labels(timebase, count):
+    """Drop-frame labels of frames 0..count-1, counted one frame at a time"""
+    dropped = timebase // 15
+    hours = minutes = seconds = frames = 0
+    for _ in range(count):
+        yield f"{hours:02d}:{minutes:02d}:{seconds:02d};{frames:02d}"
+        frames += 1
+        if frames == timebase:
+            frames = 0
+            seconds += 1
+            if seconds == 60:
+                seconds = 0
+                minutes += 1
+                if minutes == 60:
+                    minutes = 0
+                    hours += 1
+                if minutes % 10:
+                    frames = dropped
+
+
+def check_drop_frame(count, framerates=(29.97, 59.94)):
+    """Return (text, fps, expected, got) where drop-frame conversion disagrees with the reference"""
+    mismatches = []
+    for fps in framerates:
+        labels = list(reference_drop_frame_labels(round(fps), count))
+        for frame, label in enumerate(labels):
+            if parse_time_frames(label, fps) != frame:
+                mismatches.append((label, fps, frame, parse_time_frames(label, fps)))
+            if format_timecode(frame, fps, drop_frame=True) != label:
+                mismatches.append((frame, fps, label, format_timecode(frame, fps, drop_frame=True)))
+            if parse_time(label, fps) != frame / fps:
+                mismatches.append((label, fps, frame / fps, parse_time(label, fps)))
+
+        if np is not None:
+            frames, error_mask = timecode_frames_array(labels, fps)
+            if error_mask.any() or frames.tolist() != list(range(count)):
+                mismatches.append(("timecode_frames_array", fps, None, None))
+            if format_timecode_array(range(count), fps, drop_frame=True) != labels:
+                mismatches.append(("format_timecode_array", fps, None, None))
+    return mismatches
+
+
+def best_times(funcs, inputs, rounds=10):
+    """Best wall time per function, with runs interleaved to even out noise"""
+    best = [float('inf')] * len(funcs)
+    for _ in range(rounds):
+        for i, func in enumerate(funcs):
+            elapsed = timeit.timeit(lambda: [func(text, 29.97) for text in inputs], number=1)
+            best[i] = min(best[i], elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    corpus = generate_corpus(count)
+
+    ranges = generate_ranges(corpus)
+
+    mismatches = check_equivalence(corpus[:5000])
+    if mismatches:
+        print(f"[FAIL] {len(mismatches)} mismatches, first: {mismatches[0]}")
+        sys.exit(1)
+    print(f"[OK] Results identical on {min(count, 5000)} generated inputs and "
+          f"{len(EDGE_CASES) + len(RANGE_EDGE_CASES)} edge cases")
+
+    # Two hours of 29.97/59.94 drop-frame labels, both directions
+    mismatches = check_drop_frame(216000)
+    if mismatches:
+        print(f"[FAIL] {len(mismatches)} drop-frame mismatches, first: {mismatches[0]}")
+        sys.exit(1)
+    print("[OK] Drop-frame timecode matches a frame-by-frame count over 2 hours (29.97, 59.94)")
+
+    benchmarks = [
+        ("parse_time", legacy_parse_time, parse_time, corpus),
+        ("parse_time_range", legacy_parse_time_range, parse_time_range, ranges),
+    ]
+    for label, old_func, new_func, inputs in benchmarks:
+        old, new = best_times((old_func, new_func), inputs)
+        print(f"\n{label} ({len(inputs):,} inputs):")
+        print(f"  legacy:  {old * 1000:8.1f} ms  ({len(inputs) / old:,.0f}/sec)")
+        print(f"  scanner: {new * 1000:8.1f} ms  ({len(inputs) / new:,.0f}/sec)  x{old / new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
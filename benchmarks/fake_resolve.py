@@ -0,0 +1,461 @@
+"""
+In-memory stand-in for the DaVinciResolveScript module
+Lets ResolveConnection and the free version run without DaVinci Resolve
+
+Every API method goes through FakeAPI, which counts calls per method, can
+sleep a fixed latency per call (to mimic the IPC round-trip) and can make
+chosen calls fail the way Resolve does (returning None/False).
+
+Usage:
+    import fake_resolve
+    api = fake_resolve.FakeAPI(latency=0.001, failures={"AppendToTimeline": {2}})
+    resolve = fake_resolve.build_resolve(api, clips=[("Interview.mov", 29.97, 108000)])
+    fake_resolve.install(resolve)       # "import DaVinciResolveScript" now returns this module
+"""
+
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from time_parser import rational_framerate, parse_time_frames
+
+
+class FakeAPI:
+    """Call counter, latency and failure injection shared by all fake objects"""
+
+    def __init__(self, latency=0.0, failures=None):
+        """
+        Args:
+            latency: Seconds to sleep on every API call
+            failures: Dict of method name -> set of 1-based call numbers that
+                      fail, or a callable(*args) returning True to fail the call
+        """
+        self.latency = latency
+        self.failures = failures or {}
+        self.calls = Counter()
+
+    def call(self, method, args):
+        """
+        Record one call to method
+
+        Returns:
+            bool: True if the call should fail
+        """
+        self.calls[method] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        rule = self.failures.get(method)
+        if rule is None:
+            return False
+        if callable(rule):
+            return bool(rule(*args))
+        return self.calls[method] in rule
+
+    @property
+    def total_calls(self):
+        """Total number of API calls so far"""
+        return sum(self.calls.values())
+
+    def reset(self):
+        """Forget all recorded calls"""
+        self.calls.clear()
+
+
+def _api_method(failure_value=None):
+    """Route a fake API method through FakeAPI.call()"""
+    def decorator(func):
+        def wrapper(self, *args):
+            if self._api.call(func.__name__, args):
+                return failure_value
+            return func(self, *args)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+    return decorator
+
+
+class FakeMediaPoolItem:
+    def __init__(self, api, unique_id, name, fps=29.97, frames=108000, codec="H.264",
+                 resolution="1920x1080", file_path=None):
+        self._api = api
+        self._unique_id = unique_id
+        self._properties = {
+            "Clip Name": name,
+            "FPS": f"{fps:g}",
+            "Frames": str(frames),
+            "Video Codec": codec,
+            "Resolution": resolution,
+            "File Path": file_path or f"/media/{name}",
+            "Start TC": "01:00:00:00",
+        }
+
+    @_api_method()
+    def GetName(self):
+        return self._properties["Clip Name"]
+
+    @_api_method()
+    def GetUniqueId(self):
+        return self._unique_id
+
+    @_api_method()
+    def GetMediaId(self):
+        return self._unique_id
+
+    @_api_method()
+    def GetClipProperty(self, key=None):
+        if key is None:
+            return dict(self._properties)
+        return self._properties.get(key, "")
+
+
+class FakeFolder:
+    def __init__(self, api, name, clips=None, subfolders=None):
+        self._api = api
+        self._name = name
+        self.clips = list(clips or [])
+        self.subfolders = list(subfolders or [])
+
+    @_api_method()
+    def GetName(self):
+        return self._name
+
+    @_api_method(failure_value=[])
+    def GetClipList(self):
+        return list(self.clips)
+
+    @_api_method(failure_value=[])
+    def GetSubFolderList(self):
+        return list(self.subfolders)
+
+
+class FakeTimelineItem:
+    def __init__(self, api, clip, start, end, record_start, name=None):
+        self._api = api
+        self.clip = clip  # None for an offline item
+        self._name = name
+        self.source_start = start
+        self.source_end = end
+        self.record_start = record_start
+
+    @_api_method()
+    def GetName(self):
+        return self._name if self.clip is None else self.clip._properties["Clip Name"]
+
+    @_api_method()
+    def GetStart(self):
+        return self.record_start
+
+    @_api_method()
+    def GetEnd(self):
+        return self.record_start + self.source_end - self.source_start
+
+    @_api_method()
+    def GetDuration(self):
+        return self.source_end - self.source_start
+
+    @_api_method()
+    def GetLeftOffset(self):
+        return self.source_start
+
+    @_api_method()
+    def GetMediaPoolItem(self):
+        return self.clip
+
+
+class FakeTimeline:
+    def __init__(self, api, name, start_frame=0):
+        self._api = api
+        self._name = name
+        self.start_frame = start_frame
+        self.items = []
+
+    @property
+    def end_frame(self):
+        """Record frame after the last item"""
+        if not self.items:
+            return self.start_frame
+        last = self.items[-1]
+        return last.record_start + last.source_end - last.source_start
+
+    @_api_method()
+    def GetName(self):
+        return self._name
+
+    @_api_method(failure_value=False)
+    def SetName(self, name):
+        self._name = name
+        return True
+
+    @_api_method()
+    def GetStartFrame(self):
+        return self.start_frame
+
+    @_api_method()
+    def GetEndFrame(self):
+        return self.end_frame
+
+    @_api_method()
+    def GetTrackCount(self, track_type):
+        return 1 if track_type in ("video", "audio") else 0
+
+    @_api_method(failure_value=[])
+    def GetItemListInTrack(self, track_type, index):
+        return list(self.items) if index == 1 and track_type in ("video", "audio") else []
+
+    @_api_method(failure_value=False)
+    def DeleteClips(self, items, ripple=False):
+        remove = {id(item) for item in items}
+        kept = [item for item in self.items if id(item) not in remove]
+        if ripple:
+            position = self.start_frame
+            for item in kept:
+                item.record_start = position
+                position += item.source_end - item.source_start
+        self.items = kept
+        return True
+
+
+class FakeMediaPool:
+    def __init__(self, api, project, root_folder):
+        self._api = api
+        self._project = project
+        self._root_folder = root_folder
+
+    @_api_method()
+    def GetRootFolder(self):
+        return self._root_folder
+
+    @_api_method()
+    def GetCurrentFolder(self):
+        return self._root_folder
+
+    @_api_method()
+    def CreateEmptyTimeline(self, name):
+        # Like Resolve: timeline names are unique within a project
+        if any(timeline._name == name for timeline in self._project.timelines):
+            return None
+        timeline = FakeTimeline(self._api, name)
+        self._project.timelines.append(timeline)
+        self._project.current_timeline = timeline
+        return timeline
+
+    @_api_method(failure_value=[])
+    def AppendToTimeline(self, clips):
+        timeline = self._project.current_timeline
+        if timeline is None:
+            return []
+
+        appended = []
+        for clip in clips:
+            if isinstance(clip, dict):
+                item = clip["mediaPoolItem"]
+                start = clip.get("startFrame", 0)
+                end = clip.get("endFrame", int(item._properties["Frames"]))
+            else:
+                item = clip
+                start, end = 0, int(item._properties["Frames"])
+
+            timeline_item = FakeTimelineItem(self._api, item, start, end, timeline.end_frame)
+            timeline.items.append(timeline_item)
+            appended.append(timeline_item)
+
+        return appended
+
+    @_api_method()
+    def ImportTimelineFromFile(self, path, options=None):
+        """Build a timeline from an EDL or FCPXML, linking events to pool clips by name"""
+        options = options or {}
+        name = options.get("timelineName") or os.path.splitext(os.path.basename(path))[0]
+        if any(timeline._name == name for timeline in self._project.timelines):
+            return None
+
+        clips = {}
+        folders = [self._root_folder]
+        while folders:
+            folder = folders.pop()
+            for clip in folder.clips:
+                clips.setdefault(clip._properties["Clip Name"], clip)
+            folders.extend(folder.subfolders)
+
+        events = _read_edl(path) if path.lower().endswith(".edl") else _read_fcpxml(path)
+
+        timeline = FakeTimeline(self._api, name)
+        for clip_name, source_in, source_out in events:
+            clip = clips.get(clip_name)
+            if clip is None:
+                # Unlinked event: Resolve keeps it as an offline item without a media pool clip
+                fps = rational_framerate(30)
+                origin = 0
+            else:
+                fps = rational_framerate(clip._properties["FPS"])
+                origin = parse_time_frames(clip._properties["Start TC"], fps) or 0
+            start = source_in(fps) - origin
+            end = source_out(fps) - origin
+            timeline.items.append(FakeTimelineItem(self._api, clip, start, end, timeline.end_frame, clip_name))
+
+        self._project.timelines.append(timeline)
+        self._project.current_timeline = timeline
+        return timeline
+
+    @_api_method(failure_value=False)
+    def DeleteTimelines(self, timelines):
+        remove = {id(timeline) for timeline in timelines}
+        self._project.timelines = [timeline for timeline in self._project.timelines if id(timeline) not in remove]
+        if id(self._project.current_timeline) in remove:
+            self._project.current_timeline = self._project.timelines[-1] if self._project.timelines else None
+        return True
+
+
+def _read_edl(path):
+    """(clip name, source in, source out) per EDL event; in/out map fps -> frame"""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) == 8 and fields[0].isdigit():
+                timecodes = fields[4], fields[5]
+                events.append(["", *(lambda fps, tc=tc: parse_time_frames(tc, fps) for tc in timecodes)])
+            elif line.startswith("* FROM CLIP NAME:") and events:
+                events[-1][0] = line.split(":", 1)[1].strip()
+    return events
+
+
+def _read_fcpxml(path):
+    """(clip name, source in, source out) per FCPXML asset-clip"""
+    events = []
+    for _, element in ET.iterparse(path):
+        if element.tag == "asset-clip":
+            start = Fraction(element.get("start")[:-1])
+            end = start + Fraction(element.get("duration")[:-1])
+            events.append((element.get("name"),
+                           lambda fps, time=start: int(time * fps),
+                           lambda fps, time=end: int(time * fps)))
+            element.clear()
+    return events
+
+
+class FakeProject:
+    def __init__(self, api, name, root_folder, timeline_names=()):
+        self._api = api
+        self._name = name
+        self.timelines = [FakeTimeline(api, timeline_name) for timeline_name in timeline_names]
+        self.current_timeline = self.timelines[-1] if self.timelines else None
+        self.media_pool = FakeMediaPool(api, self, root_folder)
+
+    @_api_method()
+    def GetName(self):
+        return self._name
+
+    @_api_method()
+    def GetUniqueId(self):
+        return f"project-{self._name}"
+
+    @_api_method()
+    def GetMediaPool(self):
+        return self.media_pool
+
+    @_api_method()
+    def GetTimelineCount(self):
+        return len(self.timelines)
+
+    @_api_method()
+    def GetTimelineByIndex(self, index):
+        if 1 <= index <= len(self.timelines):
+            return self.timelines[index - 1]
+        return None
+
+    @_api_method()
+    def GetCurrentTimeline(self):
+        return self.current_timeline
+
+    @_api_method(failure_value=False)
+    def SetCurrentTimeline(self, timeline):
+        self.current_timeline = timeline
+        return True
+
+
+class FakeProjectManager:
+    def __init__(self, api, project):
+        self._api = api
+        self.project = project
+
+    @_api_method()
+    def GetCurrentProject(self):
+        return self.project
+
+
+class FakeResolve:
+    def __init__(self, api, project):
+        self._api = api
+        self.project_manager = FakeProjectManager(api, project)
+
+    @_api_method()
+    def GetProjectManager(self):
+        return self.project_manager
+
+    @_api_method()
+    def GetVersionString(self):
+        return "19.0.0 (fake)"
+
+
+def build_resolve(api=None, clips=(("Interview.mov", 29.97, 108000),), bins=None,
+                  timeline_names=(), project_name="Benchmark"):
+    """
+    Build a fake Resolve with one open project
+
+    Args:
+        api: FakeAPI to use (default: no latency, no failures)
+        clips: (name, fps, frames) tuples placed in the root bin
+        bins: Optional dict of bin name -> list of (name, fps, frames) for subbins
+        timeline_names: Names of timelines that already exist in the project
+        project_name: Name of the open project
+
+    Returns:
+        FakeResolve
+    """
+    api = api or FakeAPI()
+    next_id = iter(range(1, 1 << 30))
+
+    def make_clips(specs):
+        return [FakeMediaPoolItem(api, f"clip-{next(next_id)}", name, fps, frames)
+                for name, fps, frames in specs]
+
+    subfolders = [FakeFolder(api, name, make_clips(specs)) for name, specs in (bins or {}).items()]
+    root_folder = FakeFolder(api, "Master", make_clips(clips), subfolders)
+    project = FakeProject(api, project_name, root_folder, timeline_names)
+    return FakeResolve(api, project)
+
+
+class FakeFusion:
+    """The 'app' object Resolve injects into scripts run from its Scripts menu"""
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+
+    def GetResolve(self):
+        return self.resolve
+
+
+_current = None
+
+
+def scriptapp(name):
+    """DaVinciResolveScript.scriptapp(): returns the installed fake Resolve"""
+    return _current if name == "Resolve" else None
+
+
+def install(resolve):
+    """
+    Make "import DaVinciResolveScript" return this module, serving resolve
+
+    Args:
+        resolve: FakeResolve returned by build_resolve()
+    """
+    global _current
+    _current = resolve
+    sys.modules["DaVinciResolveScript"] = sys.modules[__name__]
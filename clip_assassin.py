@@ -4,11 +4,17 @@ GUI Application for cutting video clips based on time ranges
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 import sys
 import os
 from resolve_core import ResolveConnection
+from job_queue import JobCancelled, JobQueue
+from range_import import RangeFile
+from time_parser import format_seconds
+
+# Progress updates from the worker are coalesced into at most one redraw per interval
+PROGRESS_INTERVAL_MS = 150
 
 
 def resource_path(relative_path):
@@ -57,9 +63,19 @@ class ClipAssassinGUI:
         # Configure root background
         self.root.configure(bg=self.bg_color)
 
-        # Resolve connection
+        # Resolve connection, only ever used from the job queue's worker thread
         self.resolve_conn = ResolveConnection()
         self.connected = False
+        self.jobs = JobQueue(on_change=lambda: self.root.after(0, self.update_queue_display))
+
+        # Cancel events of queued and running cuts (job id -> threading.Event),
+        # and the latest progress report waiting to be drawn
+        self.cut_cancels = {}
+        self.pending_progress = None
+        self.progress_scheduled = False
+
+        # Range file (EDL, CSV, SRT/VTT, chapters) to cut from instead of the text box
+        self.range_file = None
 
         # Build UI
         self.create_widgets()
@@ -157,6 +173,43 @@ class ClipAssassinGUI:
         )
         format_label.pack(fill=tk.X, pady=(0, 5))
 
+        # Range files are read straight into frame ranges, not into the text box
+        file_frame = tk.Frame(section2, bg=self.section_bg)
+        file_frame.pack(fill=tk.X, pady=(0, 5))
+
+        import_btn = tk.Button(
+            file_frame,
+            text="📂 Import ranges (EDL, CSV, SRT/VTT, chapters)",
+            command=self.import_range_file,
+            bg="#444444",
+            fg="white",
+            font=("Arial", 8),
+            relief=tk.FLAT,
+            cursor="hand2"
+        )
+        import_btn.pack(side=tk.LEFT)
+
+        self.range_file_label = tk.Label(
+            file_frame,
+            text="",
+            font=("Arial", 8),
+            fg="#999999",
+            bg=self.section_bg,
+            anchor="w"
+        )
+        self.range_file_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+
+        self.clear_file_btn = tk.Button(
+            file_frame,
+            text="✖",
+            command=self.clear_range_file,
+            bg="#444444",
+            fg="white",
+            font=("Arial", 8),
+            relief=tk.FLAT,
+            cursor="hand2"
+        )
+
         self.timecodes_text = scrolledtext.ScrolledText(
             section2,
             height=10,
@@ -191,6 +244,38 @@ class ClipAssassinGUI:
         )
         section3.pack(pady=5, padx=20, fill=tk.X)
 
+        source_frame = tk.Frame(section3, bg=self.section_bg)
+        source_frame.pack(fill=tk.X, pady=(0, 5))
+
+        source_label = tk.Label(
+            source_frame,
+            text="Source clip:",
+            font=("Arial", 9),
+            fg=self.fg_color,
+            bg=self.section_bg
+        )
+        source_label.pack(side=tk.LEFT)
+
+        self.source_clip_entry = tk.Entry(
+            source_frame,
+            font=("Consolas", 10),
+            bg="#1e1e1e",
+            fg=self.fg_color,
+            insertbackground=self.fg_color,
+            relief=tk.FLAT
+        )
+        self.source_clip_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+
+        source_help = tk.Label(
+            section3,
+            text="Clip name, file path or glob (e.g. A00*.mov) - leave empty for the first video clip",
+            font=("Arial", 7),
+            fg="#999999",
+            bg=self.section_bg,
+            anchor="w"
+        )
+        source_help.pack(fill=tk.X, pady=(0, 5))
+
         self.execute_btn = tk.Button(
             section3,
             text="🗡️ RUN THE BLADES",
@@ -227,6 +312,124 @@ class ClipAssassinGUI:
         )
         reverse_help.pack(fill=tk.X, pady=(0, 5))
 
+        self.profile_var = tk.BooleanVar(value=self.resolve_conn.profile_mode is not None)
+        profile_check = tk.Checkbutton(
+            section3,
+            text="⏱ Profile runs (phase timings in the summary)",
+            variable=self.profile_var,
+            command=self.toggle_profiling,
+            font=("Arial", 8),
+            fg="#999999",
+            bg=self.section_bg,
+            activebackground=self.section_bg,
+            activeforeground=self.fg_color,
+            selectcolor="#1e1e1e",
+            anchor="w"
+        )
+        profile_check.pack(fill=tk.X)
+
+        # cProfile slows the cut down, so it is a separate opt-in
+        self.cprofile_var = tk.BooleanVar(value=self.resolve_conn.profile_mode == "cprofile")
+        cprofile_check = tk.Checkbutton(
+            section3,
+            text="🔬 Also run cProfile (.pstats file in the log folder)",
+            variable=self.cprofile_var,
+            command=self.toggle_cprofile,
+            font=("Arial", 8),
+            fg="#999999",
+            bg=self.section_bg,
+            activebackground=self.section_bg,
+            activeforeground=self.fg_color,
+            selectcolor="#1e1e1e",
+            anchor="w"
+        )
+        cprofile_check.pack(fill=tk.X)
+
+        # Re-cut into the current "Assassinated - ..." timeline instead of a new one
+        self.update_var = tk.BooleanVar(value=False)
+        update_check = tk.Checkbutton(
+            section3,
+            text="♻ Update current timeline (only changed segments)",
+            variable=self.update_var,
+            font=("Arial", 8),
+            fg="#999999",
+            bg=self.section_bg,
+            activebackground=self.section_bg,
+            activeforeground=self.fg_color,
+            selectcolor="#1e1e1e",
+            anchor="w"
+        )
+        update_check.pack(fill=tk.X)
+
+        # Build new timelines from one generated FCPXML instead of appending
+        self.import_var = tk.BooleanVar(value=False)
+        import_check = tk.Checkbutton(
+            section3,
+            text="📄 Build timeline with one FCPXML import",
+            variable=self.import_var,
+            font=("Arial", 8),
+            fg="#999999",
+            bg=self.section_bg,
+            activebackground=self.section_bg,
+            activeforeground=self.fg_color,
+            selectcolor="#1e1e1e",
+            anchor="w"
+        )
+        import_check.pack(fill=tk.X)
+
+        # Job queue: jobs run one at a time, more can be queued meanwhile
+        queue_frame = tk.Frame(section3, bg=self.section_bg)
+        queue_frame.pack(fill=tk.X, pady=(5, 0))
+
+        self.queue_label = tk.Label(
+            queue_frame,
+            text="Queue: idle",
+            font=("Arial", 8),
+            fg="#999999",
+            bg=self.section_bg,
+            anchor="w"
+        )
+        self.queue_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.cancel_btn = tk.Button(
+            queue_frame,
+            text="✖ Cancel queued",
+            command=self.cancel_queued,
+            bg="#555555",
+            fg="white",
+            font=("Arial", 8, "bold"),
+            relief=tk.FLAT,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.RIGHT)
+
+        self.stop_btn = tk.Button(
+            queue_frame,
+            text="⏹ Stop running",
+            command=self.stop_running,
+            bg="#555555",
+            fg="white",
+            font=("Arial", 8, "bold"),
+            relief=tk.FLAT,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.stop_btn.pack(side=tk.RIGHT, padx=(0, 5))
+
+        self.queue_list = tk.Listbox(
+            section3,
+            height=3,
+            font=("Arial", 8),
+            bg="#1e1e1e",
+            fg=self.fg_color,
+            selectmode=tk.EXTENDED,
+            relief=tk.FLAT
+        )
+        self.queue_list.pack(fill=tk.X, pady=(2, 0))
+        # Job ids of the queued (cancellable) rows, in display order
+        self.queue_list_ids = []
+
         # Section 4: Mission Status
         section4 = tk.LabelFrame(
             self.root,
@@ -265,26 +468,79 @@ class ClipAssassinGUI:
             self.timecodes_text.insert("1.0", "1m57-2m08\n3m10-3m22\n4m27-4m43\n5m28-5m36")
             self.timecodes_text.config(fg="#666666")
 
+    def import_range_file(self):
+        """Pick a range file to cut from instead of the typed ranges"""
+        path = filedialog.askopenfilename(
+            title="Import time ranges",
+            filetypes=[
+                ("Range files", "*.edl *.csv *.tsv *.srt *.vtt *.txt"),
+                ("EDL", "*.edl"),
+                ("CSV", "*.csv *.tsv"),
+                ("Subtitles", "*.srt *.vtt"),
+                ("Chapters / ranges", "*.txt"),
+                ("All files", "*.*"),
+            ]
+        )
+        if not path:
+            return
+
+        self.range_file = RangeFile(path)
+        self.range_file_label.config(text=f"Cutting from {self.range_file} - text box ignored", fg=self.fg_color)
+        self.clear_file_btn.pack(side=tk.RIGHT)
+
+    def clear_range_file(self):
+        """Go back to cutting the typed ranges"""
+        self.range_file = None
+        self.range_file_label.config(text="", fg="#999999")
+        self.clear_file_btn.pack_forget()
+
+    def toggle_profiling(self):
+        """Turn phase timings on or off for the next runs (off also turns off cProfile)"""
+        if not self.profile_var.get():
+            self.cprofile_var.set(False)
+        self._apply_profile_mode()
+
+    def toggle_cprofile(self):
+        """Turn cProfile on or off for the next runs (on also turns on phase timings)"""
+        if self.cprofile_var.get():
+            self.profile_var.set(True)
+        self._apply_profile_mode()
+
+    def _apply_profile_mode(self):
+        """Set the connection's profile mode from the two profiling checkboxes"""
+        if self.cprofile_var.get():
+            self.resolve_conn.profile_mode = "cprofile"
+        elif self.profile_var.get():
+            self.resolve_conn.profile_mode = "phases"
+        else:
+            self.resolve_conn.profile_mode = None
+
     def connect_to_resolve(self):
         """Connect to DaVinci Resolve"""
         self.update_status("⏳ Connecting to Resolve...", "#ffaa00")
         self.execute_btn.config(state=tk.DISABLED)
         self.reverse_btn.config(state=tk.DISABLED)
 
-        def connect_thread():
+        def connect_job():
             success, message = self.resolve_conn.connect()
-            self.root.after(0, lambda: self.connection_complete(success, message))
+            # Read the project info here too: only the worker talks to Resolve
+            info = self.resolve_conn.get_project_info() if success else ""
+            return success, message, info
+
+        def connect_done(result, error):
+            success, message, info = result if error is None else (False, f"Connection error: {error}", "")
+            self.root.after(0, lambda: self.connection_complete(success, message, info))
 
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self.jobs.submit("Connect to Resolve", connect_job, connect_done)
 
-    def connection_complete(self, success, message):
+    def connection_complete(self, success, message, info=""):
         """Handle connection result"""
         if success:
             self.connected = True
             self.update_status(f"✓ {message}", "#44ff44")
             self.execute_btn.config(state=tk.NORMAL)
             self.reverse_btn.config(state=tk.NORMAL)
-            self.update_result(self.resolve_conn.get_project_info())
+            self.update_result(info)
         else:
             self.connected = False
             self.update_status(f"✗ {message}", "#ff4444")
@@ -317,45 +573,141 @@ class ClipAssassinGUI:
             messagebox.showerror("Not Connected", "Please connect to DaVinci Resolve first.")
             return
 
-        # Get timecodes
-        timecodes = self.timecodes_text.get("1.0", "end-1c").strip()
-
-        # Check for placeholder
-        if timecodes == "1m57-2m08\n3m10-3m22\n4m27-4m43\n5m28-5m36":
-            messagebox.showwarning("No Targets", "Please enter your time ranges first.")
-            return
-
-        if not timecodes:
-            messagebox.showwarning("No Targets", "Please enter time ranges to cut.")
-            return
-
-        # Disable buttons during operation
-        self.execute_btn.config(state=tk.DISABLED, text="⏳ Executing...")
-        self.reverse_btn.config(state=tk.DISABLED, text="⏳ Executing...")
-
-        if reverse_mode:
-            self.update_result("⚔️ REVERSE mode activated...\n🎯 Marking targets for elimination...\nProcessing...\n")
+        # Get timecodes (an imported range file wins over the text box)
+        if self.range_file:
+            timecodes = self.range_file
         else:
-            self.update_result("🎯 Locking on targets...\nProcessing...\n")
-
-        def cut_thread():
-            success, message = self.resolve_conn.cut_video(timecodes, reverse_mode=reverse_mode)
-            self.root.after(0, lambda: self.cutting_complete(success, message))
+            timecodes = self.timecodes_text.get("1.0", "end-1c").strip()
+
+            # Check for placeholder
+            if timecodes == "1m57-2m08\n3m10-3m22\n4m27-4m43\n5m28-5m36":
+                messagebox.showwarning("No Targets", "Please enter your time ranges first.")
+                return
+
+            if not timecodes:
+                messagebox.showwarning("No Targets", "Please enter time ranges to cut.")
+                return
+
+        # Source clip name/glob (empty string = first video clip)
+        source_clip = self.source_clip_entry.get().strip()
+        update_timeline = self.update_var.get()
+        import_format = "fcpxml" if self.import_var.get() else None
+
+        if not self.jobs.depth:
+            if reverse_mode:
+                self.update_result("⚔️ REVERSE mode activated...\n🎯 Marking targets for elimination...\nProcessing...\n")
+            else:
+                self.update_result("🎯 Locking on targets...\nProcessing...\n")
+
+        # The id and cancel event are registered before the job can start, so
+        # cut_done() and stop_running() never miss them
+        cancel = threading.Event()
+        job_id = self.jobs.reserve_id()
+        self.cut_cancels[job_id] = cancel
+
+        def cut_job():
+            return self.resolve_conn.cut_video(
+                timecodes, source_clip=source_clip, reverse_mode=reverse_mode,
+                progress=self.report_progress, cancel=cancel, update_timeline=update_timeline,
+                import_format=import_format
+            )
+
+        def cut_done(result, error):
+            self.cut_cancels.pop(job_id, None)
+            if isinstance(error, JobCancelled):
+                return
+            success, message = result if error is None else (False, f"Error during cutting: {error}")
+            # Decided here on the worker thread, before the next queued job can start
+            last = not self.jobs.snapshot()[1]
+            self.root.after(0, lambda: self.cutting_complete(success, message, cancel.is_set(), last))
+
+        label = f"{'REVERSE' if reverse_mode else 'Cut'} {source_clip or 'first clip'}: "
+        if isinstance(timecodes, RangeFile):
+            label += f"from {timecodes}"
+        else:
+            lines = timecodes.splitlines()
+            label += lines[0].strip()
+            if len(lines) > 1:
+                label += f" (+{len(lines) - 1} more)"
 
-        threading.Thread(target=cut_thread, daemon=True).start()
+        self.jobs.submit(label, cut_job, cut_done, job_id)
 
-    def cutting_complete(self, success, message):
-        """Handle cutting operation result"""
-        self.execute_btn.config(state=tk.NORMAL, text="🗡️ RUN THE BLADES")
-        self.reverse_btn.config(state=tk.NORMAL, text="⚔️ REVERSE BLADES")
+    def cutting_complete(self, success, message, cancelled=False, last=True):
+        """Handle cutting operation result (last: no other job was queued when it finished)"""
+        # Drop a progress report still waiting to be drawn over the result
+        self.pending_progress = None
 
-        if success:
+        if cancelled and not success:
+            self.update_result(f"⏹ Mission aborted\n\n{message}")
+        elif success:
             self.update_result(message)
-            messagebox.showinfo("Mission Accomplished", "Timeline created successfully!\nCheck your Resolve project.")
+            # With more jobs queued, only the last one pops up a message box
+            if last:
+                messagebox.showinfo("Mission Accomplished", "Timeline created successfully!\nCheck your Resolve project.")
         else:
             self.update_result(f"✗ Mission Failed\n\n{message}")
             messagebox.showerror("Mission Failed", message)
 
+    def update_queue_display(self):
+        """Show the running job, queued jobs and queue depth"""
+        running, pending = self.jobs.snapshot()
+
+        if running:
+            self.queue_label.config(text=f"Queue: {len(pending) + 1} job(s) - running: {running[1]}", fg="#ffaa00")
+        else:
+            self.queue_label.config(text="Queue: idle", fg="#999999")
+
+        self.queue_list.delete(0, tk.END)
+        if running:
+            self.queue_list.insert(tk.END, f"⏳ {running[1]}")
+        for job_id, label in pending:
+            self.queue_list.insert(tk.END, f"   {label}")
+        self.queue_list_ids = [job_id for job_id, _ in pending]
+
+        self.cancel_btn.config(state=tk.NORMAL if pending else tk.DISABLED)
+        running_cut = running and self.cut_cancels.get(running[0])
+        self.stop_btn.config(state=tk.NORMAL if running_cut and not running_cut.is_set() else tk.DISABLED)
+
+    def report_progress(self, done, total, eta, segment):
+        """Progress callback of cut_video(); runs on the worker thread"""
+        self.pending_progress = (done, total, eta, segment)
+        if not self.progress_scheduled:
+            self.progress_scheduled = True
+            self.root.after(PROGRESS_INTERVAL_MS, self.show_progress)
+
+    def show_progress(self):
+        """Draw the latest progress report (only the newest one is shown)"""
+        self.progress_scheduled = False
+        if not self.pending_progress:
+            return
+
+        done, total, eta, segment = self.pending_progress
+        text = f"✂️ Appending segments: {done:,} / {total:,} ({done / max(total, 1):.0%})\n"
+        if eta is not None:
+            text += f"ETA: {format_seconds(eta)}\n"
+        if segment:
+            text += f"Last segment: {segment}\n"
+        self.update_result(text)
+
+    def stop_running(self):
+        """Stop the running cut before its next chunk of segments"""
+        running, _ = self.jobs.snapshot()
+        cancel = running and self.cut_cancels.get(running[0])
+        if cancel:
+            cancel.set()
+            self.stop_btn.config(state=tk.DISABLED)
+
+    def cancel_queued(self):
+        """Cancel the selected queued jobs, or all queued jobs if none is selected"""
+        offset = 1 if self.queue_list.size() > len(self.queue_list_ids) else 0
+        selected = [index - offset for index in self.queue_list.curselection() if index >= offset]
+
+        if selected:
+            for index in selected:
+                self.jobs.cancel(self.queue_list_ids[index])
+        else:
+            self.jobs.cancel_pending()
+
 
 def main():
     """Main entry point"""
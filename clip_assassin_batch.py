@@ -0,0 +1,257 @@
+"""
+Clip Assassin for DaVinci Resolve - BATCH MODE
+Creates timelines for many clips from a job manifest, without the GUI
+
+All jobs run over one ResolveConnection, so the clip index and the set of
+timeline names are read once and reused between jobs.
+
+Manifest (JSON):
+    [
+        {"clip": "Episode 01.mov", "ranges": "ranges/ep01.txt", "reverse": false},
+        {"clip": "Episode 02*", "ranges": "ranges/ep02.txt", "reverse": true, "update": true}
+    ]
+    (or {"jobs": [...]}; "timecodes" may hold the ranges inline instead)
+
+Manifest (CSV):
+    clip,ranges,reverse,update
+    Episode 01.mov,ranges/ep01.txt,no,no
+    Episode 02*,ranges/ep02.txt,yes,yes
+
+"update" re-cuts into the current "Assassinated - <clip>" timeline (only
+changed segments) instead of creating a new one; it is optional.
+
+Range file paths are relative to the manifest. Besides "start-end" text they
+may be CMX3600 EDLs, CSV sheets, SRT/VTT subtitles or chapter lists (see
+range_import.py; picked by extension or content, or set with an optional
+"format" field). "clip" is a clip name, file path or glob (see
+ResolveConnection.find_clip()).
+
+--import-format edl|fcpxml builds each timeline with one ImportTimelineFromFile()
+call from a generated file instead of appending segments.
+
+--dry-run only reads the clips and prints each job's cut plan (exact frame
+segments, timeline name, warnings; see cut_plan.py) without creating timelines.
+
+Usage:
+    python clip_assassin_batch.py manifest.json [--format json|jsonl] [--stop-on-error] [--dry-run]
+                                                [--import-format edl|fcpxml]
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from range_import import RangeFile, IMPORT_FORMATS
+from resolve_core import ResolveConnection
+
+TRUE_WORDS = ("1", "true", "yes", "y", "reverse")
+
+
+def _parse_flag(value):
+    """Read a manifest flag such as reverse (bool, number or yes/no style string)"""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_WORDS
+    return bool(value)
+
+
+def load_manifest(path):
+    """
+    Read a JSON or CSV job manifest
+
+    Args:
+        path: Manifest file (.json or .csv)
+
+    Returns:
+        list: Job dicts with "clip", "ranges" (path or None), "format"
+              (range file format or None), "timecodes" (inline text or
+              None), "reverse" and "update"
+
+    Raises:
+        ValueError: If the manifest is malformed
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = json.load(f)
+            if isinstance(rows, dict):
+                rows = rows.get("jobs", [])
+
+    if not isinstance(rows, list):
+        raise ValueError("Manifest must be a list of jobs (or {\"jobs\": [...]})")
+
+    jobs = []
+    for number, row in enumerate(rows, 1):
+        if not isinstance(row, dict) or not row.get("clip"):
+            raise ValueError(f"Job {number}: missing \"clip\"")
+
+        for key in ("clip", "ranges", "timecodes", "format"):
+            if row.get(key) is not None and not isinstance(row[key], str):
+                raise ValueError(f"Job {number}: \"{key}\" must be a string")
+
+        ranges = (row.get("ranges") or "").strip() or None
+        timecodes = row.get("timecodes")
+        if not ranges and not timecodes:
+            raise ValueError(f"Job {number}: needs \"ranges\" (file) or \"timecodes\" (inline)")
+
+        range_format = (row.get("format") or "").strip().lower() or None
+        if range_format and range_format not in IMPORT_FORMATS:
+            raise ValueError(f"Job {number}: unknown range format \"{range_format}\" "
+                             f"(use one of {', '.join(IMPORT_FORMATS)})")
+
+        jobs.append({
+            "clip": row["clip"].strip(),
+            "ranges": os.path.join(base_dir, ranges) if ranges else None,
+            "format": range_format,
+            "timecodes": timecodes,
+            "reverse": _parse_flag(row.get("reverse", False)),
+            "update": _parse_flag(row.get("update", False)),
+        })
+
+    return jobs
+
+
+def run_job(connection, job, dry_run=False, import_format=None):
+    """
+    Cut one manifest job
+
+    Args:
+        connection: Connected ResolveConnection
+        job: Job dict from load_manifest()
+        dry_run: Only plan the cut; the result gets a "plan" (CutPlan.to_dict())
+        import_format: "edl"/"fcpxml" to build the timeline by file import
+
+    Returns:
+        dict: Machine-readable job result
+    """
+    result = {"clip": job["clip"], "ranges": job["ranges"], "reverse": job["reverse"]}
+
+    timecodes = job["timecodes"]
+    if timecodes is None:
+        try:
+            range_file = RangeFile(job["ranges"], job.get("format"))
+            if range_file.import_format == "ranges":
+                with open(job["ranges"], "r", encoding="utf-8-sig") as f:
+                    timecodes = f.read()
+            else:
+                # EDL/CSV/subtitles/chapters: read straight into frame ranges
+                if not os.path.isfile(job["ranges"]):
+                    raise OSError(f"No such file: '{job['ranges']}'")
+                timecodes = range_file
+        except OSError as e:
+            result.update(success=False, error=f"Cannot read range file: {e}")
+            return result
+
+    if dry_run:
+        plan, message = connection.plan_video(timecodes, source_clip=job["clip"], reverse_mode=job["reverse"])
+        result["success"] = plan is not None and plan.ok
+        result["plan"] = plan.to_dict() if plan is not None else None
+        if not result["success"]:
+            result["error"] = message
+        return result
+
+    connection.last_job = None
+    success, message = connection.cut_video(
+        timecodes, source_clip=job["clip"], reverse_mode=job["reverse"], update_timeline=job.get("update", False),
+        import_format=import_format
+    )
+
+    result["success"] = success
+    details = connection.last_job or {}
+    for key in ("timeline", "update", "import_format", "segments", "kept_seconds", "warnings", "duration_ms"):
+        if key in details:
+            result[key] = details[key]
+    if not success:
+        result["error"] = message
+
+    return result
+
+
+def run_batch(connection, jobs, stop_on_error=False, on_result=None, dry_run=False, import_format=None):
+    """
+    Run all jobs over one connection
+
+    Args:
+        connection: Connected ResolveConnection
+        jobs: Job dicts from load_manifest()
+        stop_on_error: Skip the remaining jobs after the first failure
+        on_result: Optional callback(result) after each job
+        dry_run: Only plan the cuts, see run_job()
+        import_format: See run_job()
+
+    Returns:
+        list: Job results (see run_job())
+    """
+    results = []
+    for job in jobs:
+        result = run_job(connection, job, dry_run, import_format)
+        results.append(result)
+        if on_result:
+            on_result(result)
+        if stop_on_error and not result["success"]:
+            break
+    return results
+
+
+def main(argv=None):
+    """
+    Command line entry point
+
+    Returns:
+        int: Exit code - 0 all jobs succeeded, 1 some failed, 2 could not start
+    """
+    parser = argparse.ArgumentParser(description="Create Resolve timelines from a job manifest.")
+    parser.add_argument("manifest", help="JSON or CSV manifest (clip, ranges, reverse)")
+    parser.add_argument("--format", choices=("json", "jsonl"), default="json",
+                        help="json: one summary document at the end; jsonl: one line per job as it finishes")
+    parser.add_argument("--stop-on-error", action="store_true", help="stop after the first failed job")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print each job's cut plan without creating timelines")
+    parser.add_argument("--import-format", choices=("edl", "fcpxml"),
+                        help="build each timeline with one ImportTimelineFromFile call")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(json.dumps({"success": False, "error": f"Manifest error: {e}"}))
+        return 2
+
+    connection = ResolveConnection()
+    success, message = connection.connect()
+    if not success:
+        print(json.dumps({"success": False, "error": message}))
+        return 2
+
+    def report(result):
+        status = "OK  " if result["success"] else "FAIL"
+        print(f"[{status}] {result['clip']}", file=sys.stderr)
+        if args.format == "jsonl":
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+
+    start = time.perf_counter()
+    results = run_batch(connection, jobs, args.stop_on_error, report, args.dry_run, args.import_format)
+    failed = sum(1 for result in results if not result["success"])
+
+    summary = {
+        "success": failed == 0 and len(results) == len(jobs),
+        "jobs": len(jobs),
+        "run": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "duration_s": round(time.perf_counter() - start, 3),
+    }
+    if args.format == "json":
+        summary["results"] = results
+    print(json.dumps(summary, ensure_ascii=False, indent=2 if args.format == "json" else None))
+
+    return 0 if summary["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
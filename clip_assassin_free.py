@@ -1,4 +1,4 @@
-"""
+r"""
 Clip Assassin for DaVinci Resolve - FREE VERSION
 Works with both FREE and STUDIO versions via internal scripting
 
@@ -14,6 +14,8 @@ INSTALLATION:
 """
 
 import sys
+import time
+import threading
 
 # Try to get Resolve instance using the workaround for FREE version
 try:
@@ -51,7 +53,7 @@ try:
     if script_dir not in sys.path:
         sys.path.insert(0, script_dir)
 
-    from time_parser import parse_timecodes, format_seconds
+    from time_parser import parse_timecodes_frames, rational_framerate, format_frames
 except ImportError:
     # Fallback: inline simplified time parser
     import re
@@ -128,6 +130,135 @@ except ImportError:
         secs = int(seconds % 60)
         return f"{mins}:{secs:02d}"
 
+    def rational_framerate(fps):
+        """Simplified frame rate reader"""
+        return float(fps)
+
+    def parse_timecodes_frames(text, fps=30.0):
+        """Simplified parser returning sorted frame ranges"""
+        ranges, errors = parse_timecodes(text, fps)
+        ranges = sorted((round(start * fps), round(end * fps)) for start, end in ranges)
+        return ranges, errors
+
+    def format_frames(frames, fps=30.0):
+        """Format a frame number as MM:SS"""
+        return format_seconds(round(frames / fps))
+
+# Import the summary builder from the main project
+try:
+    from cut_report import format_cut_summary
+except ImportError:
+    # Fallback: first and last 50 segments plus aggregates, built in one join
+    def format_cut_summary(timeline_name, clip_name, fps, segments, warnings=(), detail=50):
+        """Simplified summary builder"""
+        lengths = [end - start for start, end in segments]
+        total_frames = sum(lengths)
+        lines = [
+            "✓ Mission accomplished!", "",
+            f"Timeline: {timeline_name}",
+            f"Clip: {clip_name}",
+            f"Framerate: {float(fps):.2f} fps",
+            f"Segments: {len(segments)}",
+            f"Total duration: {format_frames(total_frames, fps)}", "",
+            "Segments:",
+        ]
+        count = len(segments)
+        shown = list(enumerate(segments, 1))
+        if count > 2 * detail:
+            shown = shown[:detail] + shown[-detail:]
+        lines += [f"  {i}. {format_frames(start, fps)} - {format_frames(end, fps)} ({format_frames(end - start, fps)})"
+                  for i, (start, end) in shown]
+        if count > 2 * detail:
+            hidden = sum(lengths[detail:count - detail])
+            lines.insert(len(lines) - detail,
+                         f"  ... {count - 2 * detail:,} more segments ({format_frames(hidden, fps)}) ...")
+            lines.append(f"  Shortest {format_frames(min(lengths), fps)}, longest {format_frames(max(lengths), fps)}, "
+                         f"average {format_frames(total_frames / count, fps)}")
+        if warnings:
+            lines += ["", "⚠ Warnings:"] + [f"  - {e}" for e in warnings[:50]]
+            if len(warnings) > 50:
+                lines.append(f"  ... and {len(warnings) - 50:,} more")
+        return "\n".join(lines)
+
+# Import interval engine from the main project
+try:
+    from intervals import merge_intervals, complement_intervals
+except ImportError:
+    # Fallback: inline simplified interval helpers
+    def merge_intervals(intervals):
+        """Sort and merge overlapping or touching ranges"""
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+            elif start < end:
+                merged.append((start, end))
+        return merged
+
+    def complement_intervals(intervals, start, end):
+        """Ranges of [start, end) not covered by intervals"""
+        gaps = []
+        position = start
+        for interval_start, interval_end in merge_intervals(intervals):
+            if interval_start > position:
+                gaps.append((position, min(interval_start, end)))
+            position = max(position, interval_end)
+        if position < end:
+            gaps.append((position, end))
+        return [(a, b) for a, b in gaps if a < b]
+
+# Import job log from the main project
+try:
+    from job_log import log_job
+except ImportError:
+    # Fallback: no job log
+    def log_job(record):
+        pass
+
+
+# Progress signals from the worker are throttled to one per interval (seconds)
+PROGRESS_INTERVAL = 0.1
+
+
+class CutWorker(QtCore.QObject):
+    """Runs ClipAssassinFree.cut_video() on a QThread and reports through signals"""
+
+    # done, total, eta in seconds (-1 = unknown), last segment as text
+    progress = QtCore.Signal(int, int, float, str)
+    # success, message, cancelled
+    finished = QtCore.Signal(bool, str, bool)
+
+    def __init__(self, dialog, timecodes_text, reverse_mode):
+        super(CutWorker, self).__init__()
+        self.dialog = dialog
+        self.timecodes_text = timecodes_text
+        self.reverse_mode = reverse_mode
+        self.cancel_event = threading.Event()
+        self._last_emit = 0.0
+
+    def run(self):
+        """Worker thread: cut and emit finished"""
+        try:
+            success, message = self.dialog.cut_video(
+                self.timecodes_text, self.reverse_mode,
+                progress=self.report_progress, cancel=self.cancel_event
+            )
+        except Exception as e:
+            success, message = False, f"Error: {str(e)}"
+        self.finished.emit(success, message, self.cancel_event.is_set())
+
+    def report_progress(self, done, total, eta, segment):
+        """cut_video() progress callback; emits at most every PROGRESS_INTERVAL"""
+        now = time.perf_counter()
+        if done < total and now - self._last_emit < PROGRESS_INTERVAL:
+            return
+        self._last_emit = now
+        self.progress.emit(done, total, -1.0 if eta is None else eta, segment or "")
+
+    def cancel(self):
+        """Ask the worker to stop before its next segment"""
+        self.cancel_event.set()
+
 
 class ClipAssassinFree(QtWidgets.QDialog):
     def __init__(self, resolve_instance, parent=None):
@@ -146,6 +277,12 @@ class ClipAssassinFree(QtWidgets.QDialog):
             raise RuntimeError("No project open")
 
         self.media_pool = self.project.GetMediaPool()
+        # Names of all timelines in the project, read once per session
+        self.timeline_names = None
+
+        # Background cut (QThread + CutWorker) while a job is running
+        self.cut_thread = None
+        self.cut_worker = None
 
         self.setWindowTitle("Clip Assassin - FREE Version")
         self.setMinimumSize(550, 700)
@@ -232,6 +369,20 @@ class ClipAssassinFree(QtWidgets.QDialog):
         self.reverse_btn.clicked.connect(lambda: self.execute_cutting(True))
         btn_layout.addWidget(self.reverse_btn)
 
+        self.cancel_btn = QtWidgets.QPushButton("⏹ CANCEL")
+        self.cancel_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #555555;
+                color: white;
+                font-weight: bold;
+                padding: 10px;
+                font-size: 12px;
+            }
+        """)
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_cutting)
+        btn_layout.addWidget(self.cancel_btn)
+
         layout.addLayout(btn_layout)
 
         reverse_help = QtWidgets.QLabel("REVERSE: Keep everything EXCEPT marked ranges")
@@ -255,26 +406,39 @@ class ClipAssassinFree(QtWidgets.QDialog):
         self.setLayout(layout)
 
     def get_first_video_clip(self):
-        """Find first video clip in media pool"""
-        def search_folder(folder):
-            clips = folder.GetClipList()
-            for clip in clips:
-                clip_property = clip.GetClipProperty()
-                if clip_property and clip_property.get("Video Codec"):
+        """Find first video clip in media pool (breadth-first, stops at first match)"""
+        folders = [self.media_pool.GetRootFolder()]
+        while folders:
+            folder = folders.pop(0)
+            for clip in folder.GetClipList() or []:
+                if clip.GetClipProperty("Video Codec"):
                     return clip
+            folders.extend(folder.GetSubFolderList() or [])
+        return None
 
-            subfolders = folder.GetSubFolderList()
-            for subfolder in subfolders:
-                found = search_folder(subfolder)
-                if found:
-                    return found
-            return None
+    def unique_timeline_name(self, name):
+        """Get name, or the first "name (N)" not used by any timeline"""
+        if self.timeline_names is None:
+            self.timeline_names = set()
+            for i in range(1, self.project.GetTimelineCount() + 1):
+                timeline = self.project.GetTimelineByIndex(i)
+                if timeline:
+                    self.timeline_names.add(timeline.GetName())
 
-        root_folder = self.media_pool.GetRootFolder()
-        return search_folder(root_folder)
+        if name not in self.timeline_names:
+            return name
+
+        existing_count = 2
+        while f"{name} ({existing_count})" in self.timeline_names:
+            existing_count += 1
+
+        return f"{name} ({existing_count})"
 
     def execute_cutting(self, reverse_mode=False):
-        """Execute the cutting operation"""
+        """Start the cutting operation on a worker thread"""
+        if self.cut_thread is not None:
+            return
+
         timecodes = self.timecodes_text.toPlainText().strip()
 
         if not timecodes:
@@ -283,36 +447,102 @@ class ClipAssassinFree(QtWidgets.QDialog):
 
         self.run_btn.setEnabled(False)
         self.reverse_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
 
         if reverse_mode:
             self.result_text.setPlainText("⚔️ REVERSE mode activated...\n🎯 Processing...\n")
         else:
             self.result_text.setPlainText("🎯 Locking on targets...\nProcessing...\n")
 
-        QtCore.QCoreApplication.processEvents()
-
-        try:
-            success, message = self.cut_video(timecodes, reverse_mode)
-
+        # Signals emitted by the worker are delivered on this (GUI) thread
+        self.cut_thread = QtCore.QThread(self)
+        self.cut_worker = CutWorker(self, timecodes, reverse_mode)
+        self.cut_worker.moveToThread(self.cut_thread)
+        self.cut_thread.started.connect(self.cut_worker.run)
+        self.cut_worker.progress.connect(self.show_progress)
+        self.cut_worker.finished.connect(self.cutting_complete)
+        self.cut_thread.start()
+
+    def show_progress(self, done, total, eta, segment):
+        """Show segments done, ETA and the last segment"""
+        text = f"✂️ Appending segments: {done:,} / {total:,} ({done / max(total, 1):.0%})\n"
+        if eta >= 0:
+            text += f"ETA: {eta:.1f}s\n"
+        if segment:
+            text += f"Last segment: {segment}\n"
+        self.result_text.setPlainText(text)
+
+    def cancel_cutting(self):
+        """Stop the running cut before its next segment"""
+        if self.cut_worker is not None:
+            self.cut_worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.result_text.appendPlainText("⏹ Cancelling...")
+
+    def cutting_complete(self, success, message, cancelled):
+        """Handle the worker's result and tear the thread down"""
+        self.cut_thread.quit()
+        self.cut_thread.wait()
+        self.cut_thread.deleteLater()
+        self.cut_worker.deleteLater()
+        self.cut_thread = None
+        self.cut_worker = None
+
+        self.run_btn.setEnabled(True)
+        self.reverse_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+
+        if cancelled and not success:
+            self.result_text.setPlainText(f"⏹ Mission aborted\n\n{message}")
+        elif success:
             self.result_text.setPlainText(message)
-
-            if success:
-                QtWidgets.QMessageBox.information(self, "Mission Accomplished",
-                    "Timeline created successfully!\nCheck your project timelines.")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Mission Failed", message)
-
-        except Exception as e:
-            error_msg = f"Error: {str(e)}"
-            self.result_text.setPlainText(error_msg)
-            QtWidgets.QMessageBox.critical(self, "Error", error_msg)
-
-        finally:
-            self.run_btn.setEnabled(True)
-            self.reverse_btn.setEnabled(True)
-
-    def cut_video(self, timecodes_text, reverse_mode=False):
-        """Main cutting logic"""
+            QtWidgets.QMessageBox.information(self, "Mission Accomplished",
+                "Timeline created successfully!\nCheck your project timelines.")
+        else:
+            self.result_text.setPlainText(message)
+            QtWidgets.QMessageBox.critical(self, "Mission Failed", message)
+
+    def closeEvent(self, event):
+        """Stop a running cut before the dialog goes away"""
+        if self.cut_worker is not None:
+            self.cut_worker.cancel()
+            self.cut_thread.quit()
+            self.cut_thread.wait()
+        super(ClipAssassinFree, self).closeEvent(event)
+
+    def cut_video(self, timecodes_text, reverse_mode=False, progress=None, cancel=None):
+        """
+        Main cutting logic, logged to the job log
+
+        Args:
+            timecodes_text: Multi-line string with time ranges
+            reverse_mode: If True, keep everything EXCEPT marked ranges
+            progress: Optional callback(done, total, eta, segment) after every
+                      appended segment (eta in seconds or None, segment as text)
+            cancel: Optional threading.Event; when set, stops before the next segment
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        job = {}
+        start = time.perf_counter()
+        success, message = self._cut_video(timecodes_text, reverse_mode, job, progress, cancel)
+        duration_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        log_job({
+            "version": "free",
+            **job,
+            "reverse": reverse_mode,
+            "phases_ms": {"total": duration_ms},
+            "duration_ms": duration_ms,
+            "api_calls": None,
+            "outcome": "success" if success else ("cancelled" if job.get("cancelled") else "failure"),
+            "error": None if success else (message.splitlines() or [""])[0],
+        })
+        return success, message
+
+    def _cut_video(self, timecodes_text, reverse_mode, job, progress=None, cancel=None):
+        """cut_video() without logging; fills clip and segment details into job"""
         try:
             # Get source clip
             source_clip = self.get_first_video_clip()
@@ -321,14 +551,14 @@ class ClipAssassinFree(QtWidgets.QDialog):
 
             clip_name = source_clip.GetName()
 
-            # Get clip framerate
+            # Get clip framerate (exact rational rate) and length in frames
             clip_property = source_clip.GetClipProperty()
-            fps = float(clip_property.get("FPS", 30))
+            fps = rational_framerate(clip_property.get("FPS", 30))
             duration_frames = int(clip_property.get("Frames", 0))
-            duration_seconds = duration_frames / fps
+            job.update(clip=clip_name, fps=float(fps), clip_frames=duration_frames)
 
-            # Parse time ranges
-            ranges, errors = parse_timecodes(timecodes_text, fps)
+            # Parse time ranges to frame numbers
+            ranges, errors = parse_timecodes_frames(timecodes_text, fps)
 
             if not ranges:
                 error_msg = "No valid time ranges found."
@@ -339,66 +569,65 @@ class ClipAssassinFree(QtWidgets.QDialog):
             # Validate ranges
             invalid_ranges = []
             for i, (start, end) in enumerate(ranges):
-                if end > duration_seconds:
+                if end > duration_frames:
                     invalid_ranges.append(
-                        f"Range {i+1}: {format_seconds(start)}-{format_seconds(end)} "
-                        f"exceeds clip duration ({format_seconds(duration_seconds)})"
+                        f"Range {i+1}: {format_frames(start, fps)}-{format_frames(end, fps)} "
+                        f"exceeds clip duration ({format_frames(duration_frames, fps)})"
                     )
 
             if invalid_ranges:
                 return False, "Some ranges exceed clip duration:\n" + "\n".join(invalid_ranges)
 
-            # REVERSE MODE: Convert to inverse ranges
-            if reverse_mode:
-                inverse_ranges = []
-                last_end = 0
-
-                for start, end in ranges:
-                    if last_end < start:
-                        inverse_ranges.append((last_end, start))
-                    last_end = end
-
-                if last_end < duration_seconds:
-                    inverse_ranges.append((last_end, duration_seconds))
+            # Merge overlapping, duplicate or touching ranges
+            segments = merge_intervals(ranges)
+            if len(segments) < len(ranges):
+                errors.append(f"{len(ranges)} overlapping or adjacent ranges merged into {len(segments)}")
 
-                ranges = inverse_ranges
+            # REVERSE MODE: Keep everything the marked ranges do not cover
+            if reverse_mode:
+                segments = complement_intervals(segments, 0, duration_frames)
 
-                if not ranges:
+                if not segments:
                     return False, "REVERSE mode: No segments to keep. Marked ranges cover entire clip."
 
-            # Create new timeline
-            timeline_name = f"Assassinated - {clip_name}"
-
-            # Check if timeline exists
-            existing_count = 1
-            original_name = timeline_name
-            timeline_count = self.project.GetTimelineCount()
+            job.update(
+                segments=len(segments),
+                kept_seconds=round(sum(end - start for start, end in segments) / float(fps), 3),
+                warnings=len(errors),
+            )
 
-            while True:
-                exists = False
-                for i in range(1, timeline_count + 1):
-                    timeline = self.project.GetTimelineByIndex(i)
-                    if timeline and timeline.GetName() == timeline_name:
-                        exists = True
-                        break
+            if cancel is not None and cancel.is_set():
+                job["cancelled"] = True
+                return False, "Cancelled before the timeline was created."
 
-                if not exists:
-                    break
+            # Create new timeline, adding (2), (3)... if the name is taken
+            timeline_name = self.unique_timeline_name(f"Assassinated - {clip_name}")
+            new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
 
-                existing_count += 1
-                timeline_name = f"{original_name} ({existing_count})"
+            if not new_timeline:
+                # Timelines may have changed since the names were read: re-read once
+                self.timeline_names = None
+                timeline_name = self.unique_timeline_name(f"Assassinated - {clip_name}")
+                new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
 
-            # Create timeline
-            new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
             if not new_timeline:
                 return False, "Failed to create new timeline."
 
+            self.timeline_names.add(timeline_name)
+            job["timeline"] = timeline_name
+
             self.project.SetCurrentTimeline(new_timeline)
 
             # Add clips
-            for start_sec, end_sec in ranges:
-                in_frame = round(start_sec * fps)
-                out_frame = round(end_sec * fps)
+            append_start = time.perf_counter()
+            if progress:
+                progress(0, len(segments), None, None)
+
+            for done, (in_frame, out_frame) in enumerate(segments, 1):
+                if cancel is not None and cancel.is_set():
+                    job["cancelled"] = True
+                    return False, (f"Cancelled after {done - 1} of {len(segments)} segments.\n"
+                                   f"Timeline '{timeline_name}' keeps the segments added so far.")
 
                 clip_info = {
                     "mediaPoolItem": source_clip,
@@ -406,29 +635,18 @@ class ClipAssassinFree(QtWidgets.QDialog):
                     "endFrame": out_frame,
                 }
 
+                # No whole-clip fallback: appending the full clip mid-cut would look like success
                 result = self.media_pool.AppendToTimeline([clip_info])
                 if not result:
-                    result = self.media_pool.AppendToTimeline([source_clip])
+                    return False, f"Failed to add segment {format_frames(in_frame, fps)}-{format_frames(out_frame, fps)}"
 
-                if not result:
-                    return False, f"Failed to add segment {format_seconds(start_sec)}-{format_seconds(end_sec)}"
+                if progress:
+                    elapsed = time.perf_counter() - append_start
+                    progress(done, len(segments), elapsed / done * (len(segments) - done),
+                             f"{format_frames(in_frame, fps)} - {format_frames(out_frame, fps)}")
 
             # Generate summary
-            total_duration = sum(end - start for start, end in ranges)
-            summary = f"✓ Mission accomplished!\n\n"
-            summary += f"Timeline: {timeline_name}\n"
-            summary += f"Clip: {clip_name}\n"
-            summary += f"Framerate: {fps:.2f} fps\n"
-            summary += f"Segments: {len(ranges)}\n"
-            summary += f"Total duration: {format_seconds(total_duration)}\n\n"
-            summary += "Segments:\n"
-            for i, (start, end) in enumerate(ranges, 1):
-                summary += f"  {i}. {format_seconds(start)} - {format_seconds(end)} ({format_seconds(end-start)})\n"
-
-            if errors:
-                summary += f"\n⚠ Warnings:\n" + "\n".join(f"  - {e}" for e in errors)
-
-            return True, summary
+            return True, format_cut_summary(timeline_name, clip_name, fps, segments, errors)
 
         except Exception as e:
             return False, f"Error during cutting: {str(e)}"
@@ -442,7 +660,8 @@ if __name__ == "__main__":
             app_instance = QtWidgets.QApplication(sys.argv)
 
         window = ClipAssassinFree(resolve)
-        window.exec_()
+        # exec_() is deprecated in PySide6
+        window.exec() if QT_VERSION == 6 else window.exec_()
 
     except Exception as e:
         print(f"ERROR: {e}")
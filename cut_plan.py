@@ -0,0 +1,344 @@
+"""
+Cut Planner for Clip Assassin Resolve
+Turns range text and clip metadata into a cut plan, without touching Resolve
+
+plan_cut() does the parsing, validation, merging and REVERSE inversion and
+returns a CutPlan: the exact frame segments, the target timeline name and
+any warnings. Plans serialize to JSON, so they can be computed in bulk ahead
+of time, cached, diffed and checked offline; ResolveConnection.execute_plan()
+only replays them.
+"""
+
+import json
+from fractions import Fraction
+
+from time_parser import parse_timecodes_frames, parse_timecodes_array, format_frames
+from intervals import (
+    merge_intervals, complement_intervals, merge_interval_arrays, complement_interval_arrays
+)
+import api_stats
+
+# NumPy is optional: with it, sorting, validation and REVERSE run vectorized
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bumped whenever the JSON layout of a plan changes
+PLAN_VERSION = 1
+
+
+class CutPlan:
+    """What a cut will do: source clip, frame segments and target timeline"""
+
+    def __init__(self, clip, fps, clip_frames, segments, reverse=False,
+                 timeline_name=None, warnings=None, error=None):
+        """
+        Args:
+            clip: Source clip name
+            fps: Exact frame rate of the clip (Fraction)
+            clip_frames: Clip length in frames
+            segments: List of (in_frame, out_frame) tuples to keep, in order
+            reverse: True if segments are the gaps between the marked ranges
+            timeline_name: Base name of the timeline to create (a free
+                           "(N)" suffix is picked when the plan is executed)
+            warnings: Messages about skipped or merged ranges
+            error: Why the plan cannot be executed, or None
+        """
+        self.clip = clip
+        self.fps = Fraction(fps)
+        self.clip_frames = clip_frames
+        self.segments = [tuple(segment) for segment in segments]
+        self.reverse = reverse
+        self.timeline_name = timeline_name or f"Assassinated - {clip}"
+        self.warnings = list(warnings or [])
+        self.error = error
+
+    @property
+    def ok(self):
+        """True if the plan can be executed"""
+        return self.error is None
+
+    @property
+    def total_frames(self):
+        """Frames kept by all segments together"""
+        return sum(end - start for start, end in self.segments)
+
+    @property
+    def kept_seconds(self):
+        """Seconds kept by all segments together"""
+        return float(self.total_frames / self.fps)
+
+    def matches(self, metadata):
+        """
+        Check that the plan was made for a clip like metadata
+
+        Args:
+            metadata: ClipMetadata (or anything with name, rational_fps, frames)
+
+        Returns:
+            str or None: Why the plan does not fit the clip, or None if it does
+        """
+        if metadata.rational_fps != self.fps:
+            return f"Plan is for {float(self.fps):.3f} fps, clip '{metadata.name}' is {metadata.fps:.3f} fps."
+        if metadata.frames != self.clip_frames:
+            return f"Plan is for {self.clip_frames} frames, clip '{metadata.name}' has {metadata.frames}."
+        return None
+
+    def diff(self, other):
+        """
+        Compare with a newer plan
+
+        Args:
+            other: CutPlan
+
+        Returns:
+            dict: "removed" (segments only in this plan) and "added" (segments
+                  only in other), each in timeline order
+        """
+        old, new = set(self.segments), set(other.segments)
+        return {
+            "removed": [segment for segment in self.segments if segment not in new],
+            "added": [segment for segment in other.segments if segment not in old],
+        }
+
+    def to_dict(self):
+        """JSON-ready dict (the frame rate is written as "30000/1001")"""
+        return {
+            "version": PLAN_VERSION,
+            "clip": self.clip,
+            "fps": str(self.fps),
+            "clip_frames": self.clip_frames,
+            "reverse": self.reverse,
+            "timeline_name": self.timeline_name,
+            "segments": [list(segment) for segment in self.segments],
+            "warnings": self.warnings,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a plan from to_dict() output
+
+        Raises:
+            ValueError: If the dict is not a plan of a known version
+        """
+        if data.get("version") != PLAN_VERSION:
+            raise ValueError(f"Unsupported cut plan version: {data.get('version')!r}")
+
+        return cls(
+            data["clip"],
+            Fraction(data["fps"]),
+            int(data["clip_frames"]),
+            data["segments"],
+            bool(data.get("reverse")),
+            data.get("timeline_name"),
+            data.get("warnings"),
+            data.get("error"),
+        )
+
+    def to_json(self, indent=None):
+        """Serialize to a JSON string"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    @classmethod
+    def from_json(cls, text):
+        """Rebuild a plan from to_json() output"""
+        return cls.from_dict(json.loads(text))
+
+    def __eq__(self, other):
+        return isinstance(other, CutPlan) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        state = "ok" if self.ok else "error"
+        return (f"CutPlan({self.clip!r}, {len(self.segments)} segments, "
+                f"{format_frames(self.total_frames, self.fps)}, {state})")
+
+
+def plan_cut(timecodes_text, metadata, reverse_mode=False, timer=None):
+    """
+    Plan a cut without any side effects
+
+    Args:
+        timecodes_text: Multi-line string with time ranges, or a
+                        range_import.RangeFile (EDL, CSV, SRT/VTT, chapters)
+                        read straight into frame ranges
+        metadata: ClipMetadata of the source clip; offline, any object with
+                  name, rational_fps and frames works, e.g.
+                  ClipMetadata(None, "A001.mov", Fraction(30000, 1001), 54000)
+        reverse_mode: If True, keep everything EXCEPT marked ranges
+        timer: Optional PhaseTimer for the parse/validation/merge/reverse phases
+
+    Returns:
+        CutPlan: Check plan.ok / plan.error before executing it
+    """
+    if np is not None:
+        segments, warnings, error = _plan_segments_vectorized(timecodes_text, metadata, reverse_mode, timer)
+    else:
+        segments, warnings, error = _plan_segments(timecodes_text, metadata, reverse_mode, timer)
+
+    return CutPlan(metadata.name, metadata.rational_fps, metadata.frames, segments,
+                   reverse_mode, warnings=warnings, error=error)
+
+
+def _plan_segments(timecodes_text, metadata, reverse_mode, timer=None):
+    """
+    Turn range text into sorted, validated frame segments
+
+    Args:
+        timecodes_text: Multi-line string with time ranges, or a RangeFile
+        metadata: ClipMetadata of the source clip (frame rate and length)
+        reverse_mode: If True, return the segments BETWEEN the marked ranges
+        timer: Optional PhaseTimer for the parse/validation/merge/reverse phases
+
+    Returns:
+        tuple: (segments, errors, failure) - segments is a list of
+               (in_frame, out_frame); failure is an error message or None
+    """
+    timer = timer or api_stats.PhaseTimer()
+    fps = metadata.rational_fps
+    duration_frames = metadata.frames
+
+    with timer.phase("parse"):
+        segments, errors = _parse_ranges(timecodes_text, metadata)
+
+    if not segments:
+        error_msg = "No valid time ranges found."
+        if errors:
+            error_msg += "\n\nErrors:\n" + "\n".join(errors)
+        return [], errors, error_msg
+
+    # Validate ranges against clip duration
+    with timer.phase("validation"):
+        invalid_ranges = []
+        for i, (start, end) in enumerate(segments):
+            if end > duration_frames:
+                invalid_ranges.append(f"Range {i+1}: {format_frames(start, fps)}-{format_frames(end, fps)} exceeds clip duration ({format_frames(duration_frames, fps)})")
+
+    if invalid_ranges:
+        return [], errors, "Some ranges exceed clip duration:\n" + "\n".join(invalid_ranges)
+
+    # Overlapping, duplicate or touching ranges become one segment each
+    with timer.phase("merge"):
+        merged = merge_intervals(segments)
+    if len(merged) < len(segments):
+        errors.append(f"{len(segments)} overlapping or adjacent ranges merged into {len(merged)}")
+
+    # REVERSE MODE: Keep everything the marked ranges do not cover
+    if reverse_mode:
+        with timer.phase("reverse"):
+            merged = complement_intervals(merged, 0, duration_frames)
+
+        if not merged:
+            return [], errors, "REVERSE mode: No segments to keep. The marked ranges cover the entire clip."
+
+    return merged, errors, None
+
+
+def _plan_segments_vectorized(timecodes_text, metadata, reverse_mode, timer=None):
+    """
+    NumPy version of _plan_segments() for very long range lists
+
+    Same arguments, results and messages as _plan_segments(), but parsing
+    fills frame arrays directly and sorting, validation, merging and the
+    REVERSE complement are array operations instead of per-range Python loops.
+    """
+    timer = timer or api_stats.PhaseTimer()
+    fps = metadata.rational_fps
+    duration_frames = metadata.frames
+
+    with timer.phase("parse"):
+        if isinstance(timecodes_text, str):
+            # Messages for invalid lines are collected in the same pass
+            errors = []
+            start_frames, end_frames, error_mask = parse_timecodes_array(timecodes_text, fps, errors)
+
+            valid = ~error_mask
+            start_frames = start_frames[valid]
+            end_frames = end_frames[valid]
+        else:
+            segments, errors = _parse_ranges(timecodes_text, metadata)
+            pairs = np.array(segments, dtype=np.int64).reshape(-1, 2)
+            start_frames = pairs[:, 0].copy()
+            end_frames = pairs[:, 1].copy()
+
+    if not len(start_frames):
+        error_msg = "No valid time ranges found."
+        if errors:
+            error_msg += "\n\nErrors:\n" + "\n".join(errors)
+        return [], errors, error_msg
+
+    with timer.phase("validation"):
+        # Sort by start time (stable, like list.sort)
+        order = np.argsort(start_frames, kind="stable")
+        start_frames = start_frames[order]
+        end_frames = end_frames[order]
+
+        # Validate ranges against clip duration
+        invalid = np.flatnonzero(end_frames > duration_frames)
+
+    if len(invalid):
+        invalid_ranges = [
+            f"Range {i+1}: {format_frames(start_frames[i], fps)}-{format_frames(end_frames[i], fps)} exceeds clip duration ({format_frames(duration_frames, fps)})"
+            for i in invalid.tolist()
+        ]
+        return [], errors, "Some ranges exceed clip duration:\n" + "\n".join(invalid_ranges)
+
+    # Overlapping, duplicate or touching ranges become one segment each
+    count = len(start_frames)
+    with timer.phase("merge"):
+        start_frames, end_frames = merge_interval_arrays(start_frames, end_frames)
+    if len(start_frames) < count:
+        errors.append(f"{count} overlapping or adjacent ranges merged into {len(start_frames)}")
+
+    # REVERSE MODE: Keep everything the marked ranges do not cover
+    if reverse_mode:
+        with timer.phase("reverse"):
+            start_frames, end_frames = complement_interval_arrays(start_frames, end_frames, 0, duration_frames)
+
+        if not len(start_frames):
+            return [], errors, "REVERSE mode: No segments to keep. The marked ranges cover the entire clip."
+
+    return list(zip(start_frames.tolist(), end_frames.tolist())), errors, None
+
+
+def _parse_ranges(timecodes, metadata):
+    """
+    Parse range text, or read a RangeFile, to (ranges, errors) frame lists
+
+    A RangeFile is read with the clip's frame rate, start timecode (for EDL
+    source timecode) and length (to end the last chapter of a chapter list).
+    """
+    fps = metadata.rational_fps
+    if isinstance(timecodes, str):
+        return parse_timecodes_frames(timecodes, fps)
+    return timecodes.read(fps, getattr(metadata, "start_frame", 0), metadata.frames)
+
+
+# Testing
+if __name__ == "__main__":
+    from media_pool import ClipMetadata
+
+    print("Testing cut planner:")
+    print("-" * 50)
+
+    # Planning needs no Resolve: describe the clip by hand
+    metadata = ClipMetadata(None, "Interview.mov", Fraction(30000, 1001), 30 * 60 * 30)
+    ranges = "1m57-2m08\n3m10-3m22\n3m20-3m30\n99m00-99m10"
+
+    plan = plan_cut(ranges, metadata)
+    print(plan)
+    print(f"Error: {plan.error.splitlines()[0]}")
+
+    plan = plan_cut(ranges.rsplit("\n", 1)[0], metadata)
+    print(plan)
+    print(f"Segments: {plan.segments}")
+    print(f"Warnings: {plan.warnings}")
+
+    restored = CutPlan.from_json(plan.to_json())
+    print(f"JSON round trip equal: {restored == plan} ({len(plan.to_json())} bytes)")
+
+    reverse = plan_cut(ranges.rsplit("\n", 1)[0], metadata, reverse_mode=True)
+    print(f"REVERSE: {reverse}")
+    print(f"Diff plain -> edited: {plan.diff(plan_cut('1m57-2m08', metadata))}")
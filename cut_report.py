@@ -0,0 +1,135 @@
+"""
+Cut Report for Clip Assassin Resolve
+Builds the "Mission accomplished" summary shown after a cut
+
+The report is assembled as a list of lines and joined once, and segment
+times are formatted a whole list at a time (format_frames_list()). Past
+2 * detail segments only the first and last detail ones are listed, plus
+aggregates for the rest, so a 100k-segment cut reports instantly.
+"""
+
+from time_parser import format_frames, format_frames_list
+
+# Segments listed at each end of a long report (0 lists every segment)
+DETAIL_SEGMENTS = 50
+
+# Warnings listed before the rest are only counted
+DETAIL_WARNINGS = 50
+
+
+def format_cut_summary(timeline_name, clip_name, fps, segments, warnings=(), update=None,
+                       detail=DETAIL_SEGMENTS, framerate_note=""):
+    """
+    Build the summary of a finished cut
+
+    Args:
+        timeline_name: Name of the timeline written
+        clip_name: Source clip name
+        fps: Frame rate of the clip (float, string or Fraction)
+        segments: List of (in_frame, out_frame) on the timeline, in order
+        warnings: Messages about skipped or merged ranges
+        update: Optional dict with "kept", "removed" and "added" counts of an
+                in-place timeline update
+        detail: List at most this many segments at each end (0 = all)
+        framerate_note: Text after the frame rate, e.g. " (detected)"
+
+    Returns:
+        str: Multi-line summary
+    """
+    total_frames = sum(end - start for start, end in segments)
+
+    lines = ["✓ Mission accomplished!", "", f"Timeline: {timeline_name}"]
+    if update:
+        lines.append(f"Updated in place: {update['kept']} kept, "
+                     f"{update['removed']} removed, {update['added']} added")
+    lines += [
+        f"Clip: {clip_name}",
+        f"Framerate: {float(fps):.2f} fps{framerate_note}",
+        f"Segments: {len(segments)}",
+        f"Total duration: {format_frames(total_frames, fps)}",
+        "",
+        "Segments:",
+    ]
+    lines += segment_lines(segments, fps, detail)
+
+    if warnings:
+        lines += ["", "⚠ Warnings:"]
+        lines += [f"  - {warning}" for warning in warnings[:DETAIL_WARNINGS]]
+        if len(warnings) > DETAIL_WARNINGS:
+            lines.append(f"  ... and {len(warnings) - DETAIL_WARNINGS:,} more")
+
+    return "\n".join(lines)
+
+
+def segment_lines(segments, fps, detail=DETAIL_SEGMENTS):
+    """
+    List segments as "  1. 01:57 - 02:08 (00:11)" lines
+
+    With more than 2 * detail segments, only the first and last detail are
+    listed; a line in between counts the ones left out and their duration,
+    and the shortest, longest and average segment are added at the end.
+
+    Args:
+        segments: List of (in_frame, out_frame)
+        fps: Frame rate (float, string or Fraction)
+        detail: Segments listed at each end (0 = all)
+
+    Returns:
+        list: Report lines, without newlines
+    """
+    count = len(segments)
+    if not detail or count <= 2 * detail:
+        numbers = range(1, count + 1)
+        shown = segments
+    else:
+        numbers = list(range(1, detail + 1)) + list(range(count - detail + 1, count + 1))
+        shown = list(segments[:detail]) + list(segments[-detail:])
+
+    # One list formatting call for all in, out and length fields
+    fields = format_frames_list(
+        [start for start, _ in shown] + [end for _, end in shown] + [end - start for start, end in shown], fps
+    )
+    size = len(shown)
+    lines = [
+        f"  {number}. {fields[i]} - {fields[size + i]} ({fields[2 * size + i]})"
+        for i, number in enumerate(numbers)
+    ]
+
+    if size < count:
+        hidden = segments[detail:count - detail]
+        hidden_frames = sum(end - start for start, end in hidden)
+        lines.insert(detail, f"  ... {len(hidden):,} more segments ({format_frames(hidden_frames, fps)}) ...")
+
+        lengths = [end - start for start, end in segments]
+        shortest, longest = format_frames_list([min(lengths), max(lengths)], fps)
+        average = format_frames(sum(lengths) / count, fps)
+        lines.append(f"  Shortest {shortest}, longest {longest}, average {average}")
+
+    return lines
+
+
+# Testing
+if __name__ == "__main__":
+    import time
+    from fractions import Fraction
+
+    print("Testing cut report:")
+    print("-" * 50)
+
+    fps = Fraction(30000, 1001)
+    segments = [(3506, 3836), (5694, 6294), (8002, 8484)]
+    print(format_cut_summary("Assassinated - Interview.mov", "Interview.mov", fps, segments,
+                             ["1 overlapping or adjacent ranges merged into 1"], framerate_note=" (detected)"))
+    print()
+
+    segments = [(i * 90, i * 90 + 60 + i % 30) for i in range(100000)]
+    start = time.perf_counter()
+    summary = format_cut_summary("Long", "Long.mov", fps, segments, detail=3)
+    elapsed = time.perf_counter() - start
+    print(summary)
+    print(f"\n[OK] 100,000 segments summarized in {elapsed * 1000:.1f} ms ({len(summary)} characters)")
+
+    start = time.perf_counter()
+    summary = format_cut_summary("Long", "Long.mov", fps, segments, detail=0)
+    print(f"[OK] full 100,000-segment listing in {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({len(summary.splitlines()):,} lines)")
@@ -66,6 +66,27 @@ else
     echo "[!] Could not copy time_parser.py (using built-in fallback)"
 fi
 
+sudo cp "intervals.py" "$DEST_DIR/intervals.py" 2>/dev/null
+if [ $? -eq 0 ]; then
+    echo "[OK] Copied intervals.py"
+else
+    echo "[!] Could not copy intervals.py (using built-in fallback)"
+fi
+
+sudo cp "job_log.py" "$DEST_DIR/job_log.py" 2>/dev/null
+if [ $? -eq 0 ]; then
+    echo "[OK] Copied job_log.py"
+else
+    echo "[!] Could not copy job_log.py (job log disabled)"
+fi
+
+sudo cp "cut_report.py" "$DEST_DIR/cut_report.py" 2>/dev/null
+if [ $? -eq 0 ]; then
+    echo "[OK] Copied cut_report.py"
+else
+    echo "[!] Could not copy cut_report.py (using built-in fallback)"
+fi
+
 # Set permissions
 sudo chmod +x "$DEST_DIR/clip_assassin_free.py"
 
@@ -0,0 +1,224 @@
+"""
+Interval Engine for Clip Assassin Resolve
+Normalizes, merges and combines half-open frame ranges [start, end)
+
+Every operation is a sort followed by one linear sweep, so it runs in
+O(n log n) on unsorted input and O(n) on input that is already merged.
+"""
+
+# NumPy is optional: only the *_arrays variants need it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def merge_intervals(intervals, max_gap=0):
+    """
+    Sort intervals and merge every overlapping, duplicate or touching pair
+
+    Args:
+        intervals: Iterable of (start, end) pairs, in any order
+        max_gap: Also merge across gaps of up to this many frames (gap filling)
+
+    Returns:
+        list: Minimal sorted list of disjoint (start, end) tuples
+    """
+    merged = []
+
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+
+        if merged and start - merged[-1][1] <= max_gap:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def complement_intervals(intervals, start, end):
+    """
+    Get the parts of [start, end) NOT covered by any interval
+
+    Args:
+        intervals: Iterable of (start, end) pairs, may overlap or be unsorted
+        start: Start of the enclosing range (e.g. 0)
+        end: End of the enclosing range (e.g. clip duration in frames)
+
+    Returns:
+        list: Sorted list of disjoint (start, end) gaps
+    """
+    gaps = []
+    position = start
+
+    for interval_start, interval_end in merge_intervals(intervals):
+        if interval_end <= position:
+            continue
+        if interval_start >= end:
+            break
+        if interval_start > position:
+            gaps.append((position, interval_start))
+        position = interval_end
+
+    if position < end:
+        gaps.append((position, end))
+
+    return gaps
+
+
+def intersect_intervals(first, second):
+    """
+    Get the parts covered by both interval lists
+
+    Args:
+        first: Iterable of (start, end) pairs
+        second: Iterable of (start, end) pairs
+
+    Returns:
+        list: Sorted list of disjoint (start, end) tuples
+    """
+    first = merge_intervals(first)
+    second = merge_intervals(second)
+    result = []
+    i = j = 0
+
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        if start < end:
+            result.append((start, end))
+
+        # Advance whichever interval finishes first
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+
+    return result
+
+
+def subtract_intervals(intervals, removed):
+    """
+    Get the parts of intervals NOT covered by removed
+
+    Args:
+        intervals: Iterable of (start, end) pairs to keep from
+        removed: Iterable of (start, end) pairs to cut away
+
+    Returns:
+        list: Sorted list of disjoint (start, end) tuples
+    """
+    removed = merge_intervals(removed)
+    result = []
+    j = 0
+
+    for start, end in merge_intervals(intervals):
+        # Skip removed intervals that end before this one starts
+        while j < len(removed) and removed[j][1] <= start:
+            j += 1
+
+        k = j
+        while k < len(removed) and removed[k][0] < end:
+            if removed[k][0] > start:
+                result.append((start, removed[k][0]))
+            start = max(start, removed[k][1])
+            k += 1
+
+        if start < end:
+            result.append((start, end))
+
+    return result
+
+
+def merge_interval_arrays(starts, ends, max_gap=0):
+    """
+    NumPy version of merge_intervals() for very long interval lists
+
+    Args:
+        starts: Array of interval starts
+        ends: Array of interval ends (same length)
+        max_gap: Also merge across gaps of up to this many frames
+
+    Returns:
+        tuple: (starts, ends) int64 arrays of minimal, sorted, disjoint intervals
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("NumPy is required for merge_interval_arrays()")
+
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+
+    keep = ends > starts
+    starts = starts[keep]
+    ends = ends[keep]
+    if not len(starts):
+        return starts, ends
+
+    order = np.lexsort((ends, starts))
+    starts = starts[order]
+    ends = ends[order]
+
+    # A new group starts wherever the gap to the furthest end so far exceeds max_gap
+    reach = np.maximum.accumulate(ends)
+    new_group = np.empty(len(starts), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = starts[1:] - reach[:-1] > max_gap
+
+    group_starts = np.flatnonzero(new_group)
+    group_ends = np.append(group_starts[1:], len(starts)) - 1
+
+    return starts[group_starts], reach[group_ends]
+
+
+def complement_interval_arrays(starts, ends, start, end):
+    """
+    NumPy version of complement_intervals() for very long interval lists
+
+    Args:
+        starts: Array of interval starts
+        ends: Array of interval ends (same length)
+        start: Start of the enclosing range
+        end: End of the enclosing range
+
+    Returns:
+        tuple: (starts, ends) int64 arrays of the sorted, disjoint gaps
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    starts, ends = merge_interval_arrays(starts, ends)
+    starts = np.clip(starts, start, end)
+    ends = np.clip(ends, start, end)
+
+    gap_starts = np.concatenate(([start], ends))
+    gap_ends = np.concatenate((starts, [end]))
+    keep = gap_starts < gap_ends
+
+    return gap_starts[keep], gap_ends[keep]
+
+
+# Testing
+if __name__ == "__main__":
+    print("Testing interval engine:")
+    print("-" * 50)
+
+    marks = [(50, 60), (0, 10), (5, 20), (20, 30), (55, 58), (40, 45)]
+    print(f"Input:      {marks}")
+    print(f"Merged:     {merge_intervals(marks)}")
+    print(f"Gap <= 10:  {merge_intervals(marks, max_gap=10)}")
+    print(f"Complement: {complement_intervals(marks, 0, 100)}")
+    print(f"Intersect:  {intersect_intervals(marks, [(8, 42), (57, 70)])}")
+    print(f"Subtract:   {subtract_intervals([(0, 100)], marks)}")
+
+    if np is not None:
+        starts, ends = zip(*marks)
+        merged_starts, merged_ends = merge_interval_arrays(starts, ends)
+        gap_starts, gap_ends = complement_interval_arrays(starts, ends, 0, 100)
+        print(f"Arrays:     {list(zip(merged_starts.tolist(), merged_ends.tolist()))}"
+              f" / {list(zip(gap_starts.tolist(), gap_ends.tolist()))}")
@@ -0,0 +1,133 @@
+"""
+Job Log for Clip Assassin Resolve
+Appends one JSON line per cutting job to a rotating local log
+
+Lines are handed to a background thread (logging.handlers.QueueListener), so
+the thread running the cut never waits on the disk. The log rotates at
+MAX_BYTES and keeps BACKUP_COUNT old files.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import platform
+import queue
+import time
+
+# Profiles and job logs
+LOG_DIR = os.path.join(os.path.expanduser("~"), ".clip_assassin", "logs")
+
+# Set to "0" to disable the job log, or to a file path to log there instead
+JOB_LOG_ENV = "CLIP_ASSASSIN_JOB_LOG"
+
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+
+
+class JobLog:
+    """Rotating JSON-lines file written by a background thread"""
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        """
+        Args:
+            path: Log file, e.g. LOG_DIR/jobs.jsonl
+            max_bytes: Rotate once the file would grow beyond this size
+            backup_count: Number of rotated files to keep (jobs.jsonl.1 ...)
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+
+        self._handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+        self._queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, self._handler)
+        self._listener.start()
+
+    def write(self, record):
+        """
+        Queue one job record; returns immediately
+
+        Args:
+            record: JSON-serializable dict (a "time" and "host" field are added)
+        """
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "host": platform.node(), **record}
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        self._queue.put(logging.makeLogRecord({"msg": line, "levelno": logging.INFO, "levelname": "INFO"}))
+
+    def close(self):
+        """Write out all queued records and close the file"""
+        self._listener.stop()
+        self._handler.close()
+
+
+_job_log = None
+
+
+def get_job_log():
+    """
+    Get the shared job log, creating it on first use
+
+    Returns:
+        JobLog or None: None if disabled via CLIP_ASSASSIN_JOB_LOG=0 or if
+                        the log directory cannot be created
+    """
+    global _job_log
+
+    if _job_log is None:
+        setting = os.environ.get(JOB_LOG_ENV, "").strip()
+        if setting.lower() in ("0", "off", "false", "no"):
+            return None
+
+        try:
+            _job_log = JobLog(setting or os.path.join(LOG_DIR, "jobs.jsonl"))
+        except OSError:
+            return None
+        atexit.register(_job_log.close)
+
+    return _job_log
+
+
+def log_job(record):
+    """
+    Append one job record to the shared job log
+
+    Never raises: a broken log must not fail a cut.
+
+    Args:
+        record: JSON-serializable dict describing the job
+    """
+    try:
+        job_log = get_job_log()
+        if job_log:
+            job_log.write(record)
+    except Exception:
+        pass
+
+
+# Testing
+if __name__ == "__main__":
+    import tempfile
+
+    print("Testing job log:")
+    print("-" * 50)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "jobs.jsonl")
+        job_log = JobLog(path, max_bytes=2000, backup_count=2)
+
+        start = time.perf_counter()
+        for i in range(50):
+            job_log.write({"version": "core", "clip": f"clip{i}.mov", "segments": i, "outcome": "success"})
+        queued = time.perf_counter() - start
+        job_log.close()
+
+        files = sorted(os.listdir(temp_dir))
+        print(f"Queued 50 records in {queued * 1000:.2f} ms")
+        print(f"Files after rotation: {files}")
+        with open(path, encoding="utf-8") as f:
+            print(f"Last record: {f.readlines()[-1].strip()}")
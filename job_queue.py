@@ -0,0 +1,234 @@
+"""
+Job Queue for Clip Assassin Resolve
+Runs Resolve jobs one at a time on a single dedicated worker thread
+
+The Resolve scripting API is not safe to use from several threads at once;
+routing every connect and cut through one JobQueue guarantees that only its
+worker thread ever talks to Resolve, while the GUI stays free to queue more.
+"""
+
+import threading
+from collections import deque
+
+
+class JobCancelled(Exception):
+    """Passed to on_done as the error of a job cancelled before it started"""
+
+
+class JobQueue:
+    """FIFO of jobs executed by one worker thread"""
+
+    def __init__(self, on_change=None):
+        """
+        Args:
+            on_change: Optional callback() run (on the worker thread or the
+                       caller's thread) whenever jobs are added, started,
+                       finished or cancelled
+        """
+        self.on_change = on_change
+
+        self._jobs = deque()       # pending (job_id, label, func, on_done)
+        self._running = None       # (job_id, label) of the job being run
+        self._next_id = 1
+        self._stopping = False
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(target=self._run, name="resolve-worker", daemon=True)
+        self._thread.start()
+
+    def reserve_id(self):
+        """
+        Allocate a job id ahead of submit()
+
+        Lets the caller register per-job state under the id before the job
+        can start (and finish) on the worker thread.
+
+        Returns:
+            int: Job id to pass to submit()
+        """
+        with self._condition:
+            job_id = self._next_id
+            self._next_id += 1
+            return job_id
+
+    def submit(self, label, func, on_done=None, job_id=None):
+        """
+        Queue a job
+
+        Args:
+            label: Short description shown in the UI
+            func: Callable run on the worker thread, without arguments
+            on_done: Optional callback(result, error) run on the worker
+                     thread; error is the exception func raised, or None.
+                     If the job is cancelled before it starts, on_done is
+                     called with (None, JobCancelled) on the cancelling thread
+            job_id: Id from reserve_id() (default: a new one)
+
+        Returns:
+            int: Job id (for cancel())
+        """
+        if job_id is None:
+            job_id = self.reserve_id()
+
+        with self._condition:
+            self._jobs.append((job_id, label, func, on_done))
+            self._condition.notify()
+
+        self._changed()
+        return job_id
+
+    def cancel(self, job_id):
+        """
+        Remove a job that has not started yet
+
+        Its on_done callback is called with a JobCancelled error.
+
+        Args:
+            job_id: Id returned by submit()
+
+        Returns:
+            bool: True if the job was still queued and is now cancelled
+        """
+        with self._condition:
+            for job in self._jobs:
+                if job[0] == job_id:
+                    self._jobs.remove(job)
+                    break
+            else:
+                return False
+
+        self._cancelled([job])
+        self._changed()
+        return True
+
+    def cancel_pending(self):
+        """
+        Remove every job that has not started yet (see cancel())
+
+        Returns:
+            int: Number of jobs cancelled
+        """
+        with self._condition:
+            jobs = list(self._jobs)
+            self._jobs.clear()
+
+        self._cancelled(jobs)
+        if jobs:
+            self._changed()
+        return len(jobs)
+
+    def snapshot(self):
+        """
+        Get the current state of the queue
+
+        Returns:
+            tuple: (running, pending) - running is (job_id, label) or None,
+                   pending is a list of (job_id, label) in execution order
+        """
+        with self._condition:
+            return self._running, [(job[0], job[1]) for job in self._jobs]
+
+    @property
+    def depth(self):
+        """Number of queued jobs, including the one running"""
+        with self._condition:
+            return len(self._jobs) + (self._running is not None)
+
+    def stop(self, timeout=None):
+        """
+        Drop pending jobs (see cancel()) and stop the worker after the running job
+
+        Args:
+            timeout: Seconds to wait for the worker to finish (None = don't wait)
+        """
+        with self._condition:
+            self._stopping = True
+            jobs = list(self._jobs)
+            self._jobs.clear()
+            self._condition.notify()
+
+        self._cancelled(jobs)
+        if timeout is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        """Worker thread: run jobs in order until stopped"""
+        while True:
+            with self._condition:
+                while not self._jobs and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                job_id, label, func, on_done = self._jobs.popleft()
+                self._running = (job_id, label)
+
+            self._changed()
+
+            result = error = None
+            try:
+                result = func()
+            except Exception as e:
+                error = e
+
+            if on_done:
+                try:
+                    on_done(result, error)
+                except Exception:
+                    pass
+
+            with self._condition:
+                self._running = None
+
+            self._changed()
+
+    def _cancelled(self, jobs):
+        """Report removed jobs to their on_done callbacks"""
+        for job_id, label, func, on_done in jobs:
+            if on_done:
+                try:
+                    on_done(None, JobCancelled(f"{label} was cancelled before it started"))
+                except Exception:
+                    pass
+
+    def _changed(self):
+        """Notify the on_change callback"""
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception:
+                pass
+
+
+# Testing
+if __name__ == "__main__":
+    import time
+
+    print("Testing job queue:")
+    print("-" * 50)
+
+    threads = set()
+    done = []
+
+    def job(name):
+        def run():
+            threads.add(threading.current_thread().name)
+            time.sleep(0.02)
+            return name
+        return run
+
+    queue = JobQueue()
+    ids = [queue.submit(f"cut {i}", job(f"cut {i}"),
+                        lambda result, error: done.append(result if error is None else type(error).__name__))
+           for i in range(5)]
+
+    time.sleep(0.005)
+    running, pending = queue.snapshot()
+    print(f"Running: {running}, queued: {[label for _, label in pending]}")
+    print(f"Cancel 'cut 3': {queue.cancel(ids[3])}, cancel running 'cut 0': {queue.cancel(ids[0])}")
+
+    while queue.depth:
+        time.sleep(0.01)
+    queue.stop(timeout=1)
+
+    print(f"Finished in order: {done}")
+    print(f"Worker threads used: {threads}")
@@ -0,0 +1,621 @@
+"""
+Media Pool Traversal for Clip Assassin Resolve
+Walks bins breadth-first and yields clips lazily
+
+Every Resolve API call is an IPC round-trip, so the traversal asks for as
+little as possible: one GetClipList() per visited bin, GetSubFolderList()
+only once a bin's clips are exhausted, and single-key GetClipProperty()
+lookups instead of the full property dict.
+
+MediaPoolIndex keeps a per-project lookup table (name, file path, unique
+ID -> clip) in a JSON sidecar file, so choosing a source clip by name does
+not walk the pool on every run.
+"""
+
+import fnmatch
+import json
+import os
+import re
+from collections import deque
+
+from time_parser import rational_framerate, parse_time_frames
+
+# Sidecar files of MediaPoolIndex, one per project
+INDEX_DIR = os.path.join(os.path.expanduser("~"), ".clip_assassin", "media_pool_index")
+INDEX_VERSION = 1
+
+
+def split_bin_path(bin_path):
+    """
+    Split a bin path like "Master/Footage/Day 1" into its bin names
+
+    Args:
+        bin_path: Bins separated by "/" (or "\\"); the leading root bin
+                  ("Master") may be omitted
+
+    Returns:
+        list: Bin names below the root folder
+    """
+    if not bin_path:
+        return []
+    return [part.strip() for part in bin_path.replace("\\", "/").split("/") if part.strip()]
+
+
+def find_folder(root_folder, bin_path):
+    """
+    Find the bin at bin_path below root_folder
+
+    Args:
+        root_folder: Media Pool root Folder
+        bin_path: Bin path, e.g. "Footage/Day 1" (see split_bin_path())
+
+    Returns:
+        Folder or None: The bin, or None if any part of the path is missing
+    """
+    names = split_bin_path(bin_path)
+
+    # Allow the path to start at the root bin itself
+    if names and names[0] == root_folder.GetName():
+        names = names[1:]
+
+    folder = root_folder
+    for name in names:
+        for subfolder in folder.GetSubFolderList() or []:
+            if subfolder.GetName() == name:
+                folder = subfolder
+                break
+        else:
+            return None
+
+    return folder
+
+
+def iter_folders(root_folder, bin_path=None):
+    """
+    Yield bins breadth-first, starting at root_folder (or bin_path below it)
+
+    Subfolders of a bin are only requested once the caller moves past it,
+    so stopping early skips the rest of the tree.
+
+    Args:
+        root_folder: Media Pool root Folder
+        bin_path: Optional bin path to restrict the walk to (see find_folder())
+
+    Yields:
+        Folder: Each bin, shallowest first
+    """
+    if bin_path:
+        root_folder = find_folder(root_folder, bin_path)
+        if root_folder is None:
+            return
+
+    queue = deque([root_folder])
+    while queue:
+        folder = queue.popleft()
+        yield folder
+        queue.extend(folder.GetSubFolderList() or [])
+
+
+def iter_clips(root_folder, bin_path=None):
+    """
+    Yield every clip breadth-first: all clips of a bin before its subbins
+
+    Args:
+        root_folder: Media Pool root Folder
+        bin_path: Optional bin path to restrict the walk to (see find_folder())
+
+    Yields:
+        MediaPoolItem: Each clip in traversal order
+    """
+    for folder in iter_folders(root_folder, bin_path):
+        yield from folder.GetClipList() or []
+
+
+def is_video_clip(clip):
+    """
+    Check whether a clip has a video stream (fetches only "Video Codec")
+
+    Args:
+        clip: MediaPoolItem
+
+    Returns:
+        bool: True if the clip reports a video codec
+    """
+    return bool(clip.GetClipProperty("Video Codec"))
+
+
+def iter_video_clips(root_folder, bin_path=None):
+    """
+    Yield video clips breadth-first
+
+    Args:
+        root_folder: Media Pool root Folder
+        bin_path: Optional bin path to restrict the walk to (see find_folder())
+
+    Yields:
+        MediaPoolItem: Each clip with a video stream
+    """
+    for clip in iter_clips(root_folder, bin_path):
+        if is_video_clip(clip):
+            yield clip
+
+
+def find_first_video_clip(root_folder, bin_path=None):
+    """
+    Find the shallowest video clip, stopping at the first match
+
+    Args:
+        root_folder: Media Pool root Folder
+        bin_path: Optional bin path to restrict the search to
+
+    Returns:
+        MediaPoolItem or None
+    """
+    return next(iter_video_clips(root_folder, bin_path), None)
+
+
+class ClipMetadata:
+    """
+    Immutable snapshot of the clip properties cut_video() needs
+
+    Built from a single GetClipProperty() call, so one cutting run reads the
+    source clip's properties only once.
+    """
+
+    __slots__ = ("clip", "name", "fps", "rational_fps", "frames", "duration", "resolution", "codec",
+                 "file_path", "start_frame", "drop_frame")
+
+    def __init__(self, clip, name, rational_fps, frames, resolution="", codec="",
+                 file_path="", start_frame=0, drop_frame=False):
+        """
+        Args:
+            clip: The MediaPoolItem described
+            name: Clip name
+            rational_fps: Exact frame rate (Fraction, see rational_framerate())
+            frames: Clip length in frames
+            resolution: e.g. "1920x1080"
+            codec: Video codec, empty for audio-only clips
+            file_path: Media file on disk
+            start_frame: Source timecode of the first frame, as a frame
+                         number (e.g. 108000 for 01:00:00:00 at 30 fps,
+                         107892 for 01:00:00;00 drop-frame at 29.97)
+            drop_frame: True if the clip's timecode is drop-frame
+        """
+        set_slot = super().__setattr__
+        set_slot("clip", clip)
+        set_slot("name", name)
+        set_slot("rational_fps", rational_fps)
+        set_slot("fps", float(rational_fps))
+        set_slot("frames", frames)
+        set_slot("duration", float(frames / rational_fps))
+        set_slot("resolution", resolution)
+        set_slot("codec", codec)
+        set_slot("file_path", file_path)
+        set_slot("start_frame", start_frame)
+        set_slot("drop_frame", drop_frame)
+
+    @classmethod
+    def from_clip(cls, clip):
+        """
+        Read a clip's metadata with one GetClipProperty() call
+
+        Missing or unreadable FPS falls back to 30 fps, missing Frames and
+        Start TC to 0.
+
+        Args:
+            clip: MediaPoolItem
+
+        Returns:
+            ClipMetadata
+        """
+        properties = clip.GetClipProperty() or {}
+
+        try:
+            fps = rational_framerate(properties.get("FPS") or 30)
+        except (TypeError, ValueError):
+            fps = rational_framerate(30)
+
+        try:
+            frames = int(properties.get("Frames") or 0)
+        except (TypeError, ValueError):
+            frames = 0
+
+        start_tc = properties.get("Start TC") or ""
+        start_frame = parse_time_frames(start_tc, fps) or 0
+
+        return cls(
+            clip,
+            clip.GetName(),
+            fps,
+            frames,
+            properties.get("Resolution", ""),
+            properties.get("Video Codec", ""),
+            properties.get("File Path", ""),
+            start_frame,
+            ";" in start_tc,
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ClipMetadata is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ClipMetadata is immutable")
+
+    def __repr__(self):
+        return (f"ClipMetadata({self.name!r}, {self.fps:.3f} fps, {self.frames} frames, "
+                f"{self.resolution or '?'}, {self.codec or 'no video'})")
+
+
+def iter_bins(root_folder):
+    """
+    Yield (bin_path, folder) pairs breadth-first
+
+    Args:
+        root_folder: Media Pool root Folder
+
+    Yields:
+        tuple: (bin_path, folder) - bin_path is "" for the root bin,
+               otherwise e.g. "Footage/Day 1"
+    """
+    queue = deque([("", root_folder)])
+    while queue:
+        bin_path, folder = queue.popleft()
+        yield bin_path, folder
+        for subfolder in folder.GetSubFolderList() or []:
+            name = subfolder.GetName()
+            queue.append((f"{bin_path}/{name}" if bin_path else name, subfolder))
+
+
+def _clip_id(clip):
+    """Get the most stable identifier Resolve offers for a clip"""
+    for method in ("GetUniqueId", "GetMediaId"):
+        getter = getattr(clip, method, None)
+        if getter:
+            try:
+                value = getter()
+            except Exception:
+                continue
+            if value:
+                return str(value)
+    return None
+
+
+class MediaPoolIndex:
+    """
+    Clip lookup table for one project, persisted in a JSON sidecar file
+
+    Maps unique ID, file path and clip name to the clip, together with its
+    cached FPS, frame count and codec. refresh() only re-reads bins whose clip
+    count or clip names changed since the last refresh; lookups are dict hits,
+    and the MediaPoolItem for a cached entry is resolved with a couple of API calls.
+    """
+
+    def __init__(self, media_pool, project_key, path=None):
+        """
+        Args:
+            media_pool: Resolve MediaPool
+            project_key: Identifies the project (used for the sidecar file name)
+            path: Sidecar file (default: INDEX_DIR/<project_key>.json)
+        """
+        self.media_pool = media_pool
+        self.project_key = project_key
+        self.path = path or os.path.join(INDEX_DIR, re.sub(r"[^\w.-]+", "_", project_key) + ".json")
+
+        self.entries = {}        # clip id -> {"name", "file_path", "fps", "frames", "codec", "bin", "position"}
+        self.folder_counts = {}  # bin path -> clip count at last refresh
+
+        self._by_name = {}       # clip name -> [clip id]
+        self._by_file = {}       # file path -> clip id
+        self._by_bin = {}        # bin path -> [clip id] in bin order
+        self._items = {}         # clip id -> MediaPoolItem (this session only)
+
+    def rebind(self, media_pool):
+        """
+        Use a new MediaPool handle (after a reconnect), keeping the entries
+
+        Args:
+            media_pool: Resolve MediaPool of the same project
+        """
+        self.media_pool = media_pool
+        self._items = {}
+
+    def load(self):
+        """
+        Load the sidecar file
+
+        Returns:
+            bool: True if a usable index for this project was loaded
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != INDEX_VERSION or data.get("project") != self.project_key:
+            return False
+
+        self.entries = data.get("entries", {})
+        self.folder_counts = data.get("folder_counts", {})
+        self._rebuild_lookups()
+        return True
+
+    def save(self):
+        """Write the sidecar file (atomically replacing the old one)"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "project": self.project_key,
+            "folder_counts": self.folder_counts,
+            "entries": self.entries,
+        }
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def refresh(self):
+        """
+        Bring the index up to date with the Media Pool and save it
+
+        Every bin is listed once; clip properties are only read for bins
+        whose clip count or clip names differ from the last refresh.
+
+        Returns:
+            int: Number of bins that were re-read
+        """
+        reread = 0
+        seen_bins = set()
+
+        for bin_path, folder in iter_bins(self.media_pool.GetRootFolder()):
+            seen_bins.add(bin_path)
+            clips = folder.GetClipList() or []
+            cached_ids = self._by_bin.get(bin_path, [])
+
+            # Same count and the same names in the same places: the bin is unchanged
+            if (self.folder_counts.get(bin_path) == len(clips) and len(cached_ids) == len(clips)
+                    and all(clip.GetName() == self.entries[clip_id]["name"]
+                            for clip_id, clip in zip(cached_ids, clips))):
+                self._items.update(zip(cached_ids, clips))
+                continue
+
+            # Bin changed (or clips were swapped): forget its old entries and read its clips again
+            for clip_id in cached_ids:
+                self.entries.pop(clip_id, None)
+                self._items.pop(clip_id, None)
+
+            for position, clip in enumerate(clips):
+                clip_id, entry = self._read_clip(clip, bin_path, position)
+                self.entries[clip_id] = entry
+                self._items[clip_id] = clip
+
+            self.folder_counts[bin_path] = len(clips)
+            reread += 1
+
+        # Drop bins that no longer exist
+        for bin_path in set(self.folder_counts) - seen_bins:
+            del self.folder_counts[bin_path]
+            for clip_id in self._by_bin.get(bin_path, []):
+                self.entries.pop(clip_id, None)
+                self._items.pop(clip_id, None)
+
+        self._rebuild_lookups()
+        self.save()
+        return reread
+
+    def lookup(self, key):
+        """
+        Find a clip id by unique ID, file path or exact clip name
+
+        Args:
+            key: Unique ID, file path or clip name
+
+        Returns:
+            str or None: Clip id
+        """
+        if key in self.entries:
+            return key
+        if key in self._by_file:
+            return self._by_file[key]
+        ids = self._by_name.get(key)
+        return ids[0] if ids else None
+
+    def find(self, pattern):
+        """
+        Find clip ids by exact key or by glob pattern (e.g. "A0*_day1*.mov")
+
+        Globs match the clip name or the file name, case-insensitively.
+
+        Args:
+            pattern: Unique ID, file path, clip name or glob
+
+        Returns:
+            list: Matching clip ids, shallowest bin first
+        """
+        clip_id = self.lookup(pattern)
+        if clip_id:
+            return [clip_id]
+
+        if not any(char in pattern for char in "*?["):
+            return []
+
+        pattern = pattern.lower()
+        matches = [
+            clip_id for clip_id, entry in self.entries.items()
+            if fnmatch.fnmatchcase(entry["name"].lower(), pattern)
+            or fnmatch.fnmatchcase(os.path.basename(entry["file_path"]).lower(), pattern)
+        ]
+        matches.sort(key=self._sort_key)
+        return matches
+
+    def get_item(self, clip_id):
+        """
+        Get the MediaPoolItem for a clip id
+
+        Args:
+            clip_id: Id returned by lookup() or find()
+
+        Returns:
+            MediaPoolItem or None: None if the clip is no longer where the index says
+        """
+        if clip_id in self._items:
+            return self._items[clip_id]
+
+        entry = self.entries.get(clip_id)
+        if not entry:
+            return None
+
+        folder = find_folder(self.media_pool.GetRootFolder(), entry["bin"])
+        clips = (folder.GetClipList() or []) if folder else []
+        if entry["position"] < len(clips):
+            clip = clips[entry["position"]]
+            if clip.GetName() == entry["name"]:
+                self._items[clip_id] = clip
+                return clip
+
+        return None
+
+    def select(self, pattern, video_only=True):
+        """
+        Get the first clip matching pattern, refreshing the index once on a miss
+
+        Args:
+            pattern: Unique ID, file path, clip name or glob (see find())
+            video_only: Skip clips without a video codec
+
+        Returns:
+            MediaPoolItem or None
+        """
+        for attempt in range(2):
+            for clip_id in self.find(pattern):
+                if video_only and not self.entries[clip_id]["codec"]:
+                    continue
+                clip = self.get_item(clip_id)
+                if clip:
+                    return clip
+
+            if attempt == 0:
+                self.refresh()
+
+        return None
+
+    def _read_clip(self, clip, bin_path, position):
+        """Read the indexed properties of one clip (one GetClipProperty() call)"""
+        properties = clip.GetClipProperty() or {}
+        name = clip.GetName()
+        clip_id = _clip_id(clip) or f"{bin_path}/{position}/{name}"
+        return clip_id, {
+            "name": name,
+            "file_path": properties.get("File Path", ""),
+            "fps": properties.get("FPS", ""),
+            "frames": properties.get("Frames", ""),
+            "codec": properties.get("Video Codec", ""),
+            "bin": bin_path,
+            "position": position,
+        }
+
+    def _sort_key(self, clip_id):
+        """Order clips like the breadth-first walk: by bin depth, bin, position"""
+        entry = self.entries[clip_id]
+        depth = entry["bin"].count("/") + 1 if entry["bin"] else 0
+        return depth, entry["bin"], entry["position"]
+
+    def _rebuild_lookups(self):
+        """Rebuild the name, file path and bin lookups from entries"""
+        self._by_name = {}
+        self._by_file = {}
+        self._by_bin = {}
+
+        for clip_id, entry in self.entries.items():
+            self._by_name.setdefault(entry["name"], []).append(clip_id)
+            if entry["file_path"]:
+                self._by_file.setdefault(entry["file_path"], clip_id)
+            self._by_bin.setdefault(entry["bin"], []).append(clip_id)
+
+        for ids in self._by_bin.values():
+            ids.sort(key=lambda clip_id: self.entries[clip_id]["position"])
+
+
+# Testing
+if __name__ == "__main__":
+    class _Clip:
+        def __init__(self, name, codec):
+            self.name = name
+            self.codec = codec
+
+        def GetName(self):
+            return self.name
+
+        def GetUniqueId(self):
+            return f"id-{self.name}"
+
+        def GetClipProperty(self, key=None):
+            properties = {"Video Codec": self.codec, "File Path": f"/media/{self.name}",
+                          "FPS": "25", "Frames": "1500"}
+            return properties if key is None else properties.get(key, "")
+
+    class _Folder:
+        calls = 0
+
+        def __init__(self, name, clips=(), subfolders=()):
+            self.name = name
+            self.clips = list(clips)
+            self.subfolders = list(subfolders)
+
+        def GetName(self):
+            return self.name
+
+        def GetClipList(self):
+            _Folder.calls += 1
+            return self.clips
+
+        def GetSubFolderList(self):
+            _Folder.calls += 1
+            return self.subfolders
+
+    day1 = _Folder("Day 1", [_Clip("A001.mov", "ProRes"), _Clip("A002.mov", "ProRes")])
+    deep = _Folder("Deep", [_Clip("deep.mp4", "H.264")], [_Folder(f"Bin {i}") for i in range(1000)])
+    footage = _Folder("Footage", [], [deep, day1])
+    audio = _Folder("Audio", [_Clip("music.wav", "")])
+    root = _Folder("Master", [_Clip("music2.wav", "")], [audio, footage])
+
+    print("Testing media pool traversal:")
+    print("-" * 50)
+    print(f"Bins (BFS):   {[folder.GetName() for folder in iter_folders(root)][:5]} ...")
+
+    _Folder.calls = 0
+    clip = find_first_video_clip(root)
+    print(f"First video:  {clip.GetName()} ({_Folder.calls} folder calls)")
+
+    clip = find_first_video_clip(root, "Master/Footage/Day 1")
+    print(f"In Day 1:     {clip.GetName()}")
+    print(f"Missing bin:  {find_first_video_clip(root, 'Footage/Day 9')}")
+
+    import tempfile
+
+    class _MediaPool:
+        def GetRootFolder(self):
+            return root
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sidecar = os.path.join(temp_dir, "index.json")
+        index = MediaPoolIndex(_MediaPool(), "Demo Project", sidecar)
+        print(f"Index load:   {index.load()} (no sidecar yet)")
+        print(f"Refresh:      {index.refresh()} bins read, {len(index.entries)} clips")
+
+        day1.clips.append(_Clip("A003.mov", "ProRes"))
+        print(f"Refresh:      {index.refresh()} bin(s) re-read after adding a clip")
+
+        day1.clips[0] = _Clip("A004.mov", "ProRes")
+        print(f"Refresh:      {index.refresh()} bin(s) re-read after replacing a clip")
+
+        index = MediaPoolIndex(_MediaPool(), "Demo Project", sidecar)
+        print(f"Index load:   {index.load()} ({len(index.entries)} clips)")
+        print(f"By name:      {index.select('A002.mov').GetName()}")
+        print(f"By path:      {index.select('/media/deep.mp4').GetName()}")
+        print(f"By glob:      {[index.entries[i]['name'] for i in index.find('a00[13]*')]}")
+        print(f"Video only:   {index.select('music*')}")
+
+    metadata = ClipMetadata.from_clip(day1.clips[0])
+    print(f"Metadata:     {metadata}, {metadata.duration:.1f}s")
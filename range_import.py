@@ -0,0 +1,505 @@
+"""
+Range Import for Clip Assassin Resolve
+Reads cut ranges from files other tools export: CMX3600 EDLs, CSV sheets,
+SRT/VTT subtitles and YouTube-style chapter lists
+
+Every importer streams its source one line at a time and yields the same
+((start_frame, end_frame), None) / (None, error_message) pairs as
+parse_timecodes_iter(), so thousands of cues become frame ranges without
+ever being rendered into range text and parsed again.
+"""
+
+import csv
+import os
+import re
+
+from time_parser import parse_time_frames, parse_time_range_frames, parse_timecodes_iter, rational_framerate
+
+# Formats understood by iter_ranges(); "ranges" is the plain "start-end" text
+IMPORT_FORMATS = ("ranges", "edl", "csv", "srt", "vtt", "chapters")
+
+# File extension -> format (anything else is sniffed, see guess_format())
+FORMAT_EXTENSIONS = {
+    ".edl": "edl",
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".srt": "srt",
+    ".vtt": "vtt",
+}
+
+# CSV header names, in order of preference (compared lower-case, without spaces/_/-)
+CSV_START_COLUMNS = ("start", "in", "starttime", "starttc", "sourcein", "srcin", "begin", "from", "timecodein")
+CSV_END_COLUMNS = ("end", "out", "endtime", "endtc", "sourceout", "srcout", "stop", "to", "timecodeout")
+CSV_DURATION_COLUMNS = ("duration", "length", "dur")
+
+# "0:00 Intro", "- 1:02:03 - Part 2", "(12:30) Outro", "3. 4:05 | Q&A"
+CHAPTER_PATTERN = re.compile(
+    r"^\s*(?:\d+[.)]\s+)?(?:[-*•]\s*)?[(\[]?(\d{1,2}(?::\d{1,2}){1,2})[)\]]?(?:\s+|\s*[-–—:|]\s*|$)(.*)$"
+)
+
+
+def iter_ranges(source, framerate=30.0, import_format=None, start_frame=0, end_frame=None):
+    """
+    Stream frame ranges out of a range, EDL, CSV, subtitle or chapter file
+
+    Args:
+        source: Path, open file object or iterable of lines
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+        import_format: One of IMPORT_FORMATS (default: guess_format() for a
+                       path, "ranges" otherwise)
+        start_frame: Source timecode of the clip's first frame as a frame
+                     number (ClipMetadata.start_frame); only EDL events
+                     carry absolute source timecode and are shifted by it
+        end_frame: Clip length in frames; ends the last chapter of a chapter list
+
+    Yields:
+        tuple: ((start_frame, end_frame), None) for a valid entry,
+               (None, error_message) for an invalid one, in file order
+
+    Raises:
+        ValueError: If the format is not one of IMPORT_FORMATS
+    """
+    if import_format is None:
+        import_format = guess_format(source) if isinstance(source, (str, os.PathLike)) else "ranges"
+
+    if import_format == "ranges":
+        return parse_timecodes_iter(source, framerate)
+    if import_format == "edl":
+        return iter_edl_ranges(source, framerate, start_frame)
+    if import_format == "csv":
+        return iter_csv_ranges(source, framerate)
+    if import_format in ("srt", "vtt"):
+        return iter_subtitle_ranges(source, framerate)
+    if import_format == "chapters":
+        return iter_chapter_ranges(source, framerate, end_frame)
+
+    raise ValueError(f"Unknown range format: {import_format!r} (use one of {', '.join(IMPORT_FORMATS)})")
+
+
+def read_ranges(source, framerate=30.0, import_format=None, start_frame=0, end_frame=None):
+    """
+    Read all ranges of a file, like parse_timecodes_frames() does for text
+
+    Args:
+        source, framerate, import_format, start_frame, end_frame: As for iter_ranges()
+
+    Returns:
+        tuple: (ranges, errors) - ranges is a list of (start_frame, end_frame)
+               sorted by start, errors a list of messages for invalid entries
+    """
+    ranges = []
+    errors = []
+    for parsed, error in iter_ranges(source, framerate, import_format, start_frame, end_frame):
+        if parsed:
+            ranges.append(parsed)
+        else:
+            errors.append(error)
+
+    # Sort by start frame
+    ranges.sort(key=lambda x: x[0])
+
+    return ranges, errors
+
+
+def guess_format(path):
+    """
+    Pick the import format of a file
+
+    The extension decides for .edl/.csv/.tsv/.srt/.vtt. Other files are
+    sniffed: a "WEBVTT" header, an SRT cue arrow or a chapter line
+    ("0:00 Intro") win over plain "start-end" ranges.
+
+    Args:
+        path: File path
+
+    Returns:
+        str: One of IMPORT_FORMATS
+    """
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension in FORMAT_EXTENSIONS:
+        return FORMAT_EXTENSIONS[extension]
+
+    try:
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+            for line, _ in zip(f, range(50)):
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith("WEBVTT"):
+                    return "vtt"
+                if "-->" in line:
+                    return "srt"
+                if line.startswith(("TITLE:", "FCM:")):
+                    return "edl"
+                if parse_time_range_frames(line, 30) is not None:
+                    return "ranges"
+                if CHAPTER_PATTERN.match(line):
+                    return "chapters"
+    except OSError:
+        pass
+
+    return "ranges"
+
+
+def iter_edl_ranges(source, framerate=30.0, start_frame=0, reel=None):
+    """
+    Stream the source in/out points of the video events of a CMX3600 EDL
+
+    Event lines look like
+        001  AX       V     C        01:00:10:00 01:00:20:00 01:00:00:00 01:00:10:00
+    (dissolves and wipes add a duration field before the timecodes). Events
+    on a video track (V, V2, A/V, ...) or on "B" (audio and video) are read;
+    audio only events, zero-length events (the outgoing half of a dissolve) and
+    every other line (TITLE, FCM, comments, M2 speed changes) are skipped.
+
+    Args:
+        source: Path, open file object or iterable of lines
+        framerate: Frame rate of the source clip
+        start_frame: Source timecode of the clip's first frame, as a frame
+                     number; subtracted from every source in/out point
+        reel: Only import events of this reel (default: all reels)
+
+    Yields:
+        tuple: ((start_frame, end_frame), None) or (None, error_message)
+    """
+    for number, line in enumerate(_iter_lines(source), 1):
+        fields = line.split()
+        if len(fields) < 8 or not fields[0].isdecimal() or ":" not in fields[-4]:
+            continue
+        track = fields[2].upper()
+        if ("V" not in track and track != "B") or (reel is not None and fields[1] != reel):
+            continue
+
+        start = parse_time_frames(fields[-4], framerate)
+        end = parse_time_frames(fields[-3], framerate)
+        if start is None or end is None:
+            yield None, f"Line {number}: '{line.strip()}' - invalid timecode"
+            continue
+        if end == start:
+            continue
+
+        start -= start_frame
+        end -= start_frame
+        if start < 0:
+            yield None, f"Line {number}: '{line.strip()}' - starts before the clip (source timecode {fields[-4]})"
+        elif end < start:
+            yield None, f"Line {number}: '{line.strip()}' - source out before source in"
+        else:
+            yield (start, end), None
+
+
+def iter_csv_ranges(source, framerate=30.0, start_column=None, end_column=None):
+    """
+    Stream ranges from a CSV/TSV sheet with start and end columns
+
+    The first row is a header when it names the columns (see
+    CSV_START_COLUMNS / CSV_END_COLUMNS; a duration column may replace the
+    end column), otherwise the first two columns are start and end. The
+    delimiter (comma, semicolon or tab) is picked from the first line.
+    Cells take any parse_time() format or decimal seconds ("12.5").
+
+    Args:
+        source: Path, open file object or iterable of lines
+        framerate: Frame rate of the source clip
+        start_column: Header name or 0-based index of the start column
+        end_column: Header name or 0-based index of the end column
+
+    Yields:
+        tuple: ((start_frame, end_frame), None) or (None, error_message)
+    """
+    lines = _iter_lines(source)
+    for first in lines:
+        if first.strip():
+            break
+    else:
+        return
+
+    delimiter = max(",;\t", key=first.count)
+    rows = csv.reader(_chain_first(first, lines), delimiter=delimiter)
+    header = [cell.strip() for cell in next(rows)]
+    keys = [re.sub(r"[\s_\-()]", "", cell.lower()) for cell in header]
+
+    has_header = (isinstance(start_column, str) or isinstance(end_column, str)
+                  or any(key in CSV_START_COLUMNS + CSV_END_COLUMNS + CSV_DURATION_COLUMNS for key in keys))
+
+    duration_index = None
+    if has_header:
+        start_index = _csv_column(start_column, header, keys, CSV_START_COLUMNS)
+        end_index = _csv_column(end_column, header, keys, CSV_END_COLUMNS)
+        if end_index is None and end_column is None:
+            duration_index = _csv_column(None, header, keys, CSV_DURATION_COLUMNS)
+        if start_index is None or (end_index is None and duration_index is None):
+            yield None, f"Line 1: no start/end columns in header {header}"
+            return
+        row_number = 1
+    else:
+        start_index = start_column if start_column is not None else 0
+        end_index = end_column if end_column is not None else 1
+        rows = csv.reader(_chain_first(first, lines), delimiter=delimiter)
+        row_number = 0
+
+    fps = rational_framerate(framerate)
+    numerator, denominator = fps.numerator, fps.denominator
+    last_index = max(start_index, end_index if duration_index is None else duration_index)
+
+    for row in rows:
+        row_number += 1
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) <= last_index:
+            yield None, f"Line {row_number}: '{delimiter.join(row)}' - missing columns"
+            continue
+
+        start = _parse_clock_frames(row[start_index], numerator, denominator, framerate)
+        if duration_index is None:
+            end = _parse_clock_frames(row[end_index], numerator, denominator, framerate)
+        else:
+            length = _parse_clock_frames(row[duration_index], numerator, denominator, framerate)
+            end = None if start is None or length is None else start + length
+
+        if start is None or end is None or end <= start:
+            yield None, f"Line {row_number}: '{delimiter.join(row)}' - invalid format"
+        else:
+            yield (start, end), None
+
+
+def iter_subtitle_ranges(source, framerate=30.0):
+    """
+    Stream the cue times of an SRT or WebVTT subtitle file
+
+    Only the "start --> end" timing lines are read ("00:01:02,500" in SRT,
+    "00:01:02.500" or "01:02.500" in VTT; VTT cue settings after the end
+    time are ignored). Cue times are rounded to the nearest frame.
+
+    Args:
+        source: Path, open file object or iterable of lines
+        framerate: Frame rate of the source clip
+
+    Yields:
+        tuple: ((start_frame, end_frame), None) or (None, error_message)
+    """
+    fps = rational_framerate(framerate)
+    numerator, denominator = fps.numerator, fps.denominator
+
+    for number, line in enumerate(_iter_lines(source), 1):
+        if "-->" not in line:
+            continue
+
+        start_text, _, end_text = line.partition("-->")
+        end_text = end_text.split(None, 1)[0] if end_text.strip() else ""
+        start = _parse_clock_frames(start_text, numerator, denominator, framerate)
+        end = _parse_clock_frames(end_text, numerator, denominator, framerate)
+
+        if start is None or end is None:
+            yield None, f"Line {number}: '{line.strip()}' - invalid cue time"
+        elif end <= start:
+            # Cues shorter than a frame round to nothing
+            yield None, f"Line {number}: '{line.strip()}' - cue shorter than one frame"
+        else:
+            yield (start, end), None
+
+
+def iter_chapter_ranges(source, framerate=30.0, end_frame=None):
+    """
+    Stream the ranges of a YouTube-style chapter list
+
+    Each line starting with a time ("0:00 Intro", "1:02:03 - Part 2") opens a
+    chapter that runs until the next chapter starts; the last one runs to
+    end_frame. Lines without a leading time (descriptions, links) are skipped.
+
+    Args:
+        source: Path, open file object or iterable of lines
+        framerate: Frame rate of the source clip
+        end_frame: Clip length in frames (without it the last chapter is
+                   reported as an error)
+
+    Yields:
+        tuple: ((start_frame, end_frame), None) or (None, error_message)
+    """
+    previous = None  # (line number, line, start frame) of the open chapter
+
+    for number, line in enumerate(_iter_lines(source), 1):
+        match = CHAPTER_PATTERN.match(line)
+        if not match:
+            continue
+
+        start = parse_time_frames(match.group(1), framerate)
+        if start is None:
+            yield None, f"Line {number}: '{line.strip()}' - invalid time"
+            continue
+
+        if previous is not None:
+            if start > previous[2]:
+                yield (previous[2], start), None
+            else:
+                yield None, f"Line {previous[0]}: '{previous[1]}' - next chapter does not start later"
+        previous = (number, line.strip(), start)
+
+    if previous is not None:
+        if end_frame is None:
+            yield None, f"Line {previous[0]}: '{previous[1]}' - last chapter has no end (clip length unknown)"
+        elif end_frame > previous[2]:
+            yield (previous[2], end_frame), None
+        else:
+            yield None, f"Line {previous[0]}: '{previous[1]}' - starts after the end of the clip"
+
+
+class RangeFile:
+    """
+    A range file to cut from, in place of range text
+
+    plan_cut() and ResolveConnection.cut_video() accept one wherever they
+    take timecodes_text; the file is read once the clip's frame rate, start
+    timecode and length are known.
+    """
+
+    def __init__(self, path, import_format=None):
+        """
+        Args:
+            path: File path
+            import_format: One of IMPORT_FORMATS (default: guess_format())
+        """
+        self.path = os.fspath(path)
+        self.import_format = import_format or guess_format(self.path)
+
+        if self.import_format not in IMPORT_FORMATS:
+            raise ValueError(f"Unknown range format: {self.import_format!r}")
+
+    def read(self, framerate=30.0, start_frame=0, end_frame=None):
+        """
+        Read the file's ranges for a clip
+
+        Args:
+            framerate, start_frame, end_frame: As for iter_ranges()
+
+        Returns:
+            tuple: (ranges, errors) as for read_ranges()
+        """
+        return read_ranges(self.path, framerate, self.import_format, start_frame, end_frame)
+
+    def __str__(self):
+        return f"{os.path.basename(self.path)} ({self.import_format.upper()})"
+
+    def __repr__(self):
+        return f"RangeFile({self.path!r}, {self.import_format!r})"
+
+
+def _iter_lines(source):
+    """Yield text lines of a path, open file object or iterable of lines"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+            yield from f
+        return
+
+    for line in source:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8-sig", errors="replace")
+        yield line
+
+
+def _chain_first(first, lines):
+    """Put a line that was already read back in front of the rest"""
+    yield first
+    yield from lines
+
+
+def _csv_column(column, header, keys, names):
+    """Index of a CSV column given by name/index, or the first of names found"""
+    if isinstance(column, int):
+        return column
+    if column is not None:
+        return header.index(column) if column in header else None
+    for name in names:
+        if name in keys:
+            return keys.index(name)
+    return None
+
+
+def _parse_clock_frames(time_string, numerator, denominator, framerate):
+    """
+    Parse a time with decimal seconds ("00:01:02,500", "01:02.5", "62.5") to a frame
+
+    The fraction is kept exact and rounded to the nearest frame (half to
+    even); times without a decimal point go through parse_time_frames().
+    """
+    text = time_string.strip().replace(",", ".")
+    if "." not in text:
+        return parse_time_frames(text, framerate)
+
+    whole, _, digits = text.rpartition(".")
+    if not digits.isdecimal():
+        return None
+
+    seconds = 0
+    if whole:
+        fields = whole.split(":")
+        if len(fields) > 3 or not all(field.isdecimal() for field in fields):
+            return None
+        for field in fields:
+            seconds = seconds * 60 + int(field)
+
+    # seconds.digits * fps, with every term an integer
+    scale = 10 ** len(digits)
+    quotient, remainder = divmod((seconds * scale + int(digits)) * numerator, denominator * scale)
+    if remainder * 2 > denominator * scale or (remainder * 2 == denominator * scale and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+# Testing
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from fractions import Fraction
+
+    print("Testing range import:")
+    print("-" * 50)
+
+    fps = Fraction(30000, 1001)
+    samples = {
+        "edl": (
+            "TITLE: Selects\nFCM: NON-DROP FRAME\n\n"
+            "001  AX       V     C        01:01:57:00 01:02:08:00 01:00:00:00 01:00:11:00\n"
+            "* FROM CLIP NAME: Interview.mov\n"
+            "002  AX       A     C        01:03:00:00 01:03:05:00 01:00:11:00 01:00:16:00\n"
+            "003  AX       V     C        01:03:10:00 01:03:10:00 01:00:11:00 01:00:11:00\n"
+            "003  AX       V     D    030 01:03:10:00 01:03:22:00 01:00:11:00 01:00:23:00\n"
+            "004  AX       V     C        00:59:00:00 00:59:10:00 01:00:23:00 01:00:33:00\n"
+        ),
+        "csv": "Clip;Start;End;Note\nInterview;1:57;2:08;intro\nInterview;190.5;202.25;answer\nInterview;4:00;3:00;bad\n",
+        "srt": (
+            "1\n00:01:57,000 --> 00:02:08,000\nHello\n\n"
+            "2\n00:03:10,500 --> 00:03:22,250\nWorld\n\n"
+        ),
+        "vtt": "WEBVTT\n\nintro\n01:57.000 --> 02:08.000 align:start\nHello\n\nNOTE skipped\n\n03:10.500 --> 03:22.250\nWorld\n",
+        "chapters": "Chapters:\n0:00 Intro\n1:57 - Topic one\n3:10 Topic two\nhttps://example.com 9:99\n(4:27) Outro\n",
+    }
+
+    start_frame = 3600 * 30  # EDL source timecode starts at 01:00:00:00
+    clip_frames = 5 * 60 * 30
+    for import_format, text in samples.items():
+        ranges, errors = read_ranges(text.splitlines(True), fps, import_format, start_frame, clip_frames)
+        print(f"[{import_format:>8}] ranges {ranges}")
+        for error in errors:
+            print(f"           reported: {error}")
+
+    # Formats are guessed from the extension or sniffed from the content
+    with tempfile.TemporaryDirectory() as folder:
+        for name, text in (("cues.srt", samples["srt"]), ("chapters.txt", samples["chapters"]),
+                           ("ranges.txt", "1m57-2m08\n"), ("cues.txt", samples["vtt"])):
+            path = os.path.join(folder, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            print(f"[OK] {name} -> {RangeFile(path)}")
+
+        # Thousands of cues stream straight into frame ranges
+        path = os.path.join(folder, "long.srt")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(100000):
+                start, end = i * 3000, i * 3000 + 2000
+                f.write(f"{i + 1}\n{start // 3600000:02d}:{start // 60000 % 60:02d}:{start // 1000 % 60:02d},000 --> "
+                        f"{end // 3600000:02d}:{end // 60000 % 60:02d}:{end // 1000 % 60:02d},000\nCue {i + 1}\n\n")
+        start = time.perf_counter()
+        ranges, errors = RangeFile(path).read(fps)
+        print(f"[OK] 100,000 SRT cues -> {len(ranges):,} ranges, {len(errors)} errors "
+              f"in {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -5,6 +5,10 @@ Handles timeline operations and clip cutting
 
 import sys
 import os
+import re
+import tempfile
+import time
+import cProfile
 
 # Add Resolve API to Python path
 resolve_api_paths = [
@@ -17,50 +21,117 @@ for path in resolve_api_paths:
     if os.path.exists(path) and path not in sys.path:
         sys.path.append(path)
 
-from time_parser import parse_timecodes, format_seconds
+from time_parser import format_frames
+from media_pool import find_first_video_clip, MediaPoolIndex, ClipMetadata
+from cut_plan import plan_cut
+from timeline_export import write_timeline_file
+from cut_report import format_cut_summary, DETAIL_SEGMENTS
+import api_stats
+from job_log import LOG_DIR, log_job
+
+# Largest number of segments sent to Resolve in one AppendToTimeline() call
+APPEND_CHUNK_SIZE = 512
+
+# Reconnect attempts before a job gives up, and the first retry delay
+# in seconds (doubled after every failed attempt)
+RECONNECT_ATTEMPTS = 3
+RECONNECT_BACKOFF = 0.5
+
+# Set to "1" to time every Resolve API call, or to a file path to also
+# write the per-cut JSON report there
+API_STATS_ENV = "CLIP_ASSASSIN_API_STATS"
+
+# Set to "1" to add a phase timing table to every cut summary, or to
+# "cprofile" to also run each cut under cProfile (.pstats file in LOG_DIR)
+PROFILE_ENV = "CLIP_ASSASSIN_PROFILE"
+
+
+class CutCancelled(Exception):
+    """Raised inside a cut when its cancel event is set"""
 
 
 class ResolveConnection:
     """Handles connection to DaVinci Resolve"""
 
-    def __init__(self):
+    def __init__(self, instrument=None):
+        """
+        Args:
+            instrument: Time every Resolve API call (default: set when the
+                        CLIP_ASSASSIN_API_STATS environment variable is set)
+        """
+        if instrument is None:
+            instrument = bool(os.environ.get(API_STATS_ENV))
+
+        # None, "phases" or "cprofile" (see PROFILE_ENV)
+        profile = os.environ.get(PROFILE_ENV, "").strip().lower()
+        self.profile_mode = None if not profile else "cprofile" if profile == "cprofile" else "phases"
+
         self.resolve = None
         self.project = None
         self.media_pool = None
         self.project_manager = None
+        # DaVinciResolveScript module, imported once
+        self._dvr = None
+        # Identifies self.project, see ensure_connected()
+        self._project_key = None
+        # Adapted by _append_segments() whenever Resolve rejects a chunk
+        self.append_chunk_size = APPEND_CHUNK_SIZE
+        # Segments listed at each end of a cut summary (0 = all, see cut_report.py)
+        self.summary_segments = DETAIL_SEGMENTS
+        # Names of all timelines in the project, read once per connection
+        self._timeline_names = None
+        # Segments last put on each timeline by this connection (name -> list),
+        # spares reading every item back when updating a timeline
+        self._timeline_segments = {}
+        # Clip lookup table for the current project, see get_media_index()
+        self.media_index = None
+        # ClipMetadata per MediaPoolItem, see get_clip_metadata()
+        self._clip_metadata = {}
+        # Job log record of the last cut_video() run
+        self.last_job = None
+        # Per-method API call timings, None unless instrumented
+        self.api_stats = api_stats.ApiStats() if instrument else None
 
     def connect(self):
         """
         Establish connection to DaVinci Resolve
 
+        Caches of the previous connection are kept when it is the same
+        project again; MediaPoolItem handles are always re-fetched.
+
         Returns:
             tuple: (success: bool, message: str)
         """
         try:
-            # Import DaVinci Resolve script module
-            try:
-                import DaVinciResolveScript as dvr
-            except ImportError:
-                return False, "DaVinci Resolve Python API not found. Make sure Resolve is installed."
+            # Import DaVinci Resolve script module (once)
+            if self._dvr is None:
+                try:
+                    import DaVinciResolveScript as dvr
+                except ImportError:
+                    return False, "DaVinci Resolve Python API not found. Make sure Resolve is installed."
+                self._dvr = dvr
 
             # Get Resolve instance
-            self.resolve = dvr.scriptapp("Resolve")
+            self.resolve = self._dvr.scriptapp("Resolve")
             if not self.resolve:
                 return False, "Could not connect to DaVinci Resolve. Make sure Resolve is running."
 
+            if self.api_stats is not None:
+                self.resolve = api_stats.wrap(self.resolve, self.api_stats)
+
             # Get project manager
             self.project_manager = self.resolve.GetProjectManager()
             if not self.project_manager:
                 return False, "Could not access Project Manager."
 
             # Get current project
-            self.project = self.project_manager.GetCurrentProject()
-            if not self.project:
+            project = self.project_manager.GetCurrentProject()
+            if not project:
+                self.project = None
                 return False, "No project is open. Please open a project in Resolve."
 
             # Get media pool
-            self.media_pool = self.project.GetMediaPool()
-            if not self.media_pool:
+            if not self._adopt_project(project):
                 return False, "Could not access Media Pool."
 
             return True, f"Connected to project: {self.project.GetName()}"
@@ -68,10 +139,81 @@ class ResolveConnection:
         except Exception as e:
             return False, f"Connection error: {str(e)}"
 
-    def get_first_video_clip(self):
+    def ensure_connected(self):
+        """
+        Check the connection before a job and repair it if needed
+
+        The probe costs one or two API calls. If the user switched projects,
+        only the project handles are re-fetched; if Resolve stopped answering,
+        connect() is retried RECONNECT_ATTEMPTS times with exponential backoff.
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        if self.project_manager is not None:
+            try:
+                project = self.project_manager.GetCurrentProject()
+                if project:
+                    if _project_key(project) == self._project_key and self.media_pool:
+                        return True, "Connection alive"
+                    if self._adopt_project(project):
+                        return True, f"Switched to project: {project.GetName()}"
+            except Exception:
+                pass
+
+        return self._reconnect()
+
+    def _reconnect(self):
+        """connect() with exponential backoff between attempts"""
+        delay = RECONNECT_BACKOFF
+        for attempt in range(RECONNECT_ATTEMPTS):
+            if attempt:
+                time.sleep(delay)
+                delay *= 2
+
+            success, message = self.connect()
+            if success:
+                return True, message
+
+        return False, message
+
+    def _adopt_project(self, project):
+        """
+        Point the project handles at project
+
+        Timeline names and the clip index are dropped when project is not the
+        one they were read from; clip handles and metadata are always dropped.
+
+        Returns:
+            bool: False if the project's media pool is not accessible
+        """
+        project_key = _project_key(project)
+
+        if project_key != self._project_key:
+            self._timeline_names = None
+            self._timeline_segments = {}
+            self.media_index = None
+        self._clip_metadata = {}
+
+        self.project = project
+        self._project_key = project_key
+        self.media_pool = project.GetMediaPool()
+
+        if self.media_index is not None and self.media_pool:
+            self.media_index.rebind(self.media_pool)
+
+        return bool(self.media_pool)
+
+    def get_first_video_clip(self, bin_path=None):
         """
         Find the first video clip in the media pool
 
+        Bins are searched breadth-first, so a clip in a shallow bin is found
+        without walking the rest of the pool.
+
+        Args:
+            bin_path: Optional bin to search in, e.g. "Footage/Day 1"
+
         Returns:
             MediaPoolItem or None
         """
@@ -79,7 +221,59 @@ class ResolveConnection:
             return None
 
         root_folder = self.media_pool.GetRootFolder()
-        return self._find_video_clip_recursive(root_folder)
+        return find_first_video_clip(root_folder, bin_path)
+
+    def get_media_index(self):
+        """
+        Get the clip index of the current project
+
+        The index is loaded from its sidecar file on first use (or built with
+        one full walk of the Media Pool if there is none yet).
+
+        Returns:
+            MediaPoolIndex or None: None if not connected
+        """
+        if not self.media_pool:
+            return None
+
+        if self.media_index is None:
+            self.media_index = MediaPoolIndex(self.media_pool, _project_key(self.project))
+            if not self.media_index.load():
+                self.media_index.refresh()
+
+        return self.media_index
+
+    def find_clip(self, pattern):
+        """
+        Find a video clip by unique ID, file path, clip name or glob
+
+        Args:
+            pattern: e.g. "Interview.mov", "A00*_day1*", or a full file path
+
+        Returns:
+            MediaPoolItem or None
+        """
+        index = self.get_media_index()
+        return index.select(pattern) if index else None
+
+    def get_clip_metadata(self, clip):
+        """
+        Get the property snapshot of a MediaPoolItem
+
+        Properties are read once per clip and reused for the lifetime of the
+        connection.
+
+        Args:
+            clip: MediaPoolItem
+
+        Returns:
+            ClipMetadata
+        """
+        metadata = self._clip_metadata.get(clip)
+        if metadata is None:
+            metadata = ClipMetadata.from_clip(clip)
+            self._clip_metadata[clip] = metadata
+        return metadata
 
     def get_clip_framerate(self, clip):
         """
@@ -92,178 +286,613 @@ class ResolveConnection:
             float: Framerate (e.g., 59.94, 29.97, 30, 24, etc.) or 30.0 as fallback
         """
         try:
-            clip_property = clip.GetClipProperty()
-            fps = float(clip_property.get("FPS", 30.0))
-            return fps
+            return self.get_clip_metadata(clip).fps
         except Exception:
             return 30.0  # Fallback to 30fps
 
-    def _find_video_clip_recursive(self, folder):
-        """Recursively search for video clip in folders"""
-        # Check clips in current folder
-        clips = folder.GetClipList()
-        for clip in clips:
-            # Check if it's a video clip (has video track)
-            clip_property = clip.GetClipProperty()
-            if clip_property and clip_property.get("Video Codec"):
-                return clip
-
-        # Search subfolders
-        subfolders = folder.GetSubFolderList()
-        for subfolder in subfolders:
-            found = self._find_video_clip_recursive(subfolder)
-            if found:
-                return found
-
-        return None
-
-    def cut_video(self, timecodes_text, source_clip=None, reverse_mode=False):
+    def cut_video(self, timecodes_text, source_clip=None, reverse_mode=False,
+                  progress=None, cancel=None, update_timeline=False, import_format=None):
         """
         Create a new timeline with only the specified time ranges
 
+        Plans the cut with plan_cut() and replays the plan, see execute_plan().
+
         Args:
-            timecodes_text: Multi-line string with time ranges
-            source_clip: MediaPoolItem to use (if None, uses first video clip)
+            timecodes_text: Multi-line string with time ranges, or a
+                            range_import.RangeFile to read them from
+            source_clip: MediaPoolItem to use, or a clip name/glob/file path to
+                         look up with find_clip() (if None, uses first video clip)
             reverse_mode: If True, keep everything EXCEPT marked ranges (default: False)
+            progress: Optional callback(done, total, eta, segment) called on the
+                      calling thread once appending starts and after every
+                      appended chunk (up to APPEND_CHUNK_SIZE segments, so not
+                      once per segment), or once after a timeline import; eta
+                      is the estimated seconds left (None until known),
+                      segment the last range of the chunk as format_frames()
+                      text ("01:57 - 02:08", None before the first chunk and
+                      after an import)
+            cancel: Optional threading.Event; when set, the cut stops before the
+                    next chunk (segments already appended stay on the timeline)
+            update_timeline: If the project has an "Assassinated - <clip>"
+                             timeline of the source clip, update it in place
+                             (see _update_timeline()) instead of creating a new one
+            import_format: "edl" or "fcpxml" to build a new timeline with one
+                           ImportTimelineFromFile() call from a generated file
+                           instead of appending segments (falls back to
+                           appending if Resolve cannot import or link it)
 
         Returns:
             tuple: (success: bool, message: str)
         """
+        return self._run_job(
+            reverse_mode, self._cut_video,
+            timecodes_text, source_clip, reverse_mode, progress, cancel, update_timeline, import_format
+        )
+
+    def plan_video(self, timecodes_text, source_clip=None, reverse_mode=False):
+        """
+        Dry run: plan a cut for a clip in the media pool without changing anything
+
+        Args:
+            timecodes_text: Multi-line string with time ranges, or a RangeFile
+            source_clip: As for cut_video()
+            reverse_mode: If True, keep everything EXCEPT marked ranges
+
+        Returns:
+            tuple: (plan: CutPlan or None, message: str) - plan is None if the
+                   clip could not be read; otherwise check plan.ok
+        """
         try:
-            # Get source clip
+            metadata, message = self._get_source_metadata(source_clip, api_stats.PhaseTimer(), {})
+        except Exception as e:
+            return None, f"Error during planning: {str(e)}"
+        if metadata is None:
+            return None, message
+
+        plan = plan_cut(timecodes_text, metadata, reverse_mode)
+        return plan, plan.error or f"Planned {len(plan.segments)} segments for {metadata.name}"
+
+    def execute_plan(self, plan, source_clip=None, progress=None, cancel=None, update_timeline=False,
+                     import_format=None):
+        """
+        Replay a cut plan (e.g. one loaded from JSON)
+
+        Args:
+            plan: CutPlan from plan_cut() / plan_video() / CutPlan.from_json()
+            source_clip: MediaPoolItem or clip name/glob/file path (if None,
+                         the clip named in the plan); it must have the frame
+                         rate and length the plan was made for
+            progress, cancel, update_timeline, import_format: As for cut_video()
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        return self._run_job(
+            plan.reverse, self._execute_plan,
+            plan, source_clip, progress, cancel, update_timeline, import_format
+        )
+
+    def _run_job(self, reverse_mode, run, *args):
+        """
+        Run run(timer, job, *args) with API stats, profiling and the job log
+
+        Args:
+            reverse_mode: REVERSE flag recorded in the job log
+            run: _cut_video or _execute_plan
+
+        Returns:
+            tuple: (success: bool, message: str) of run
+        """
+        if self.api_stats is not None:
+            self.api_stats.reset()
+
+        timer = api_stats.PhaseTimer()
+        job = {}
+        profile_path = None
+
+        if self.profile_mode == "cprofile":
+            profiler = cProfile.Profile()
+            success, message = profiler.runcall(run, timer, job, *args)
+            try:
+                os.makedirs(LOG_DIR, exist_ok=True)
+                profile_path = os.path.join(LOG_DIR, time.strftime("cut_%Y%m%d_%H%M%S.pstats"))
+                profiler.dump_stats(profile_path)
+            except OSError:
+                profile_path = None
+        else:
+            success, message = run(timer, job, *args)
+
+        self.last_job = {
+            "version": "core",
+            **job,
+            "reverse": reverse_mode,
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in timer.phases.items()},
+            "duration_ms": round(timer.total * 1000, 3),
+            "api_calls": self.api_stats.total_calls if self.api_stats is not None else None,
+            "api_calls_by_method": (
+                {method: len(durations) for method, durations in self.api_stats.durations.items()}
+                if self.api_stats is not None else None
+            ),
+            "outcome": "success" if success else ("cancelled" if job.get("cancelled") else "failure"),
+            "error": None if success else (message.splitlines() or [""])[0],
+        }
+        log_job(self.last_job)
+
+        if success and self.profile_mode:
+            message = message.rstrip("\n") + "\n\nPhase timings:\n" + timer.format_table()
+            if profile_path:
+                message += f"\ncProfile: {profile_path}"
+
+        return success, message
+
+    def _cut_video(self, timer, job, timecodes_text, source_clip, reverse_mode,
+                   progress=None, cancel=None, update_timeline=False, import_format=None):
+        """
+        cut_video() without profiling or logging
+
+        Every phase is timed on timer; clip and segment details for the job
+        log are filled into the job dict as they become known.
+        """
+        try:
+            metadata, message = self._get_source_metadata(source_clip, timer, job)
+            if metadata is None:
+                return False, message
+
+            # Parse time ranges, then sort, validate and (in REVERSE mode)
+            # invert them as frame numbers
+            plan = plan_cut(timecodes_text, metadata, reverse_mode, timer)
+
+            return self._apply_plan(plan, metadata, timer, job, progress, cancel, update_timeline, import_format)
+
+        except Exception as e:
+            return False, f"Error during cutting: {str(e)}"
+
+    def _execute_plan(self, timer, job, plan, source_clip, progress=None, cancel=None, update_timeline=False,
+                      import_format=None):
+        """execute_plan() without profiling or logging, see _cut_video()"""
+        try:
+            metadata, message = self._get_source_metadata(
+                plan.clip if source_clip is None else source_clip, timer, job
+            )
+            if metadata is None:
+                return False, message
+
+            mismatch = plan.matches(metadata)
+            if mismatch:
+                return False, f"Cut plan does not fit the clip: {mismatch}"
+
+            return self._apply_plan(plan, metadata, timer, job, progress, cancel, update_timeline, import_format)
+
+        except Exception as e:
+            return False, f"Error during cutting: {str(e)}"
+
+    def _get_source_metadata(self, source_clip, timer, job):
+        """
+        Check the connection, find the source clip and read its properties
+
+        Args:
+            source_clip: As for cut_video()
+            timer: PhaseTimer for the connection check, clip discovery and
+                   property fetch phases
+            job: Job log dict, receives clip, fps and clip_frames
+
+        Returns:
+            tuple: (metadata: ClipMetadata or None, message: str)
+        """
+        # Make sure the handles are still valid (reconnects if needed)
+        with timer.phase("connection check"):
+            connected, message = self.ensure_connected()
+        if not connected:
+            return None, message
+
+        # Get source clip
+        with timer.phase("clip discovery"):
+            if isinstance(source_clip, str):
+                pattern = source_clip.strip()
+                source_clip = self.find_clip(pattern) if pattern else None
+                if pattern and not source_clip:
+                    return None, f"No video clip matching '{pattern}' found in Media Pool."
+
             if not source_clip:
                 source_clip = self.get_first_video_clip()
 
-            if not source_clip:
-                return False, "No video clip found in Media Pool. Please import a video first."
+        if not source_clip:
+            return None, "No video clip found in Media Pool. Please import a video first."
 
-            clip_name = source_clip.GetName()
+        # Read clip properties once (exact rational frame rate, length in frames)
+        with timer.phase("property fetch"):
+            metadata = self.get_clip_metadata(source_clip)
+        job.update(clip=metadata.name, fps=metadata.fps, clip_frames=metadata.frames)
 
-            # Get clip framerate for accurate timecode parsing
-            framerate = self.get_clip_framerate(source_clip)
+        return metadata, "Clip found"
 
-            # Parse time ranges with detected framerate
-            ranges, errors = parse_timecodes(timecodes_text, framerate)
+    def _apply_plan(self, plan, metadata, timer, job, progress=None, cancel=None, update_timeline=False,
+                    import_format=None):
+        """
+        Replay a plan: create (or update) the timeline and append the segments
 
-            if not ranges:
-                error_msg = "No valid time ranges found."
-                if errors:
-                    error_msg += "\n\nErrors:\n" + "\n".join(errors)
-                return False, error_msg
+        Args:
+            plan: CutPlan for the clip described by metadata
+            metadata: ClipMetadata of the source clip
+            timer, job: See _cut_video()
+            progress, cancel, update_timeline, import_format: See cut_video()
 
-            # Get clip properties
-            clip_property = source_clip.GetClipProperty()
-            fps = float(clip_property.get("FPS", 30))
-            duration_frames = int(clip_property.get("Frames", 0))
-            duration_seconds = duration_frames / fps
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        segments = plan.segments
+        fps = plan.fps
+        warnings = list(plan.warnings)
+        job.update(
+            segments=len(segments),
+            kept_seconds=round(plan.kept_seconds, 3),
+            warnings=len(plan.warnings),
+        )
+
+        if not plan.ok:
+            return False, plan.error
+
+        if cancel is not None and cancel.is_set():
+            job["cancelled"] = True
+            return False, "Cancelled before the timeline was created."
+
+        # Update this clip's earlier timeline in place if there is one
+        new_timeline = None
+        to_append = segments
+        if update_timeline:
+            with timer.phase("timeline update"):
+                new_timeline, to_append, changes = self._update_timeline(metadata, segments, plan.timeline_name)
+            if new_timeline:
+                timeline_name = new_timeline.GetName()
+                job.update(timeline=timeline_name, update=changes)
+
+        if not new_timeline and import_format:
+            # Build the whole timeline from one generated EDL/FCPXML file
+            with timer.phase("timeline import"):
+                new_timeline, timeline_name = self._import_timeline(plan, metadata, import_format)
+            if new_timeline:
+                to_append = []
+                job.update(timeline=timeline_name, import_format=import_format)
+                if progress:
+                    progress(len(segments), len(segments), 0.0, None)
+            else:
+                warnings.append(f"{import_format.upper()} import failed, segments were appended instead")
+
+        if not new_timeline:
+            # Create new timeline, adding (2), (3)... if the name is taken
+            with timer.phase("timeline naming"):
+                timeline_name = self._unique_timeline_name(plan.timeline_name)
+
+            with timer.phase("timeline creation"):
+                new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
+
+                if not new_timeline:
+                    # The project may have changed outside this session: re-read names once
+                    self._timeline_names = None
+                    timeline_name = self._unique_timeline_name(plan.timeline_name)
+                    new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
+
+                if not new_timeline:
+                    return False, "Failed to create new timeline."
+
+                self._timeline_names.add(timeline_name)
+                job["timeline"] = timeline_name
+
+                # Set as current timeline
+                self.project.SetCurrentTimeline(new_timeline)
+
+        # Until the append completes, the timeline no longer matches any plan
+        self._timeline_segments.pop(timeline_name, None)
+        kept = len(segments) - len(to_append)
+
+        # Add clips at specified ranges using frame-accurate in/out points
+        # Note: startFrame is inclusive, endFrame is exclusive (like Python ranges)
+        with timer.phase("append"):
+            try:
+                failed = self._append_segments(metadata, to_append, progress, cancel)
+            except CutCancelled as e:
+                job["cancelled"] = True
+                return False, f"Cancelled after {kept + e.args[0]} of {len(segments)} segments.\nTimeline '{timeline_name}' keeps the segments added so far."
+            except Exception as e:
+                return False, f"Error adding clip: {str(e)}"
 
-            # Validate ranges against clip duration
-            invalid_ranges = []
-            for i, (start, end) in enumerate(ranges):
-                if end > duration_seconds:
-                    invalid_ranges.append(f"Range {i+1}: {format_seconds(start)}-{format_seconds(end)} exceeds clip duration ({format_seconds(duration_seconds)})")
+        if failed:
+            in_frame, out_frame = failed
+            return False, f"Failed to add segment {format_frames(in_frame, fps)}-{format_frames(out_frame, fps)}"
 
-            if invalid_ranges:
-                return False, "Some ranges exceed clip duration:\n" + "\n".join(invalid_ranges)
+        self._timeline_segments[timeline_name] = list(segments)
 
-            # REVERSE MODE: Convert marked ranges to inverse ranges
-            if reverse_mode:
-                inverse_ranges = []
-                last_end = 0
+        # Generate summary (long segment lists are capped, see cut_report.py)
+        with timer.phase("summary"):
+            summary = format_cut_summary(
+                timeline_name, metadata.name, fps, segments, warnings, job.get("update"),
+                self.summary_segments, framerate_note=" (detected)"
+            )
 
-                for start, end in ranges:
-                    # Add segment before this marked range
-                    if last_end < start:
-                        inverse_ranges.append((last_end, start))
-                    last_end = end
+        if self.api_stats is not None:
+            summary = summary.rstrip("\n") + f"\n\nResolve API ({self.api_stats.total_calls} calls):\n"
+            summary += self.api_stats.format_report()
 
-                # Add final segment after last marked range
-                if last_end < duration_seconds:
-                    inverse_ranges.append((last_end, duration_seconds))
+            report_path = os.environ.get(API_STATS_ENV, "")
+            if report_path not in ("", "1"):
+                self.api_stats.dump(report_path)
 
-                # Replace ranges with inverse ranges
-                ranges = inverse_ranges
+        return True, summary
 
-                if not ranges:
-                    return False, "REVERSE mode: No segments to keep. The marked ranges cover the entire clip."
+    def _append_segments(self, metadata, segments, progress=None, cancel=None):
+        """
+        Append segments to the current timeline in as few API calls as possible
 
-            # Create new timeline
-            timeline_name = f"Assassinated - {clip_name}"
+        Segments are sent in chunks of self.append_chunk_size clip infos per
+        AppendToTimeline() call. Resolve returns the items it appended, in
+        order; when a chunk comes back short (or is rejected), the chunk size
+        is halved and only the segments after the appended ones are retried
+        one by one. After a fully appended chunk the size grows back, but not
+        beyond half of any chunk size Resolve rejected during this call.
 
-            # Check if timeline with this name already exists
-            existing_count = 1
-            original_name = timeline_name
-            while self._timeline_exists(timeline_name):
-                existing_count += 1
-                timeline_name = f"{original_name} ({existing_count})"
+        Args:
+            metadata: ClipMetadata of the clip the segments are cut from
+            segments: List of (in_frame, out_frame) tuples
+            progress: Optional callback(done, total, eta, segment), see cut_video()
+            cancel: Optional threading.Event checked before every chunk
 
-            # Set current timeline (create empty one first)
-            new_timeline = self.media_pool.CreateEmptyTimeline(timeline_name)
+        Returns:
+            tuple or None: (in_frame, out_frame) of the first segment that
+                           could not be added, or None if all were added
 
-            if not new_timeline:
-                return False, "Failed to create new timeline."
+        Raises:
+            CutCancelled: If cancel was set; its message is the number of
+                          segments appended before stopping
+        """
+        source_clip = metadata.clip
+        clip_infos = [
+            {"mediaPoolItem": source_clip, "startFrame": in_frame, "endFrame": out_frame}
+            for in_frame, out_frame in segments
+        ]
 
-            # Set as current timeline
-            self.project.SetCurrentTimeline(new_timeline)
+        # Chunk size cap, halved below every size Resolve rejects in this call
+        chunk_limit = APPEND_CHUNK_SIZE
 
-            # Add clips at specified ranges using SetClipProperty for in/out points
-            for start_sec, end_sec in ranges:
-                # Resolve API: SetClipProperty with In/Out points, then append
-                # Method 1: Try using clip properties
-                try:
-                    # Set in and out points (frame numbers) - use round for precision
-                    # Note: startFrame is inclusive, endFrame is exclusive (like Python ranges)
-                    in_frame = round(start_sec * fps)
-                    out_frame = round(end_sec * fps)
-
-                    # Create clip info dict with frame-accurate timing
-                    clip_info = {
-                        "mediaPoolItem": source_clip,
-                        "startFrame": in_frame,
-                        "endFrame": out_frame,
-                    }
-
-                    # Append to timeline
-                    result = self.media_pool.AppendToTimeline([clip_info])
-
-                    if not result:
-                        # If that doesn't work, try simpler approach
-                        result = self.media_pool.AppendToTimeline([source_clip])
-
-                    if not result:
-                        return False, f"Failed to add segment {format_seconds(start_sec)}-{format_seconds(end_sec)}"
-
-                except Exception as e:
-                    return False, f"Error adding clip: {str(e)}"
-
-            # Generate summary
-            total_duration = sum(end - start for start, end in ranges)
-            summary = f"✓ Mission accomplished!\n\n"
-            summary += f"Timeline: {timeline_name}\n"
-            summary += f"Clip: {clip_name}\n"
-            summary += f"Framerate: {framerate:.2f} fps (detected)\n"
-            summary += f"Segments: {len(ranges)}\n"
-            summary += f"Total duration: {format_seconds(total_duration)}\n\n"
-            summary += "Segments:\n"
-            for i, (start, end) in enumerate(ranges, 1):
-                summary += f"  {i}. {format_seconds(start)} - {format_seconds(end)} ({format_seconds(end-start)})\n"
-
-            if errors:
-                summary += f"\n⚠ Warnings:\n" + "\n".join(f"  - {e}" for e in errors)
-
-            return True, summary
+        total = len(segments)
+        start_time = time.perf_counter()
+        if progress:
+            progress(0, total, None, None)
 
-        except Exception as e:
-            return False, f"Error during cutting: {str(e)}"
+        position = 0
+        while position < len(clip_infos):
+            if cancel is not None and cancel.is_set():
+                raise CutCancelled(position)
+
+            chunk = clip_infos[position:position + self.append_chunk_size]
+
+            try:
+                result = self.media_pool.AppendToTimeline(chunk)
+            except Exception:
+                if len(chunk) == 1:
+                    raise
+                result = None
+
+            appended = min(len(result or []), len(chunk))
+
+            if appended == len(chunk):
+                self.append_chunk_size = min(self.append_chunk_size * 2, chunk_limit)
+            else:
+                chunk_limit = max(len(chunk) // 2, 1)
+                self.append_chunk_size = chunk_limit
+
+                # Retry the rest of this chunk one segment at a time; the
+                # first `appended` segments are already on the timeline
+                for offset in range(appended, len(chunk)):
+                    if not self.media_pool.AppendToTimeline([chunk[offset]]):
+                        return segments[position + offset]
+
+            position += len(chunk)
+
+            if progress:
+                elapsed = time.perf_counter() - start_time
+                in_frame, out_frame = segments[position - 1]
+                fps = metadata.rational_fps
+                progress(position, total, elapsed / position * (total - position),
+                         f"{format_frames(in_frame, fps)} - {format_frames(out_frame, fps)}")
+
+        return None
+
+    def _import_timeline(self, plan, metadata, import_format):
+        """
+        Create the plan's timeline with one ImportTimelineFromFile() call
+
+        The plan is written to a temporary EDL/FCPXML file referencing the
+        source clip already in the media pool. The imported timeline is only
+        kept if every item on video track 1 is linked to the source clip (Resolve
+        keeps unlinked events as offline items) and the items' source ranges
+        read back match the plan; otherwise it is deleted again.
+
+        Args:
+            plan: CutPlan to build
+            metadata: ClipMetadata of the source clip
+            import_format: "edl" or "fcpxml"
+
+        Returns:
+            tuple: (timeline, timeline_name), or (None, None) if the import failed
+        """
+        timeline_name = self._unique_timeline_name(plan.timeline_name)
+
+        handle, path = tempfile.mkstemp(prefix="clip_assassin_", suffix=f".{import_format}")
+        os.close(handle)
+        try:
+            write_timeline_file(plan, path, import_format, metadata)
+            timeline = self.media_pool.ImportTimelineFromFile(
+                path, {"timelineName": timeline_name, "importSourceClips": False}
+            )
+        except Exception:
+            # Let the caller fall back to appending
+            return None, None
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        if not timeline:
+            return None, None
+
+        try:
+            items = timeline.GetItemListInTrack("video", 1) or []
+            linked = _read_item_segments(items, metadata.clip) == plan.segments
+        except Exception:
+            linked = False
+
+        if not linked:
+            try:
+                self.media_pool.DeleteTimelines([timeline])
+            except Exception:
+                pass
+            return None, None
+
+        self._timeline_names.add(timeline_name)
+        self.project.SetCurrentTimeline(timeline)
+        return timeline, timeline_name
+
+    def _update_timeline(self, metadata, segments, base_name):
+        """
+        Prepare the timeline of a previous cut for an in-place update
+
+        The timeline is found by name (see _find_timeline()) and qualifies if
+        every item on video track 1 is linked to the source clip. Its items'
+        source ranges are taken from the plan this connection last put on it
+        when the item count still matches, otherwise read back from Resolve. Items the new plan does not keep are removed with one ripple
+        DeleteClips() call; Resolve can only append at the end of a track, so
+        everything from the first inserted or trimmed segment on is rebuilt.
+
+        Args:
+            metadata: ClipMetadata of the source clip
+            segments: New plan, list of (in_frame, out_frame) tuples
+            base_name: Timeline name without the "(N)" suffix
+
+        Returns:
+            tuple: (timeline, to_append, changes) - to_append are the segments
+                   still to append, changes a dict with kept/removed/added
+                   counts; (None, segments, None) if no timeline can be updated
+        """
+        timeline = self._find_timeline(base_name)
+        if not timeline:
+            return None, segments, None
+
+        name = timeline.GetName()
+        items = timeline.GetItemListInTrack("video", 1) or []
+        old_segments = self._timeline_segments.get(name)
+        if old_segments is None or len(old_segments) != len(items):
+            old_segments = _read_item_segments(items, metadata.clip)
+        elif not _items_from_clip(items, metadata.clip):
+            # Same item count, but the timeline was edited with other media
+            old_segments = None
+
+        if old_segments is None:
+            return None, segments, None
+
+        delete, kept = _diff_segments(old_segments, segments)
+
+        if delete:
+            remove = [items[index] for index in delete]
+
+            # Linked audio items were appended together with the video items
+            for track in range(1, (timeline.GetTrackCount("audio") or 0) + 1):
+                audio_items = timeline.GetItemListInTrack("audio", track) or []
+                if len(audio_items) == len(items):
+                    remove.extend(audio_items[index] for index in delete)
+
+            if not timeline.DeleteClips(remove, True):
+                return None, segments, None
+            self._timeline_segments.pop(name, None)
+
+        self.project.SetCurrentTimeline(timeline)
+
+        changes = {"kept": kept, "removed": len(delete), "added": len(segments) - kept}
+        return timeline, segments[kept:], changes
+
+    def _find_timeline(self, base_name):
+        """
+        Find the timeline a previous cut of the same clip created
 
-    def _timeline_exists(self, name):
-        """Check if a timeline with given name exists"""
-        timeline_count = self.project.GetTimelineCount()
-        for i in range(1, timeline_count + 1):
+        Matches base_name, optionally with an "(N)" suffix. The current
+        timeline is checked first; otherwise the project's timelines are
+        scanned, so batch jobs for several clips each find their own.
+
+        Args:
+            base_name: Timeline name without the "(N)" suffix
+
+        Returns:
+            Timeline or None: The current timeline if it matches, else the
+                              matching timeline created last
+        """
+        pattern = re.compile(re.escape(base_name) + r"( \(\d+\))?")
+
+        timeline = self.project.GetCurrentTimeline()
+        if timeline and pattern.fullmatch(timeline.GetName() or ""):
+            return timeline
+
+        for i in range(self.project.GetTimelineCount() or 0, 0, -1):
             timeline = self.project.GetTimelineByIndex(i)
-            if timeline and timeline.GetName() == name:
-                return True
-        return False
+            if timeline and pattern.fullmatch(timeline.GetName() or ""):
+                return timeline
+
+        return None
+
+    def _get_timeline_names(self):
+        """
+        Get the names of all timelines in the current project
+
+        The project is scanned only on first use; afterwards the cached set
+        is returned and kept current as cut_video() creates timelines.
+
+        Returns:
+            set: Timeline names
+        """
+        if self._timeline_names is None:
+            names = set()
+            timeline_count = self.project.GetTimelineCount()
+            for i in range(1, timeline_count + 1):
+                timeline = self.project.GetTimelineByIndex(i)
+                if timeline:
+                    names.add(timeline.GetName())
+            self._timeline_names = names
+
+        return self._timeline_names
+
+    def _unique_timeline_name(self, name):
+        """
+        Get name, or the first "name (N)" not used by any timeline
+
+        Args:
+            name: Preferred timeline name
+
+        Returns:
+            str: A timeline name that does not exist yet
+        """
+        names = self._get_timeline_names()
+        if name not in names:
+            return name
+
+        existing_count = 2
+        while f"{name} ({existing_count})" in names:
+            existing_count += 1
+
+        return f"{name} ({existing_count})"
+
+    def dump_api_report(self, path):
+        """
+        Write the API timings of the last cut as JSON
+
+        Args:
+            path: Output file
+
+        Returns:
+            bool: False if the connection is not instrumented
+        """
+        if self.api_stats is None:
+            return False
+        self.api_stats.dump(path)
+        return True
 
     def get_project_info(self):
         """Get current project information"""
@@ -280,6 +909,91 @@ class ResolveConnection:
         return info
 
 
+def _project_key(project):
+    """Identify a project: its unique ID where the API offers one, else its name"""
+    get_unique_id = getattr(project, "GetUniqueId", None)
+    if get_unique_id:
+        unique_id = get_unique_id()
+        if unique_id:
+            return str(unique_id)
+    return project.GetName()
+
+
+def _read_item_segments(items, source_clip):
+    """
+    Read the source ranges of timeline items back from Resolve
+
+    Args:
+        items: TimelineItems, in timeline order
+        source_clip: MediaPoolItem every item must come from
+
+    Returns:
+        list or None: (in_frame, out_frame) per item, or None if an item is
+                      offline or linked to another clip
+    """
+    if not _items_from_clip(items, source_clip):
+        return None
+
+    segments = []
+    for item in items:
+        in_frame = item.GetLeftOffset()
+        segments.append((in_frame, in_frame + item.GetDuration()))
+    return segments
+
+
+def _items_from_clip(items, source_clip):
+    """
+    Check that timeline items are linked to a clip (one GetMediaPoolItem() call per item)
+
+    Args:
+        items: TimelineItems
+        source_clip: MediaPoolItem every item must come from
+
+    Returns:
+        bool: False if an item is offline or linked to another clip
+    """
+    source_id = _media_id(source_clip)
+    for item in items:
+        media = item.GetMediaPoolItem()
+        if media is None or (media != source_clip and _media_id(media) != source_id):
+            return False
+    return True
+
+
+def _media_id(clip):
+    """Unique id of a MediaPoolItem (script wrappers of one clip need not be identical)"""
+    try:
+        return clip.GetUniqueId() or id(clip)
+    except Exception:
+        return id(clip)
+
+
+def _diff_segments(old_segments, new_segments):
+    """
+    Find which timeline items to keep when the plan changes
+
+    Items can only be removed (with ripple) or appended at the end, so the
+    kept items must spell out a prefix of the new plan: the longest prefix of
+    new_segments that is a subsequence of old_segments is kept, found greedily.
+
+    Args:
+        old_segments: (in_frame, out_frame) tuples on the timeline, in order
+        new_segments: Planned (in_frame, out_frame) tuples, in order
+
+    Returns:
+        tuple: (delete, kept) - indexes into old_segments to remove, and the
+               number of leading new_segments already on the timeline
+    """
+    delete = []
+    kept = 0
+    for index, segment in enumerate(old_segments):
+        if kept < len(new_segments) and segment == new_segments[kept]:
+            kept += 1
+        else:
+            delete.append(index)
+    return delete, kept
+
+
 # Testing
 if __name__ == "__main__":
     print("Testing Resolve Connection...")
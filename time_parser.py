@@ -1,9 +1,144 @@
 """
 Time Parser Module for Clip Assassin Resolve
-Converts various time formats to seconds
+Converts various time formats to frame numbers (or seconds)
 """
 
+import functools
+import mmap
+import os
 import re
+from fractions import Fraction
+
+# NumPy is optional: only the bulk array API needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def rational_framerate(framerate):
+    """
+    Get the exact frame rate for a nominal one
+
+    NTSC-style rates are snapped to their exact ratio (29.97 -> 30000/1001,
+    59.94 -> 60000/1001, 23.976 -> 24000/1001...), whole rates stay whole.
+
+    Args:
+        framerate: Frame rate as float, string (e.g. Resolve's "29.97") or Fraction
+
+    Returns:
+        Fraction: Exact frame rate
+
+    Raises:
+        ValueError: If the frame rate is not positive
+    """
+    if isinstance(framerate, Fraction):
+        fps = framerate
+    else:
+        rate = float(framerate)
+        nominal = round(rate)
+        ntsc = round(rate * 1.001)
+
+        if abs(rate - nominal) < 0.001:
+            fps = Fraction(nominal)
+        elif abs(rate - ntsc * 1000 / 1001) < 0.005:
+            fps = Fraction(ntsc * 1000, 1001)
+        else:
+            fps = Fraction(rate).limit_denominator(1001)
+
+    if fps <= 0:
+        raise ValueError(f"Invalid frame rate: {framerate}")
+
+    return fps
+
+
+@functools.lru_cache(maxsize=None)
+def _frame_rate_terms(framerate):
+    """Cached (numerator, denominator, timebase) for a frame rate"""
+    fps = rational_framerate(framerate)
+    return fps.numerator, fps.denominator, round(fps)
+
+
+@functools.lru_cache(maxsize=None)
+def _drop_frame_terms(framerate):
+    """
+    Cached drop-frame constants for a frame rate, or None if it has none
+
+    SMPTE drop-frame timecode exists for the NTSC multiples of 29.97 (29.97,
+    59.94, 119.88): the first timebase/15 frame numbers of every minute are
+    skipped, except in every tenth minute.
+
+    Returns:
+        tuple: (timebase, dropped, frames_per_minute, frames_per_10_minutes)
+               or None
+    """
+    numerator, denominator, timebase = _frame_rate_terms(framerate)
+    if denominator != 1001 or timebase % 30:
+        return None
+
+    dropped = timebase // 15
+    frames_per_minute = timebase * 60 - dropped
+    return timebase, dropped, frames_per_minute, frames_per_minute * 10 + dropped
+
+
+def has_drop_frame(framerate):
+    """
+    Check if a frame rate has SMPTE drop-frame timecode (29.97, 59.94, 119.88)
+
+    Args:
+        framerate: Frame rate (float, string or Fraction)
+
+    Returns:
+        bool: True if HH:MM:SS;FF timecode skips frame numbers at this rate
+    """
+    return _drop_frame_terms(framerate) is not None
+
+
+def timecode_to_frames(hours, minutes, seconds, frames, framerate=30.0, drop_frame=False):
+    """
+    Convert timecode fields to a frame number, in O(1)
+
+    Non-drop-frame timecode counts frames at the timebase (30 for 29.97).
+    Drop-frame timecode (29.97/59.94/119.88 only; at other rates drop_frame
+    is ignored) subtracts the frame numbers skipped in all earlier minutes.
+    Labels that drop-frame skips (00:01:00;00 and ;01 at 29.97) are taken
+    as the next existing frame.
+
+    Args:
+        hours, minutes, seconds, frames: Timecode fields (int)
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+        drop_frame: True for HH:MM:SS;FF drop-frame timecode
+
+    Returns:
+        int: Frame number
+    """
+    terms = _drop_frame_terms(framerate) if drop_frame else None
+    timebase = terms[0] if terms else _frame_rate_terms(framerate)[2]
+    total = (hours * 3600 + minutes * 60 + seconds) * timebase + frames
+
+    if terms:
+        dropped = terms[1]
+        total_minutes = hours * 60 + minutes + seconds // 60
+        total -= dropped * (total_minutes - total_minutes // 10)
+        if seconds % 60 == 0 and frames < dropped and total_minutes % 10:
+            total += dropped - frames
+
+    return total
+
+
+def frames_to_seconds(frames, framerate=30.0):
+    """
+    Convert a frame number to seconds (for display only)
+
+    Args:
+        frames: Frame number or frame count
+        framerate: Frame rate (float, string or Fraction)
+
+    Returns:
+        float: Time in seconds
+    """
+    numerator, denominator, _ = _frame_rate_terms(framerate)
+    return frames * denominator / numerator
 
 
 def parse_time_range(range_string, framerate=30.0):
@@ -17,22 +152,41 @@ def parse_time_range(range_string, framerate=30.0):
     Returns:
         tuple: (start_seconds, end_seconds) or None if invalid
     """
-    # Replace different dash types with standard hyphen
-    range_string = range_string.replace('\u2013', '-')  # en dash
-    range_string = range_string.replace('\u2014', '-')  # em dash
+    parts = _split_range(range_string)
+    if parts is None:
+        return None
 
-    # Remove spaces
-    range_string = range_string.strip().replace(' ', '')
+    # Parse start and end times
+    start = parse_time(parts[0], framerate)
+    end = parse_time(parts[-1], framerate)
 
-    # Split by hyphen
-    parts = range_string.split('-')
+    if start is None or end is None:
+        return None
 
-    if len(parts) < 2:
+    if end <= start:
+        return None
+
+    return (start, end)
+
+
+def parse_time_range_frames(range_string, framerate=30.0):
+    """
+    Parse a time range string like "1m57-2m08" to frame numbers
+
+    Args:
+        range_string: String in format "start-end"
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+
+    Returns:
+        tuple: (start_frame, end_frame) or None if invalid
+    """
+    parts = _split_range(range_string)
+    if parts is None:
         return None
 
     # Parse start and end times
-    start = parse_time(parts[0], framerate)
-    end = parse_time(parts[-1], framerate)
+    start = parse_time_frames(parts[0], framerate)
+    end = parse_time_frames(parts[-1], framerate)
 
     if start is None or end is None:
         return None
@@ -43,6 +197,67 @@ def parse_time_range(range_string, framerate=30.0):
     return (start, end)
 
 
+def _split_range(range_string):
+    """Split "start-end" into its parts, or None if there is no dash"""
+    # Replace different dash types with standard hyphen (membership tests are
+    # cheaper than replace() calls that find nothing)
+    if '\u2013' in range_string or '\u2014' in range_string:
+        range_string = range_string.replace('\u2013', '-')  # en dash
+        range_string = range_string.replace('\u2014', '-')  # em dash
+
+    # Remove spaces
+    range_string = range_string.strip()
+    if ' ' in range_string:
+        range_string = range_string.replace(' ', '')
+
+    # Split by hyphen
+    parts = range_string.split('-')
+
+    if len(parts) < 2:
+        return None
+
+    return parts
+
+
+def parse_time_frames(time_string, framerate=30.0):
+    """
+    Parse a single time string (any parse_time() format) to a frame number
+
+    Everything stays in integers: timecode is counted in timebase frames
+    (less the skipped frame numbers for HH:MM:SS;FF drop-frame timecode, see
+    timecode_to_frames()), plain times are multiplied by the exact rational
+    frame rate and rounded half-to-even, so there is no float drift on long
+    29.97/59.94 sources.
+
+    Args:
+        time_string: Time string to parse
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+
+    Returns:
+        int: Frame number, or None if invalid
+    """
+    if not time_string:
+        return None
+
+    fields = _tokenize_time(time_string)
+    if fields is None:
+        return None
+
+    hours, minutes, seconds, frames, is_timecode_format, is_drop_frame = fields
+
+    # TIMECODE FORMAT: the fields count frames at the timebase
+    if is_timecode_format:
+        return timecode_to_frames(hours, minutes, seconds, frames, framerate, is_drop_frame)
+
+    numerator, denominator, _ = _frame_rate_terms(framerate)
+
+    # Standard time format: seconds * numerator / denominator, rounded half-to-even
+    quotient, remainder = divmod((hours * 3600 + minutes * 60 + seconds) * numerator, denominator)
+    if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
 def parse_time(time_string, framerate=30.0):
     """
     Parse a single time string like "1m57", "1:57", "0:02:25", "1h30m45", "00:01:30:15" or "00:01:30;15"
@@ -66,127 +281,157 @@ def parse_time(time_string, framerate=30.0):
     if not time_string:
         return None
 
-    time_string = time_string.strip().lower()
+    fields = _tokenize_time(time_string)
+    if fields is None:
+        return None
+
+    hours, minutes, seconds, frames, is_timecode_format, is_drop_frame = fields
+
+    # TIMECODE FORMAT (HH:MM:SS:FF or HH:MM:SS;FF): Convert everything to frames first, then to seconds
+    if is_timecode_format and framerate > 0:
+        # Drop-frame timecode skips frame numbers, not frames (ignored at other rates)
+        if is_drop_frame:
+            total_frames = timecode_to_frames(hours, minutes, seconds, frames, framerate, True)
+        else:
+            # Determine timebase (the "nominal" framerate used in timecode)
+            # For 59.94fps → timebase is 60
+            # For 29.97fps → timebase is 30
+            # For 23.976fps → timebase is 24
+            timebase = round(framerate)
+
+            # Calculate total frame number using timebase
+            total_frames = (hours * 3600 * timebase) + \
+                          (minutes * 60 * timebase) + \
+                          (seconds * timebase) + \
+                          frames
+
+        # Convert frames to seconds using ACTUAL framerate
+        # This ensures frame-accurate timing even with drop-frame rates
+        return total_frames / framerate
+    else:
+        # Standard time format: simple seconds calculation
+        return hours * 3600 + minutes * 60 + seconds
+
+
+# Values of the one and two digit fields ("0"-"99", "00"-"09") nearly every
+# time string is made of: a dict lookup is several times cheaper than int()
+_FIELD_VALUES = {str(value): value for value in range(100)}
+_FIELD_VALUES.update((f"{value:02d}", value) for value in range(10))
+
+
+class _IntFields:
+    """Field converter for any other text: int(), which accepts or rejects it as before"""
+
+    __getitem__ = staticmethod(int)
+
+
+_INT_FIELDS = _IntFields()
+
+
+def _tokenize_time(time_string, values=_FIELD_VALUES):
+    """
+    Split a time string into its components in a single pass
+
+    Formats are told apart by their separators (";" drop-frame frames, then
+    "h", "m", ":" or a plain number), like the original parser, and the
+    text between separators is found with partition() instead of split()
+    lists. Fields are looked up in _FIELD_VALUES; if one is not listed
+    there, the string is scanned again converting fields with int(), so
+    whatever int() accepts or rejects is accepted or rejected as before and
+    unusual input ("1H30M", "5ss", "1h2h3"...) keeps its old meaning.
+
+    Args:
+        time_string: Time string to tokenize
+        values: Field converter (_FIELD_VALUES, or _INT_FIELDS on the rescan)
+
+    Returns:
+        tuple: (hours, minutes, seconds, frames, is_timecode_format,
+                is_drop_frame) or None if invalid
+    """
+    text = time_string.strip().lower()
+
+    # Just a number = seconds, the one format that needs no separator test
+    if text.isdecimal():
+        return 0, 0, int(text), 0, False, False
 
     hours = 0
     minutes = 0
     seconds = 0
     frames = 0
-    is_drop_frame = False
     is_timecode_format = False
+    is_drop_frame = False
 
-    # Check for drop-frame timecode (semicolon before frames)
-    if ';' in time_string:
-        is_drop_frame = True
-        is_timecode_format = True
-        # Split by semicolon to get frames
-        semi_parts = time_string.split(';')
-        if len(semi_parts) == 2:
-            try:
-                frames = int(semi_parts[1])
-                time_string = semi_parts[0]  # Continue parsing the time part
-            except ValueError:
-                return None
-
-    # Format: 1h30m45s or 1h30m or combinations with "h", "m", "s"
-    if 'h' in time_string:
-        h_parts = time_string.split('h')
-        try:
-            hours = int(h_parts[0])
-        except ValueError:
-            return None
-
-        if len(h_parts) > 1 and h_parts[1]:
-            rest = h_parts[1]
-            if 'm' in rest:
-                m_parts = rest.split('m')
-                try:
-                    minutes = int(m_parts[0])
-                except ValueError:
-                    return None
-                if len(m_parts) > 1 and m_parts[1]:
-                    try:
-                        seconds = int(m_parts[1].replace('s', ''))
-                    except ValueError:
-                        return None
-            else:
-                try:
-                    seconds = int(rest.replace('s', ''))
-                except ValueError:
-                    return None
-
-    # Format: 1m57s or 1m57
-    elif 'm' in time_string:
-        m_parts = time_string.split('m')
-        try:
-            minutes = int(m_parts[0])
-        except ValueError:
-            return None
+    try:
+        # Check for drop-frame timecode (semicolon before frames)
+        if ';' in text:
+            is_timecode_format = True
+            is_drop_frame = True
+            time_part, _, frame_part = text.partition(';')
+            if ';' not in frame_part:
+                frames = values[frame_part]
+                text = time_part  # Continue parsing the time part
 
-        if len(m_parts) > 1 and m_parts[1]:
-            try:
-                seconds = int(m_parts[1].replace('s', ''))
-            except ValueError:
-                return None
+        # Format: 1h30m45s or 1h30m or combinations with "h", "m", "s"
+        if 'h' in text:
+            hour_part, _, rest = text.partition('h')
+            hours = values[hour_part]
+            # Only the text up to a second "h" counts
+            if 'h' in rest:
+                rest = rest[:rest.index('h')]
+            if rest:
+                if 'm' in rest:
+                    minute_part, _, rest = rest.partition('m')
+                    minutes = values[minute_part]
+                    if 'm' in rest:
+                        rest = rest[:rest.index('m')]
+                    if rest:
+                        seconds = values[rest.replace('s', '')]
+                else:
+                    seconds = values[rest.replace('s', '')]
 
-    # Format: 0:02:25 or 1:57:30 or 1:57 or 00:01:30:15 (non-drop-frame with frames)
-    elif ':' in time_string:
-        colon_parts = time_string.split(':')
+        # Format: 1m57s or 1m57
+        elif 'm' in text:
+            minute_part, _, rest = text.partition('m')
+            minutes = values[minute_part]
+            if 'm' in rest:
+                rest = rest[:rest.index('m')]
+            if rest:
+                seconds = values[rest.replace('s', '')]
 
-        try:
-            if len(colon_parts) == 2:
+        # Format: 0:02:25 or 1:57:30 or 1:57 or 00:01:30:15 (non-drop-frame with frames)
+        elif ':' in text:
+            colon_parts = text.split(':')
+            count = len(colon_parts)
+            if count == 2:
                 # MM:SS
-                minutes = int(colon_parts[0])
-                seconds = int(colon_parts[1])
-            elif len(colon_parts) == 3:
+                minutes = values[colon_parts[0]]
+                seconds = values[colon_parts[1]]
+            elif count == 3:
                 # HH:MM:SS
-                hours = int(colon_parts[0])
-                minutes = int(colon_parts[1])
-                seconds = int(colon_parts[2])
-            elif len(colon_parts) == 4:
+                hours = values[colon_parts[0]]
+                minutes = values[colon_parts[1]]
+                seconds = values[colon_parts[2]]
+            elif count == 4:
                 # HH:MM:SS:FF (non-drop-frame timecode)
                 is_timecode_format = True
-                hours = int(colon_parts[0])
-                minutes = int(colon_parts[1])
-                seconds = int(colon_parts[2])
-                frames = int(colon_parts[3])
-            elif len(colon_parts) == 1:
-                # Just a number
-                seconds = int(colon_parts[0])
-        except ValueError:
-            return None
+                hours = values[colon_parts[0]]
+                minutes = values[colon_parts[1]]
+                seconds = values[colon_parts[2]]
+                frames = values[colon_parts[3]]
 
-    # Just a number = seconds
-    else:
-        try:
-            seconds = int(time_string.replace('s', ''))
-        except ValueError:
-            return None
+        # Just a number = seconds
+        else:
+            seconds = values[text.replace('s', '')]
+    except KeyError:
+        return _tokenize_time(time_string, _INT_FIELDS)
+    except ValueError:
+        return None
 
     # Validate non-negative
     if hours < 0 or minutes < 0 or seconds < 0 or frames < 0:
         return None
 
-    # TIMECODE FORMAT (HH:MM:SS:FF or HH:MM:SS;FF): Convert everything to frames first, then to seconds
-    if is_timecode_format and framerate > 0:
-        # Determine timebase (the "nominal" framerate used in timecode)
-        # For 59.94fps → timebase is 60
-        # For 29.97fps → timebase is 30
-        # For 23.976fps → timebase is 24
-        timebase = round(framerate)
-
-        # Calculate total frame number using timebase
-        total_frames = (hours * 3600 * timebase) + \
-                      (minutes * 60 * timebase) + \
-                      (seconds * timebase) + \
-                      frames
-
-        # Convert frames to seconds using ACTUAL framerate
-        # This ensures frame-accurate timing even with drop-frame rates
-        return total_frames / framerate
-    else:
-        # Standard time format: simple seconds calculation
-        return hours * 3600 + minutes * 60 + seconds
+    return hours, minutes, seconds, frames, is_timecode_format, is_drop_frame
 
 
 def parse_timecodes(timecodes_text, framerate=30.0):
@@ -221,6 +466,274 @@ def parse_timecodes(timecodes_text, framerate=30.0):
     return ranges, errors
 
 
+def parse_timecodes_frames(timecodes_text, framerate=30.0):
+    """
+    Parse multiple time ranges from text (one per line) to frame numbers
+
+    Args:
+        timecodes_text: Multi-line string with time ranges
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+
+    Returns:
+        tuple: (ranges, errors) - ranges is a list of (start_frame, end_frame)
+               sorted by start, errors a list of messages for invalid lines
+    """
+    lines = timecodes_text.strip().split('\n')
+    ranges = []
+    errors = []
+
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+
+        parsed = parse_time_range_frames(line, framerate)
+        if parsed:
+            ranges.append(parsed)
+        else:
+            errors.append(f"Line {i+1}: '{line}' - invalid format")
+
+    # Sort by start frame
+    ranges.sort(key=lambda x: x[0])
+
+    return ranges, errors
+
+
+def parse_timecodes_iter(source, framerate=30.0):
+    """
+    Parse time ranges to frame numbers lazily, one line at a time
+
+    Nothing is read ahead, so memory stays flat for multi-megabyte range
+    files. A path is memory-mapped and scanned line by line; an open file
+    object (text or binary) or any iterable of lines is consumed as-is.
+    Ranges are yielded in file order, not sorted.
+
+    Args:
+        source: Path to a range file, open file object or iterable of lines
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+
+    Yields:
+        tuple: ((start_frame, end_frame), None) for a valid line,
+               (None, error_message) for an invalid one
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = _iter_mapped_lines(source)
+
+    for i, line in enumerate(source):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8-sig')
+
+        line = line.strip()
+        if not line:
+            continue
+
+        parsed = parse_time_range_frames(line, framerate)
+        if parsed:
+            yield parsed, None
+        else:
+            yield None, f"Line {i+1}: '{line}' - invalid format"
+
+
+def _iter_mapped_lines(path):
+    """Yield raw byte lines from a memory-mapped file"""
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+
+        with mapped:
+            for line in iter(mapped.readline, b''):
+                yield line
+
+
+# parse_timecodes_array() groups lines by "shape": the line with every ASCII
+# digit written as 9. One time of a shape, in the strict grammar below:
+#   9:9 | 9:9:9 | 9:9:9:9 | 9:9;9 | 9:9:9;9              -> groups 1-5
+#   9 | 9s | 9h | 9h9 | 9h9s | 9h9m | 9h9m9 | 9h9m9s | 9m | 9m9 | 9m9s  -> groups 6-8
+# (9 = up to nine digits). Shapes outside it go through parse_time_range_frames().
+_DIGIT_SHAPE = bytes.maketrans(b"0123456789", b"9999999999")
+_TIME_SHAPE = (r"(?:(9{1,9}):(9{1,9})(?::(9{1,9}))?(?:([:;])(9{1,9}))?"
+               r"|(?=9)(?:(9{1,9})h)?(?:(9{1,9})m)?(?:(9{1,9})s?)?)")
+_TIME_SHAPE_GROUPS = 8
+_RANGE_SHAPE_RE = re.compile(rf"{_TIME_SHAPE}[ \t]*-[ \t]*{_TIME_SHAPE}".encode("ascii"))
+
+
+def parse_timecodes_array(timecodes, framerate=30.0, errors=None):
+    """
+    Parse many time ranges straight into NumPy frame arrays
+
+    Meant for very long range lists. Lines are grouped by shape (same
+    separators, same number of digits per field); each shape is matched
+    against the range grammar once, and all its lines are converted
+    together with array arithmetic on the columns of their bytes, so no
+    (start, end) tuple or per-line Python parse is needed. The rare lines
+    outside the grammar ("1 m 57", "1H30M", en dashes...) are parsed one by
+    one with parse_time_range_frames(). Results are the same as
+    parse_time_range_frames() line by line.
+
+    Args:
+        timecodes: Multi-line string, or a list of lines
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+        errors: Optional list; a message is appended for every invalid line,
+                worded and numbered like parse_timecodes_frames() does
+
+    Returns:
+        tuple: (start_frames, end_frames, error_mask) with one entry per
+               non-empty line, in input order. Frames are contiguous int64
+               arrays; entries flagged in the bool error_mask hold 0.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("NumPy is required for parse_timecodes_array()")
+
+    if isinstance(timecodes, str):
+        timecodes = timecodes.strip().split('\n')
+
+    lines = [line for line in map(str.strip, timecodes) if line]
+    count = len(lines)
+    start_frames = np.zeros(count, dtype=np.int64)
+    end_frames = np.zeros(count, dtype=np.int64)
+    error_mask = np.zeros(count, dtype=bool)
+
+    # All lines as one byte string: the rows of a zero-padded byte matrix,
+    # and (digits written as 9) their shapes, without a Python pass per line
+    data = "\n".join(lines).encode("utf-8")
+    rows = data.split(b"\n")
+    if len(rows) != count:
+        # A list item with a line break inside: encode line by line
+        rows = [line.encode("utf-8") for line in lines]
+        shapes = [row.translate(_DIGIT_SHAPE) for row in rows]
+    else:
+        shapes = data.translate(_DIGIT_SHAPE).split(b"\n")
+    chars = np.array(rows).view(np.uint8).reshape(count, -1) if count else None
+
+    # Line numbers of each shape, in input order: order[bounds[i]:bounds[i + 1]]
+    shape_ids = dict.fromkeys(shapes)
+    for shape_id, shape in enumerate(shape_ids):
+        shape_ids[shape] = shape_id
+    ids = np.fromiter(map(shape_ids.__getitem__, shapes), dtype=np.intp, count=count)
+    order = np.argsort(ids, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(ids, minlength=len(shape_ids)))))
+
+    for shape, shape_id in shape_ids.items():
+        indices = order[bounds[shape_id]:bounds[shape_id + 1]]
+        match = _RANGE_SHAPE_RE.fullmatch(shape)
+        if match is None:
+            for index in indices.tolist():
+                parsed = parse_time_range_frames(lines[index], framerate)
+                if parsed:
+                    start_frames[index], end_frames[index] = parsed
+                else:
+                    error_mask[index] = True
+            continue
+
+        # Same shape = same columns
+        group = chars[indices]
+        starts = _shape_time_frames(group, match, 1, framerate)
+        ends = _shape_time_frames(group, match, 1 + _TIME_SHAPE_GROUPS, framerate)
+        invalid = ends <= starts
+
+        start_frames[indices] = np.where(invalid, 0, starts)
+        end_frames[indices] = np.where(invalid, 0, ends)
+        error_mask[indices] = invalid
+
+    if errors is not None and error_mask.any():
+        # Messages number lines like parse_timecodes_frames(), empty lines included
+        invalid = error_mask.tolist()
+        position = 0
+        for number, line in enumerate(timecodes, 1):
+            line = line.strip()
+            if line:
+                if invalid[position]:
+                    errors.append(f"Line {number}: '{line}' - invalid format")
+                position += 1
+
+    return start_frames, end_frames, error_mask
+
+
+def _shape_time_frames(chars, match, first_group, framerate):
+    """
+    Frame numbers of one time of a _RANGE_SHAPE_RE match, for every row
+
+    Args:
+        chars: uint8 array, one row of bytes per line
+        match: _RANGE_SHAPE_RE match of the rows' shape
+        first_group: Number of the time's first group (1 or 9)
+        framerate: Frame rate (float, string or Fraction)
+
+    Returns:
+        numpy.ndarray: int64 frame numbers, like parse_time_frames() per row
+    """
+    fields = []
+    for group in range(first_group, first_group + _TIME_SHAPE_GROUPS):
+        start, end = match.span(group)
+        fields.append(None if start < 0 else _column_values(chars, start, end))
+    first, second, third, _, frames, hours, minutes, seconds = fields
+
+    if first is not None:
+        # MM:SS / HH:MM:SS, optionally followed by :FF or ;FF
+        if third is None:
+            hours, minutes, seconds = 0, first, second
+        else:
+            hours, minutes, seconds = first, second, third
+
+        separator = match.group(first_group + 3)
+        if separator is not None:
+            return _timecode_frames_vector(hours, minutes, seconds, frames, framerate, separator == b';')
+
+    # 90 / 1h30m45s / 1m57 ... (fields left out count as 0)
+    total = 0
+    for value, scale in ((hours, 3600), (minutes, 60), (seconds, 1)):
+        if value is not None:
+            total = total + value * scale
+
+    # Seconds * numerator / denominator, rounded half-to-even like parse_time_frames()
+    numerator, denominator, _ = _frame_rate_terms(framerate)
+    quotient, remainder = np.divmod(total * numerator, denominator)
+    quotient += (remainder * 2 > denominator) | ((remainder * 2 == denominator) & (quotient % 2 == 1))
+    return quotient
+
+
+def _column_values(chars, start, end):
+    """Numbers written in ASCII digits in columns start:end of every row"""
+    values = np.zeros(len(chars), dtype=np.int64)
+    for column in range(start, end):
+        values = values * 10 + chars[:, column] - ord("0")
+    return values
+
+
+def _timecode_frames_vector(hours, minutes, seconds, frames, framerate, is_drop_frame):
+    """
+    timecode_to_frames() on int64 arrays of timecode fields
+
+    Args:
+        hours, minutes, seconds, frames: int64 arrays (or ints)
+        framerate: Frame rate (float, string or Fraction)
+        is_drop_frame: bool, or bool array per entry
+
+    Returns:
+        numpy.ndarray: int64 frame numbers
+    """
+    terms = _drop_frame_terms(framerate)
+    timebase = terms[0] if terms else _frame_rate_terms(framerate)[2]
+    total = (hours * 3600 + minutes * 60 + seconds) * timebase + frames
+
+    if terms and np.any(is_drop_frame):
+        dropped = terms[1]
+        total_minutes = hours * 60 + minutes + seconds // 60
+        skipped = dropped * (total_minutes - total_minutes // 10)
+        # Labels drop-frame skips are taken as the next existing frame
+        skipped -= np.where((seconds % 60 == 0) & (frames < dropped) & (total_minutes % 10 != 0),
+                            dropped - frames, 0)
+        total = total - np.where(is_drop_frame, skipped, 0)
+
+    return total
+
+
 def format_seconds(seconds):
     """
     Convert seconds to readable format HH:MM:SS
@@ -241,6 +754,239 @@ def format_seconds(seconds):
         return f"{minutes:02d}:{secs:02d}"
 
 
+def format_frames(frames, framerate=30.0):
+    """
+    Convert a frame number to readable format HH:MM:SS
+
+    Seconds are only computed here, for display, and rounded to the
+    nearest second so "1m57" at 29.97fps shows as 01:57, not 01:56.
+
+    Args:
+        frames: Frame number or frame count
+        framerate: Frame rate (float, string or Fraction)
+
+    Returns:
+        str: Formatted time string
+    """
+    return format_seconds(round(frames_to_seconds(frames, framerate)))
+
+
+def format_seconds_list(seconds):
+    """
+    Convert many times in seconds to format_seconds() strings at once
+
+    Args:
+        seconds: Sequence or array of times in seconds
+
+    Returns:
+        list: "HH:MM:SS" (or "MM:SS" under an hour) strings, in input order
+    """
+    if np is not None:
+        total = np.floor(np.asarray(seconds, dtype=np.float64)).astype(np.int64)
+        minutes, secs = np.divmod(total, 60)
+        hours, minutes = np.divmod(minutes, 60)
+        fields = zip(hours.tolist(), minutes.tolist(), secs.tolist())
+    else:
+        fields = ((int(value // 3600), int((value % 3600) // 60), int(value % 60)) for value in seconds)
+
+    return ["%02d:%02d:%02d" % field if field[0] > 0 else "%02d:%02d" % field[1:] for field in fields]
+
+
+def format_frames_list(frames, framerate=30.0):
+    """
+    Convert many frame numbers to format_frames() strings at once
+
+    The frame rate is looked up once and, with NumPy, seconds are computed
+    for the whole list in one array operation.
+
+    Args:
+        frames: Sequence or array of frame numbers or frame counts
+        framerate: Frame rate (float, string or Fraction)
+
+    Returns:
+        list: "HH:MM:SS" (or "MM:SS") strings, in input order
+    """
+    numerator, denominator, _ = _frame_rate_terms(framerate)
+    if np is not None:
+        seconds = np.rint(np.asarray(frames, dtype=np.int64) * denominator / numerator)
+    else:
+        seconds = [round(frame * denominator / numerator) for frame in frames]
+    return format_seconds_list(seconds)
+
+
+def format_timecode_list(frames, framerate=30.0, drop_frame=False):
+    """
+    Convert many frame numbers to HH:MM:SS:FF (or ;FF) timecode at once
+
+    Uses format_timecode_array() when NumPy is installed, format_timecode()
+    per frame otherwise.
+
+    Args:
+        frames: Sequence or array of frame numbers
+        framerate: Frame rate (float, string or Fraction)
+        drop_frame: As for format_timecode()
+
+    Returns:
+        list: Timecode strings, in input order
+    """
+    if np is not None:
+        return format_timecode_array(frames, framerate, drop_frame)
+    return [format_timecode(frame, framerate, drop_frame) for frame in frames]
+
+
+def format_timecode(frames, framerate=30.0, drop_frame=False):
+    """
+    Convert a frame number to HH:MM:SS:FF (or HH:MM:SS;FF drop-frame) timecode
+
+    The inverse of parse_time_frames() for timecode: frames are counted at
+    the timebase (30 for 29.97), so the result can be read back exactly.
+    Drop-frame labels are computed in O(1) by adding back the frame numbers
+    skipped before the frame.
+
+    Args:
+        frames: Frame number (int)
+        framerate: Frame rate (float, string or Fraction)
+        drop_frame: Write drop-frame timecode; ignored at rates without one
+                    (anything but 29.97/59.94/119.88)
+
+    Returns:
+        str: Timecode, e.g. "01:00:00:00" or "01:00:00;00"
+    """
+    frames = int(frames)
+    terms = _drop_frame_terms(framerate) if drop_frame else None
+
+    if terms:
+        timebase, dropped, frames_per_minute, frames_per_10_minutes = terms
+        tens, rest = divmod(frames, frames_per_10_minutes)
+        frames += dropped * 9 * tens
+        if rest > dropped:
+            frames += dropped * ((rest - dropped) // frames_per_minute)
+        template = "%02d:%02d:%02d;%02d"
+    else:
+        timebase = _frame_rate_terms(framerate)[2]
+        template = "%02d:%02d:%02d:%02d"
+
+    seconds, frame = divmod(frames, timebase)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return template % (hours, minutes, seconds, frame)
+
+
+def timecode_frames_array(timecodes, framerate=30.0):
+    """
+    Convert many HH:MM:SS:FF / HH:MM:SS;FF timecodes to frame numbers at once
+
+    The fixed-width strings are decoded as one byte array and converted with
+    array arithmetic (drop-frame per entry, by its ";" separator), which
+    makes EDL-sized lists of timecodes much cheaper than parse_time_frames()
+    per string.
+
+    Args:
+        timecodes: List (or array) of 11-character timecode strings
+        framerate: Frame rate (float, string or Fraction, default: 30.0)
+
+    Returns:
+        tuple: (frames, error_mask) - frames is an int64 array in input
+               order; entries flagged in the bool error_mask hold 0
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("NumPy is required for timecode_frames_array()")
+
+    count = len(timecodes)
+    if not count:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+    if _frame_rate_terms(framerate)[2] > 99:
+        # Three-digit frame fields (119.88): not fixed-width, parse one by one
+        parsed = [parse_time_frames(timecode, framerate) for timecode in timecodes]
+        error_mask = np.array([frame is None for frame in parsed], dtype=bool)
+        return np.array([frame or 0 for frame in parsed], dtype=np.int64), error_mask
+
+    # Anything that is not 11 ASCII characters becomes an invalid placeholder
+    data = "".join(
+        timecode if len(timecode) == 11 and timecode.isascii() else "??:??:??:??"
+        for timecode in timecodes
+    ).encode("ascii")
+    chars = np.frombuffer(data, dtype=np.uint8).reshape(count, 11)
+
+    digits = chars[:, [0, 1, 3, 4, 6, 7, 9, 10]].astype(np.int64) - ord("0")
+    separator = chars[:, 8]
+    is_drop_frame = separator == ord(";")
+    error_mask = (
+        ((digits < 0) | (digits > 9)).any(axis=1)
+        | (chars[:, 2] != ord(":")) | (chars[:, 5] != ord(":"))
+        | ~(is_drop_frame | (separator == ord(":")))
+    )
+
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 2] * 10 + digits[:, 3]
+    seconds = digits[:, 4] * 10 + digits[:, 5]
+    frame = digits[:, 6] * 10 + digits[:, 7]
+
+    frames = _timecode_frames_vector(hours, minutes, seconds, frame, framerate, is_drop_frame)
+    frames[error_mask] = 0
+    return frames, error_mask
+
+
+def format_timecode_array(frames, framerate=30.0, drop_frame=False):
+    """
+    Convert many frame numbers to timecode strings at once
+
+    Same results as format_timecode() for every entry, but the fields (and
+    the drop-frame adjustment) are computed with array arithmetic and the
+    strings are assembled in one byte buffer.
+
+    Args:
+        frames: Sequence or array of frame numbers
+        framerate: Frame rate (float, string or Fraction)
+        drop_frame: As for format_timecode()
+
+    Returns:
+        list: Timecode strings, in input order
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("NumPy is required for format_timecode_array()")
+
+    numbers = np.asarray(frames, dtype=np.int64)
+    frames = numbers
+    terms = _drop_frame_terms(framerate) if drop_frame else None
+
+    if terms:
+        timebase, dropped, frames_per_minute, frames_per_10_minutes = terms
+        tens, rest = np.divmod(frames, frames_per_10_minutes)
+        frames = frames + dropped * 9 * tens + np.where(
+            rest > dropped, dropped * ((rest - dropped) // frames_per_minute), 0
+        )
+        separator = ord(";")
+    else:
+        timebase = _frame_rate_terms(framerate)[2]
+        separator = ord(":")
+
+    seconds, frame = np.divmod(frames, timebase)
+    minutes, seconds = np.divmod(seconds, 60)
+    hours, minutes = np.divmod(minutes, 60)
+
+    if len(frames) and (hours.max() > 99 or frames.min() < 0 or timebase > 99):
+        # Rare: fields wider than two digits, let the scalar formatter handle every entry
+        return [format_timecode(frame_number, framerate, drop_frame) for frame_number in numbers.tolist()]
+
+    chars = np.empty((len(frames), 11), dtype=np.uint8)
+    chars[:, [2, 5]] = ord(":")
+    chars[:, 8] = separator
+    for column, field in ((0, hours), (3, minutes), (6, seconds), (9, frame)):
+        chars[:, column] = field // 10 + ord("0")
+        chars[:, column + 1] = field % 10 + ord("0")
+
+    text = chars.tobytes().decode("ascii")
+    return [text[start:start + 11] for start in range(0, len(text), 11)]
+
+
 # Testing
 if __name__ == "__main__":
     print("Testing time parser:")
@@ -297,3 +1043,43 @@ if __name__ == "__main__":
             print(f"[OK] '{test}' -> {format_seconds(start)} to {format_seconds(end)}")
         else:
             print(f"[FAIL] '{test}' -> FAILED")
+
+    # Test streaming parser
+    print("\n4. Streaming from file (30fps):")
+    import tempfile
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as tmp:
+        tmp.write("1m57-2m08\r\n\r\nnot a range\r\n00:01:00:15-2m00\r\n")
+
+    try:
+        for parsed, error in parse_timecodes_iter(tmp.name, 30.0):
+            if parsed:
+                start, end = parsed
+                print(f"[OK] frames {start} to {end} ({format_frames(start, 30.0)} to {format_frames(end, 30.0)})")
+            else:
+                print(f"[OK] reported: {error}")
+    finally:
+        os.remove(tmp.name)
+
+    # Test integer frame parsing
+    print("\n5. Integer frames (exact 30000/1001 for 29.97fps):")
+    for test in ["1m57-2m08", "9h59m00-10h00m00", "00:01:30:15-00:02:00:20"]:
+        result = parse_time_range_frames(test, 29.97)
+        if result:
+            start, end = result
+            print(f"[OK] '{test}' -> frames {start} to {end} ({format_frames(start, 29.97)} to {format_frames(end, 29.97)})")
+        else:
+            print(f"[FAIL] '{test}' -> FAILED")
+
+    # Test drop-frame timecode
+    print("\n6. Drop-frame timecode (29.97fps skips ;00 and ;01 each minute but every tenth):")
+    for test in ["00:00:59;29", "00:01:00;02", "00:10:00;00", "01:00:00;00"]:
+        frame = parse_time_frames(test, 29.97)
+        back = format_timecode(frame, 29.97, drop_frame=True)
+        print(f"[{'OK' if back == test else 'FAIL'}] '{test}' -> frame {frame} -> '{back}' "
+              f"(non-drop '{test.replace(';', ':')}' is frame {parse_time_frames(test.replace(';', ':'), 29.97)})")
+
+    if np is not None:
+        labels = format_timecode_array([0, 1799, 1800, 17982, 107892], 29.97, drop_frame=True)
+        frames, error_mask = timecode_frames_array(labels, 29.97)
+        print(f"[OK] arrays: {labels} -> {frames.tolist()}")
@@ -0,0 +1,261 @@
+"""
+Timeline Export for Clip Assassin Resolve
+Writes a cut plan as a CMX3600 EDL or an FCPXML document
+
+Resolve builds a whole timeline from such a file with one
+MediaPool.ImportTimelineFromFile() call, instead of one AppendToTimeline()
+call per chunk of segments. Both writers stream: events are generated and
+written one at a time, so 100k-event plans need no more memory than the plan.
+"""
+
+import os
+from math import gcd
+from xml.sax.saxutils import escape, quoteattr
+
+from time_parser import format_timecode, has_drop_frame, timecode_to_frames
+
+# Record timecode of the first event (Resolve's default timeline start)
+RECORD_START_SECONDS = 3600
+
+# Timeline file formats, by ImportTimelineFromFile() file extension
+EXPORT_FORMATS = ("edl", "fcpxml")
+
+FCPXML_VERSION = "1.8"
+
+
+def iter_edl_lines(plan, start_frame=0, reel="AX", drop_frame=False):
+    """
+    Generate a CMX3600 EDL for a cut plan, line by line
+
+    Source timecode is start_frame + segment frame; record timecode starts
+    at 01:00:00:00. Timecode is counted like parse_time_frames(): at the
+    timebase (30 for 29.97), drop-frame when drop_frame is set and the rate
+    has drop-frame timecode. Event numbers grow past three digits for plans
+    with more than 999 segments.
+
+    Args:
+        plan: CutPlan
+        start_frame: Source timecode of the clip's first frame, as a frame
+                     number (ClipMetadata.start_frame)
+        reel: Reel name written in every event
+        drop_frame: Write drop-frame timecode (ClipMetadata.drop_frame)
+
+    Yields:
+        str: EDL lines, each ending in a newline
+    """
+    # A float is much cheaper to look up in the frame rate caches than a Fraction
+    rate = float(plan.fps)
+    drop_frame = bool(drop_frame) and has_drop_frame(rate)
+    record = timecode_to_frames(0, 0, RECORD_START_SECONDS, 0, rate, drop_frame)
+
+    yield f"TITLE: {plan.timeline_name}\n"
+    yield "FCM: DROP FRAME\n" if drop_frame else "FCM: NON-DROP FRAME\n"
+    yield "\n"
+
+    for number, (in_frame, out_frame) in enumerate(plan.segments, 1):
+        length = out_frame - in_frame
+        yield (f"{number:03d}  {reel:<8} V     C        "
+               f"{format_timecode(start_frame + in_frame, rate, drop_frame)} "
+               f"{format_timecode(start_frame + out_frame, rate, drop_frame)} "
+               f"{format_timecode(record, rate, drop_frame)} {format_timecode(record + length, rate, drop_frame)}\n")
+        yield f"* FROM CLIP NAME: {plan.clip}\n"
+        yield "\n"
+        record += length
+
+
+def iter_fcpxml_lines(plan, file_path="", start_frame=0, resolution="", drop_frame=False):
+    """
+    Generate an FCPXML document for a cut plan, line by line
+
+    All times are exact rational seconds (frames * frameDuration), so the
+    document carries the plan's frames without rounding.
+
+    Args:
+        plan: CutPlan
+        file_path: Media file of the source clip (lets Resolve relink it)
+        start_frame: Source timecode of the clip's first frame, as a frame
+                     number (ClipMetadata.start_frame)
+        resolution: e.g. "1920x1080" (optional)
+        drop_frame: Drop-frame sequence timecode (ClipMetadata.drop_frame)
+
+    Yields:
+        str: XML lines, each ending in a newline
+    """
+    fps = plan.fps
+    frame_duration = _seconds(1, fps)
+    drop_frame = bool(drop_frame) and has_drop_frame(float(fps))
+    record = timecode_to_frames(0, 0, RECORD_START_SECONDS, 0, float(fps), drop_frame)
+    size = ""
+    if "x" in resolution:
+        width, _, height = resolution.partition("x")
+        if width.strip().isdigit() and height.strip().isdigit():
+            size = f' width="{width.strip()}" height="{height.strip()}"'
+
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield "<!DOCTYPE fcpxml>\n"
+    yield f'<fcpxml version="{FCPXML_VERSION}">\n'
+    yield "  <resources>\n"
+    yield f'    <format id="r1" frameDuration="{frame_duration}"{size}/>\n'
+    yield (f'    <asset id="r2" name={quoteattr(plan.clip)} start="{_seconds(start_frame, fps)}" '
+           f'duration="{_seconds(plan.clip_frames, fps)}" hasVideo="1" hasAudio="1" format="r1">\n')
+    if file_path:
+        yield f'      <media-rep kind="original-media" src={quoteattr(_file_url(file_path))}/>\n'
+    yield "    </asset>\n"
+    yield "  </resources>\n"
+    yield "  <library>\n"
+    yield '    <event name="Clip Assassin">\n'
+    yield f"      <project name={quoteattr(plan.timeline_name)}>\n"
+    yield (f'        <sequence format="r1" tcStart="{_seconds(record, fps)}" '
+           f'tcFormat="{"DF" if drop_frame else "NDF"}" duration="{_seconds(plan.total_frames, fps)}">\n')
+    yield "          <spine>\n"
+
+    name = escape(plan.clip, {'"': "&quot;"})
+    offset = record
+    for in_frame, out_frame in plan.segments:
+        length = out_frame - in_frame
+        yield (f'            <asset-clip ref="r2" name="{name}" offset="{_seconds(offset, fps)}" '
+               f'start="{_seconds(start_frame + in_frame, fps)}" duration="{_seconds(length, fps)}"/>\n')
+        offset += length
+
+    yield "          </spine>\n"
+    yield "        </sequence>\n"
+    yield "      </project>\n"
+    yield "    </event>\n"
+    yield "  </library>\n"
+    yield "</fcpxml>\n"
+
+
+def write_timeline_file(plan, path, export_format=None, metadata=None):
+    """
+    Write a cut plan as a timeline file
+
+    Args:
+        plan: CutPlan
+        path: Output file
+        export_format: "edl" or "fcpxml" (default: from the file extension)
+        metadata: Optional ClipMetadata of the source clip, for its start
+                  timecode (and whether it is drop-frame), file path and
+                  resolution
+
+    Returns:
+        str: path
+
+    Raises:
+        ValueError: If the format is not one of EXPORT_FORMATS
+    """
+    export_format = (export_format or os.path.splitext(path)[1].lstrip(".")).lower()
+    start_frame = getattr(metadata, "start_frame", 0)
+    drop_frame = getattr(metadata, "drop_frame", False)
+
+    if export_format == "edl":
+        lines = iter_edl_lines(plan, start_frame, drop_frame=drop_frame)
+    elif export_format == "fcpxml":
+        lines = iter_fcpxml_lines(
+            plan, getattr(metadata, "file_path", ""), start_frame, getattr(metadata, "resolution", ""), drop_frame
+        )
+    else:
+        raise ValueError(f"Unknown timeline format: {export_format!r} (use one of {', '.join(EXPORT_FORMATS)})")
+
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.writelines(lines)
+
+    return path
+
+
+def _seconds(frames, fps):
+    """FCPXML time for a frame count: rational seconds like "1001/30000s" """
+    # Integer arithmetic: frames / fps = frames * denominator / numerator
+    numerator = int(frames * fps.denominator)
+    denominator = fps.numerator
+    divisor = gcd(numerator, denominator)
+    if divisor == denominator:
+        return f"{numerator // divisor}s"
+    return f"{numerator // divisor}/{denominator // divisor}s"
+
+
+def _file_url(path):
+    """file:// URL for a local path (Windows drive letters included)"""
+    path = path.replace("\\", "/")
+    if not path.startswith("/"):
+        path = "/" + path
+    return "file://" + "".join(
+        char if char.isalnum() or char in "/:._-~" else "%{:02X}".format(ord(char)) if ord(char) < 128
+        else "".join("%{:02X}".format(byte) for byte in char.encode("utf-8"))
+        for char in path
+    )
+
+
+# Testing
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+    from fractions import Fraction
+    import xml.etree.ElementTree as ET
+
+    from cut_plan import plan_cut
+    from media_pool import ClipMetadata
+    from time_parser import parse_time_frames
+
+    print("Testing timeline export:")
+    print("-" * 50)
+
+    def read_edl(text, start_frame, fps):
+        """Source ranges of all events, relative to the clip start"""
+        events = []
+        for line in text.splitlines():
+            fields = line.split()
+            if len(fields) == 8 and fields[0].isdigit():
+                events.append((parse_time_frames(fields[4], fps) - start_frame,
+                               parse_time_frames(fields[5], fps) - start_frame))
+        return events
+
+    def read_fcpxml(text, start_frame, fps):
+        """Source ranges of all asset-clips, relative to the clip start"""
+        events = []
+        for clip in ET.fromstring(text).iter("asset-clip"):
+            start = Fraction(clip.get("start")[:-1]) * fps
+            duration = Fraction(clip.get("duration")[:-1]) * fps
+            assert start.denominator == 1 and duration.denominator == 1
+            events.append((int(start) - start_frame, int(start + duration) - start_frame))
+        return events
+
+    ranges = "\n".join(["1m57-2m08", "3m10-3m22", "3m20-3m30", "00:04:27:15-00:04:43:02", "5m28-5m36"])
+    for fps, start_tc in ((Fraction(30000, 1001), "01:00:00:00"), (Fraction(24), "01:00:00:00"),
+                          (Fraction(60000, 1001), "01:00:00:00"), (Fraction(30000, 1001), "01:00:00;00")):
+        start_frame = parse_time_frames(start_tc, fps)  # Source clip starting at 01:00:00
+        drop_frame = ";" in start_tc
+        metadata = ClipMetadata(None, "Interview & B-roll.mov", fps, 20 * 60 * round(fps),
+                                "1920x1080", "H.264", "C:\\Media\\Interview & B-roll.mov", start_frame, drop_frame)
+
+        for reverse_mode in (False, True):
+            plan = plan_cut(ranges, metadata, reverse_mode)
+            edl = "".join(iter_edl_lines(plan, start_frame, drop_frame=drop_frame))
+            fcpxml = "".join(iter_fcpxml_lines(plan, metadata.file_path, start_frame, metadata.resolution, drop_frame))
+
+            edl_ok = read_edl(edl, start_frame, fps) == plan.segments
+            xml_ok = read_fcpxml(fcpxml, start_frame, fps) == plan.segments
+            mode = "REVERSE" if reverse_mode else "normal "
+            print(f"[{'OK' if edl_ok and xml_ok else 'FAIL'}] {float(fps):6.3f} fps {'DF ' if drop_frame else 'NDF'} {mode}: "
+                  f"{len(plan.segments)} segments, EDL round trip {edl_ok}, FCPXML round trip {xml_ok}")
+
+    print()
+    print(edl.split("\n\n", 2)[1])
+
+    # 100k events: streamed, so memory stays flat
+    def drain(lines):
+        """Consume lines like a file write would; returns the byte count"""
+        return sum(len(line) for line in lines)
+
+    metadata = ClipMetadata(None, "Long.mov", Fraction(30000, 1001), 10 ** 8)
+    plan = plan_cut("\n".join(f"{i * 3}-{i * 3 + 2}" for i in range(100000)), metadata)
+    for export_format, iter_lines in (("EDL", iter_edl_lines), ("FCPXML", iter_fcpxml_lines)):
+        start = time.perf_counter()
+        size = drain(iter_lines(plan))
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        drain(iter_lines(plan))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{export_format}: {len(plan.segments):,} events, {size / 1e6:.1f} MB in {elapsed * 1000:.0f} ms, "
+              f"peak extra memory {peak / 1024:.0f} KB")